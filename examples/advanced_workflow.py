@@ -110,7 +110,7 @@ class MarketingCampaignOrchestrator:
         self.brand_style_keeper.set_language_model(brand_language_model)
         
         # 保存品牌模型
-        data_store.save_json(brand_model.dict(), f"brands/{brand_model.id}.json")
+        data_store.save_json(brand_model.model_dump(), f"brands/{brand_model.id}.json")
         
         print(f"品牌分析完成，ID: {brand_model.id}")
         print(f"描述: {brand_model.description}")
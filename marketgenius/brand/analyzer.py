@@ -5,7 +5,12 @@
 Brand analyzer module for processing and extracting brand voice characteristics.
 """
 
+import os
 import re
+import atexit
+import functools
+import threading
+import multiprocessing
 import nltk
 import numpy as np
 from collections import Counter
@@ -25,35 +30,103 @@ try:
 except LookupError:
     nltk.download('stopwords')
 
+# URLs, email addresses, punctuation and numbers, removed in a single scan
+_NOISE_RE = re.compile(r'https?://\S+|www\.\S+|\S+@\S+|[^\w\s]|\d+')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Simple wordlists for tone analysis - would use more sophisticated NLP in production
+_FORMAL_WORDS = frozenset({'therefore', 'consequently', 'furthermore', 'moreover', 'thus', 'hence'})
+_CASUAL_WORDS = frozenset({'awesome', 'cool', 'yeah', 'amazing', 'wow', 'super'})
+_TECHNICAL_WORDS = frozenset({'algorithm', 'interface', 'system', 'process', 'module', 'functionality'})
+_EMOTIONAL_WORDS = frozenset({'love', 'hate', 'excited', 'thrilled', 'sad', 'happy', 'passionate'})
+
+# Corpus size above which sentence/word tokenization is spread across processes
+PARALLEL_TOKENIZE_THRESHOLD = 32
+
+# Long-lived tokenization workers, started on first use and shared by all analyzers
+_pool = None
+_pool_pid = None
+_pool_lock = threading.Lock()
+
+
+# Lightweight tokenizers used instead of NLTK Punkt on the hot path
+_SENT_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+_WORD_RE = re.compile(r'[^\W\d_]+')
+
+
+@functools.lru_cache(maxsize=None)
+def _nltk_tokenizers():
+    """Load the Punkt sentence tokenizer and word tokenizer once per process."""
+    return (
+        nltk.data.load('tokenizers/punkt/english.pickle'),
+        nltk.tokenize.NLTKWordTokenizer()
+    )
+
+
+def _tokenize_one(text, use_nltk=False):
+    """Tokenize a single document into a list of word-tokenized sentences."""
+    # Both paths drop sentences without words, e.g. after trailing punctuation plus whitespace,
+    # so sentence counts do not depend on the tokenizer choice
+    if use_nltk:
+        sentence_tokenizer, word_tokenizer = _nltk_tokenizers()
+        return [
+            words for sentence in sentence_tokenizer.tokenize(text)
+            if (words := word_tokenizer.tokenize(sentence)) and any(_WORD_RE.search(word) for word in words)
+        ]
+    return [words for sentence in _SENT_SPLIT_RE.split(text.strip()) if (words := _WORD_RE.findall(sentence))]
+
+
+def _get_pool(processes):
+    """Return the shared tokenization pool, starting it in this process if needed."""
+    global _pool, _pool_pid
+    with _pool_lock:
+        # A pool inherited across fork() cannot be used by the child
+        if _pool is None or _pool_pid != os.getpid():
+            _pool = multiprocessing.Pool(processes=processes)
+            _pool_pid = os.getpid()
+        return _pool
+
+
+@atexit.register
+def _close_pool(terminate=False):
+    """Shut down the shared tokenization pool, if this process started one."""
+    global _pool, _pool_pid
+    with _pool_lock:
+        if _pool is not None and _pool_pid == os.getpid():
+            if terminate:
+                _pool.terminate()
+            else:
+                _pool.close()
+            _pool.join()
+        _pool = None
+        _pool_pid = None
+
 
 class BrandAnalyzer:
     """Analyzes brand content to extract voice characteristics."""
     
-    def __init__(self):
-        """Initialize the brand analyzer."""
+    def __init__(self, use_nltk_tokenizer=False):
+        """
+        Initialize the brand analyzer.
+        
+        Args:
+            use_nltk_tokenizer: Use NLTK Punkt/Treebank tokenizers instead of the regex ones
+        """
+        self.use_nltk_tokenizer = use_nltk_tokenizer
         self.stopwords = set(nltk.corpus.stopwords.words('english'))
         self.tfidf = TfidfVectorizer(
             max_features=1000,
             stop_words='english',
-            ngram_range=(1, 3)
+            ngram_range=(1, 3),
+            dtype=np.float32
         )
         
     def preprocess_text(self, text):
         """Preprocess text for analysis."""
-        # Convert to lowercase
-        text = text.lower()
-        # Remove URLs
-        text = re.sub(r'https?://\S+|www\.\S+', '', text)
-        # Remove email addresses
-        text = re.sub(r'\S+@\S+', '', text)
-        # Remove punctuation
-        text = re.sub(r'[^\w\s]', '', text)
-        # Remove numbers
-        text = re.sub(r'\d+', '', text)
+        # Lowercase and remove URLs, emails, punctuation and numbers in one pass
+        text = _NOISE_RE.sub('', text.lower())
         # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text).strip()
-        
-        return text
+        return _WHITESPACE_RE.sub(' ', text).strip()
     
     def extract_key_phrases(self, texts, top_n=20):
         """Extract key phrases from a collection of texts."""
@@ -69,11 +142,13 @@ class BrandAnalyzer:
             tfidf_matrix = self.tfidf.fit_transform(processed_texts)
             feature_names = self.tfidf.get_feature_names_out()
             
-            # Sum TF-IDF scores across all documents
-            tfidf_sum = np.sum(tfidf_matrix.toarray(), axis=0)
+            # Sum TF-IDF scores across all documents without densifying the matrix
+            tfidf_sum = np.asarray(tfidf_matrix.sum(axis=0)).ravel()
             
             # Get top phrases
-            top_indices = tfidf_sum.argsort()[-top_n:][::-1]
+            top_n = min(top_n, tfidf_sum.size)
+            top_indices = np.argpartition(tfidf_sum, -top_n)[-top_n:] if top_n else []
+            top_indices = sorted(top_indices, key=lambda i: tfidf_sum[i], reverse=True)
             top_phrases = [feature_names[i] for i in top_indices]
             
             logger.info(f"Extracted {len(top_phrases)} key phrases from content")
@@ -85,12 +160,6 @@ class BrandAnalyzer:
     
     def analyze_tone(self, texts):
         """Analyze the tone of the brand's content."""
-        # Simple wordlists for tone analysis - would use more sophisticated NLP in production
-        formal_words = set(['therefore', 'consequently', 'furthermore', 'moreover', 'thus', 'hence'])
-        casual_words = set(['awesome', 'cool', 'yeah', 'amazing', 'wow', 'super'])
-        technical_words = set(['algorithm', 'interface', 'system', 'process', 'module', 'functionality'])
-        emotional_words = set(['love', 'hate', 'excited', 'thrilled', 'sad', 'happy', 'passionate'])
-        
         formal_count = 0
         casual_count = 0
         technical_count = 0
@@ -99,13 +168,14 @@ class BrandAnalyzer:
         
         for text in texts:
             text = self.preprocess_text(text)
-            words = nltk.word_tokenize(text)
+            # Punctuation is already stripped, so whitespace splitting is enough
+            words = text.split()
             words = [word for word in words if word not in self.stopwords]
             
-            formal_count += sum(1 for word in words if word in formal_words)
-            casual_count += sum(1 for word in words if word in casual_words)
-            technical_count += sum(1 for word in words if word in technical_words)
-            emotional_count += sum(1 for word in words if word in emotional_words)
+            formal_count += sum(1 for word in words if word in _FORMAL_WORDS)
+            casual_count += sum(1 for word in words if word in _CASUAL_WORDS)
+            technical_count += sum(1 for word in words if word in _TECHNICAL_WORDS)
+            emotional_count += sum(1 for word in words if word in _EMOTIONAL_WORDS)
             total_words += len(words)
         
         # Avoid division by zero
@@ -155,23 +225,22 @@ class BrandAnalyzer:
         # Analyze tone
         tone = self.analyze_tone(texts)
         
-        # Analyze sentence structure
-        sentence_lengths = []
-        all_words = []
+        # Analyze sentence structure with running counters
+        unique_words = set()
+        total_word_count = 0
+        sentence_count = 0
         
-        for text in texts:
-            sentences = nltk.sent_tokenize(text)
-            for sentence in sentences:
-                words = nltk.word_tokenize(sentence)
+        for sentences in self._tokenize_texts(texts):
+            for words in sentences:
                 words = [word for word in words if word.isalpha()]
-                sentence_lengths.append(len(words))
-                all_words.extend(words)
+                unique_words.update(words)
+                total_word_count += len(words)
+                sentence_count += 1
         
-        average_sentence_length = sum(sentence_lengths) / len(sentence_lengths) if sentence_lengths else 0
+        average_sentence_length = total_word_count / sentence_count if sentence_count else 0
         
         # Calculate vocabulary richness (type-token ratio)
-        unique_words = set(all_words)
-        vocabulary_richness = len(unique_words) / len(all_words) if all_words else 0
+        vocabulary_richness = len(unique_words) / total_word_count if total_word_count else 0
         
         brand_voice = {
             "key_phrases": key_phrases,
@@ -181,4 +250,28 @@ class BrandAnalyzer:
         }
         
         logger.info(f"Brand voice analysis completed")
-        return brand_voice
\ No newline at end of file
+        return brand_voice
+    
+    def _tokenize_texts(self, texts):
+        """
+        Tokenize texts into sentences of words, in parallel for large corpora.
+        
+        Args:
+            texts: List of raw text documents
+            
+        Returns:
+            List (per document) of lists (per sentence) of word tokens
+        """
+        tokenize = functools.partial(_tokenize_one, use_nltk=self.use_nltk_tokenizer)
+        ncores = os.cpu_count() or 1
+        if len(texts) <= PARALLEL_TOKENIZE_THRESHOLD or ncores < 2:
+            return [tokenize(text) for text in texts]
+        
+        chunksize = max(1, len(texts) // (4 * ncores))
+        try:
+            return _get_pool(ncores - 1).map(tokenize, texts, chunksize=chunksize)
+        except Exception as e:
+            logger.warning(f"Parallel tokenization failed, falling back to serial: {e}")
+            # Discard the pool so the next call starts fresh workers
+            _close_pool(terminate=True)
+            return [tokenize(text) for text in texts]
\ No newline at end of file
@@ -7,13 +7,52 @@ Brand voice modeler for capturing and representing a brand's unique voice.
 
 import os
 import json
+import hashlib
 import numpy as np
 from marketgenius.utils.logger import get_logger
+from marketgenius.utils.helpers import LRUCache
 from marketgenius.brand.analyzer import BrandAnalyzer
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 logger = get_logger(__name__)
 
 
+def _dump_model(model):
+    """Serialize a brand model to UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(model, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(model, ensure_ascii=False).encode('utf-8')
+
+
+def _atomic_write(path, data):
+    """Write bytes to path via a temporary file so readers never see a partial file."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb', buffering=1024 * 1024) as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def _content_hashes(content_items):
+    """Hash each content item so already-analyzed items can be recognized."""
+    return [
+        hashlib.sha1(str(item).encode('utf-8'), usedforsecurity=False).hexdigest()
+        for item in content_items
+    ]
+
+
+def _load_model(data):
+    """Deserialize a brand model from JSON bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+
 class BrandLanguageModel:
     """Model for capturing and representing a brand's unique voice."""
     
@@ -26,13 +65,21 @@ class BrandLanguageModel:
         """
         self.config = config or {}
         self.models_dir = self.config.get("models_dir", "models/brands")
-        self.analyzer = BrandAnalyzer()
+        self.analyzer = BrandAnalyzer(
+            use_nltk_tokenizer=self.config.get("use_nltk_tokenizer", False)
+        )
         
         # Ensure models directory exists
         os.makedirs(self.models_dir, exist_ok=True)
         
-        # Cache for brand models
-        self.brand_models = {}
+        # Bounded caches for full brand models and their voice parameters
+        cache_size = self.config.get("cache_size", 128)
+        self.brand_models = LRUCache(maxsize=cache_size)
+        self.voice_parameters = LRUCache(maxsize=cache_size)
+        
+        # Incremented whenever a brand model is created or updated, so
+        # consumers caching voice parameters can detect stale entries
+        self.model_version = 0
     
     def create_brand_model(self, brand_name, content_items):
         """
@@ -48,13 +95,14 @@ class BrandLanguageModel:
         logger.info(f"Creating brand model for: {brand_name}")
         
         # Analyze brand voice
-        brand_voice = self.analyzer.analyze_brand_voice(content_items)
+        brand_voice = self._derive_voice_summary(self.analyzer.analyze_brand_voice(content_items))
         
         # Create the model
         model = {
             "brand_name": brand_name,
             "voice_parameters": brand_voice,
-            "content_examples": content_items[:5] if len(content_items) > 5 else content_items
+            "content_examples": content_items[:5] if len(content_items) > 5 else content_items,
+            "content_hashes": _content_hashes(content_items)
         }
         
         # Save the model
@@ -62,6 +110,8 @@ class BrandLanguageModel:
         
         # Cache the model
         self.brand_models[brand_name] = model
+        self.voice_parameters[brand_name] = brand_voice
+        self.model_version += 1
         
         logger.info(f"Brand model created for: {brand_name}")
         return model
@@ -84,6 +134,16 @@ class BrandLanguageModel:
             logger.warning(f"No existing model found for {brand_name}. Creating new model.")
             return self.create_brand_model(brand_name, new_content_items)
         
+        if not new_content_items:
+            logger.info(f"No new content for {brand_name}; brand model unchanged")
+            return model
+        
+        # Skip re-analysis when every new item was part of the last analyzed corpus
+        analyzed_hashes = set(model.get("content_hashes", ()))
+        if analyzed_hashes and analyzed_hashes.issuperset(_content_hashes(new_content_items)):
+            logger.info(f"Content already analyzed for {brand_name}; brand model unchanged")
+            return model
+        
         # Get existing content examples
         existing_examples = model.get("content_examples", [])
         
@@ -91,17 +151,20 @@ class BrandLanguageModel:
         all_content = existing_examples + new_content_items
         
         # Re-analyze brand voice
-        brand_voice = self.analyzer.analyze_brand_voice(all_content)
+        brand_voice = self._derive_voice_summary(self.analyzer.analyze_brand_voice(all_content))
         
         # Update the model
         model["voice_parameters"] = brand_voice
         model["content_examples"] = all_content[:10]  # Keep up to 10 examples
+        model["content_hashes"] = _content_hashes(all_content)
         
         # Save the updated model
         self._save_brand_model(brand_name, model)
         
         # Update cache
         self.brand_models[brand_name] = model
+        self.voice_parameters[brand_name] = brand_voice
+        self.model_version += 1
         
         logger.info(f"Brand model updated for: {brand_name}")
         return model
@@ -121,12 +184,12 @@ class BrandLanguageModel:
             return self.brand_models[brand_name]
         
         # Try to load from file
-        model_path = os.path.join(self.models_dir, f"{self._sanitize_filename(brand_name)}.json")
+        model_path = self._model_path(brand_name)
         
         if os.path.exists(model_path):
             try:
-                with open(model_path, 'r', encoding='utf-8') as f:
-                    model = json.load(f)
+                with open(model_path, 'rb') as f:
+                    model = _load_model(f.read())
                     
                 # Cache the model
                 self.brand_models[brand_name] = model
@@ -150,6 +213,23 @@ class BrandLanguageModel:
         Returns:
             Brand voice parameters or empty dict if not found
         """
+        if brand_name in self.voice_parameters:
+            return self.voice_parameters[brand_name]
+        
+        if brand_name in self.brand_models:
+            return self.brand_models[brand_name].get("voice_parameters", {})
+        
+        # Prefer the lightweight sidecar file over the full model
+        params_path = self._model_path(brand_name, ".params.json")
+        if os.path.exists(params_path):
+            try:
+                with open(params_path, 'rb') as f:
+                    voice_params = _load_model(f.read())
+                self.voice_parameters[brand_name] = voice_params
+                return voice_params
+            except Exception as e:
+                logger.error(f"Error loading voice parameters for {brand_name}: {e}")
+        
         model = self.get_brand_model(brand_name)
         if model:
             return model.get("voice_parameters", {})
@@ -166,18 +246,20 @@ class BrandLanguageModel:
         Returns:
             Enhanced prompt with brand voice instructions
         """
-        voice_params = self.get_brand_voice_parameters(brand_name)
+        model = self.get_brand_model(brand_name)
+        voice_params = model.get("voice_parameters", {}) if model else {}
         
         if not voice_params:
             return base_prompt
         
+        # Models saved before the summary fields existed are derived on the fly
+        if "dominant_tone" not in voice_params:
+            voice_params = self._derive_voice_summary(dict(voice_params))
+        
         # Extract key parameters
         key_phrases = voice_params.get("key_phrases", [])
-        tone = voice_params.get("tone", {})
-        avg_sentence_length = voice_params.get("average_sentence_length", 0)
-        
-        # Determine dominant tone
-        dominant_tone = max(tone.items(), key=lambda x: x[1])[0] if tone else None
+        dominant_tone = voice_params.get("dominant_tone")
+        length_bucket = voice_params.get("length_bucket")
         
         # Create brand voice instructions
         brand_instructions = "Write in the following brand voice:\n"
@@ -185,20 +267,19 @@ class BrandLanguageModel:
         if dominant_tone:
             brand_instructions += f"- Use a {dominant_tone} tone\n"
             
-        if avg_sentence_length > 0:
-            if avg_sentence_length < 10:
-                brand_instructions += "- Use short, concise sentences\n"
-            elif avg_sentence_length > 20:
-                brand_instructions += "- Use longer, more detailed sentences\n"
+        if length_bucket == "short":
+            brand_instructions += "- Use short, concise sentences\n"
+        elif length_bucket == "long":
+            brand_instructions += "- Use longer, more detailed sentences\n"
         
         if key_phrases:
             phrases_to_use = ", ".join(key_phrases[:5])  # Use up to 5 key phrases
             brand_instructions += f"- Try to incorporate these phrases or similar ones: {phrases_to_use}\n"
         
         # Add examples if available
-        model = self.get_brand_model(brand_name)
-        if model and "content_examples" in model and model["content_examples"]:
-            example = model["content_examples"][0]
+        content_examples = model.get("content_examples")
+        if content_examples:
+            example = content_examples[0]
             brand_instructions += f"\nExample of brand voice:\n\"{example}\"\n"
         
         # Combine with base prompt
@@ -206,18 +287,41 @@ class BrandLanguageModel:
         
         return enhanced_prompt
     
+    @staticmethod
+    def _derive_voice_summary(brand_voice):
+        """Precompute the dominant tone and sentence-length bucket used for prompts."""
+        tone = brand_voice.get("tone", {})
+        avg_sentence_length = brand_voice.get("average_sentence_length", 0)
+        
+        brand_voice["dominant_tone"] = max(tone.items(), key=lambda x: x[1])[0] if tone else None
+        
+        if avg_sentence_length <= 0:
+            brand_voice["length_bucket"] = None
+        elif avg_sentence_length < 10:
+            brand_voice["length_bucket"] = "short"
+        elif avg_sentence_length > 20:
+            brand_voice["length_bucket"] = "long"
+        else:
+            brand_voice["length_bucket"] = "medium"
+        
+        return brand_voice
+    
     def _save_brand_model(self, brand_name, model):
-        """Save a brand model to disk."""
-        filename = self._sanitize_filename(brand_name)
-        model_path = os.path.join(self.models_dir, f"{filename}.json")
+        """Save a brand model and its voice parameters sidecar to disk."""
+        model_path = self._model_path(brand_name)
+        params_path = self._model_path(brand_name, ".params.json")
         
         try:
-            with open(model_path, 'w', encoding='utf-8') as f:
-                json.dump(model, f, indent=2, ensure_ascii=False)
+            _atomic_write(model_path, _dump_model(model))
+            _atomic_write(params_path, _dump_model(model.get("voice_parameters", {})))
             logger.info(f"Brand model saved to: {model_path}")
         except Exception as e:
             logger.error(f"Error saving brand model: {e}")
     
+    def _model_path(self, brand_name, suffix=".json"):
+        """Get the on-disk path for a brand's model file."""
+        return os.path.join(self.models_dir, f"{self._sanitize_filename(brand_name)}{suffix}")
+    
     @staticmethod
     def _sanitize_filename(filename):
         """Sanitize a string to be used as a filename."""
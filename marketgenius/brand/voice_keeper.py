@@ -6,18 +6,26 @@ MarketGenius 品牌風格保持器。
 負責確保生成的內容符合品牌風格特徵。
 """
 
+import os
 import re
 import logging
 import string
 import nltk
-from nltk.tokenize import word_tokenize, sent_tokenize
+import numpy as np
 from nltk.corpus import stopwords
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Tuple, Any
 
 from marketgenius.brand.modeler import BrandLanguageModel
+from marketgenius.utils.helpers import LRUCache
 from marketgenius.data.schemas import BrandModel, ContentType
 
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover - 可選加速套件
+    ahocorasick = None
+
 # 確保必要的 NLTK 資源存在
 try:
     nltk.data.find('tokenizers/punkt')
@@ -28,6 +36,96 @@ except LookupError:
 
 logger = logging.getLogger(__name__)
 
+# 一致性檢查結果快取的最大條目數
+CONSISTENCY_CACHE_SIZE = 256
+
+# 停用詞與標點集合只在匯入時建立一次
+_STOPWORDS = frozenset(stopwords.words('english'))
+_PUNCT = frozenset(string.punctuation)
+
+# 預編譯的分詞與分句正則，取代每次呼叫 NLTK 分詞器
+_WORD_RE = re.compile(r"\w+(?:['’]\w+)?", re.UNICODE)
+_SENT_RE = re.compile(r'[^.!?]+[.!?]?')
+
+# 各風格評估使用的標記詞
+_FORMAL_MARKERS = ("furthermore", "therefore", "consequently", "nevertheless", "regarding",
+                   "accordingly", "hereby", "thus", "hence", "wherein")
+_INFORMAL_MARKERS = ("anyway", "well", "you know", "kind of", "sort of", "like", "stuff",
+                     "thing", "okay", "OK", "guys", "pretty", "really", "gonna", "wanna")
+# 收縮形式（如 don't, can't）通常表示非正式
+_CONTRACTIONS = ("n't", "'ll", "'re", "'ve", "'m", "'d")
+_PROFESSIONAL_MARKERS = ("analysis", "research", "data", "methodology", "results",
+                         "implement", "strategy", "objective", "criteria", "evaluation")
+_HUMOR_MARKERS = ("laugh", "funny", "joke", "humor", "witty", "haha", "lol", "smile",
+                  "amusing", "hilarious", "ironic", "sarcastic", "playful", "teasing")
+_EMOTIONAL_WORDS = ("love", "hate", "excited", "thrilled", "amazing", "terrible", "wonderful",
+                    "awful", "delighted", "disappointed", "happy", "sad", "angry", "joyful",
+                    "proud", "ashamed", "grateful", "hurt", "inspired", "devastated")
+_FILLER_WORDS = ("basically", "actually", "literally", "virtually", "definitely",
+                 "certainly", "probably", "essentially", "totally", "completely",
+                 "absolutely", "really", "very", "quite", "somewhat", "rather")
+_INDIRECT_MARKERS = ("perhaps", "maybe", "might", "could", "possibly", "potentially",
+                     "seemingly", "appears to", "it seems", "somewhat", "rather",
+                     "in a sense", "from a certain perspective", "one might say")
+_DIRECT_MARKERS = ("definitely", "absolutely", "certainly", "clearly", "obviously",
+                   "without doubt", "must", "always", "never", "undoubtedly")
+
+# 以子字串比對的標記詞類別（專業與情感詞表皆為單詞，直接以詞元計數）
+_MARKER_GROUPS = {
+    "formal": _FORMAL_MARKERS,
+    "informal": _INFORMAL_MARKERS + _CONTRACTIONS,
+    "humor": _HUMOR_MARKERS,
+    "filler": _FILLER_WORDS,
+    "indirect": _INDIRECT_MARKERS,
+    "direct": _DIRECT_MARKERS,
+}
+
+# 標記詞 -> 所屬類別，掃描時直接累加到類別計數
+_MARKER_CATEGORIES = {
+    marker: tuple(category for category, markers in _MARKER_GROUPS.items() if marker in markers)
+    for markers in _MARKER_GROUPS.values() for marker in markers
+}
+
+_ALL_MARKERS = sorted(_MARKER_CATEGORIES, key=len, reverse=True)
+
+
+def _build_marker_matcher():
+    """建立一次掃描即可找出所有標記詞的比對器。"""
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for marker in _ALL_MARKERS:
+            automaton.add_word(marker, _MARKER_CATEGORIES[marker])
+        automaton.make_automaton()
+        return automaton
+    # 無 pyahocorasick 時，以前瞻交替正則在每個位置比對（允許重疊）
+    return re.compile("(?=(" + "|".join(map(re.escape, _ALL_MARKERS)) + "))")
+
+
+_MARKER_MATCHER = _build_marker_matcher()
+
+# 風格屬性別名 -> (評估方法名稱, 得分低於目標時的建議, 得分高於目標時的建議)
+_FORMALITY_ENTRY = ("_evaluate_formality", "使用更正式的用語和句式", "略微減少正式程度")
+_PROFESSIONALISM_ENTRY = ("_evaluate_professionalism", "增加專業術語和行業詞彙", "簡化一些專業術語")
+_HUMOR_ENTRY = ("_evaluate_humor", "增加一些輕鬆、幽默的表達", "減少幽默元素，增加正式內容")
+_EMOTION_ENTRY = ("_evaluate_emotion", "使用更具情感的語言和表達", "使用更客觀、中性的語言")
+_CONCISENESS_ENTRY = ("_evaluate_conciseness", "精簡內容，刪除冗餘表達", "添加更多細節和描述")
+_DIRECTNESS_ENTRY = ("_evaluate_directness", "更直接地表達主要觀點", "使用更委婉、間接的表達方式")
+
+_ATTR_DISPATCH = {
+    "正式": _FORMALITY_ENTRY,
+    "formal": _FORMALITY_ENTRY,
+    "專業": _PROFESSIONALISM_ENTRY,
+    "professional": _PROFESSIONALISM_ENTRY,
+    "幽默": _HUMOR_ENTRY,
+    "humorous": _HUMOR_ENTRY,
+    "情感": _EMOTION_ENTRY,
+    "emotional": _EMOTION_ENTRY,
+    "簡潔": _CONCISENESS_ENTRY,
+    "concise": _CONCISENESS_ENTRY,
+    "直接": _DIRECTNESS_ENTRY,
+    "direct": _DIRECTNESS_ENTRY,
+}
+
 
 class BrandStyleKeeper:
     """品牌風格一致性檢查和增強工具。"""
@@ -43,7 +141,8 @@ class BrandStyleKeeper:
         """
         self.brand_model = brand_model
         self.language_model = language_model
-        self.stop_words = set(stopwords.words('english'))
+        self._consistency_cache = LRUCache(maxsize=CONSISTENCY_CACHE_SIZE)
+        self._index_brand_model()
     
     def set_brand_model(self, brand_model: BrandModel) -> None:
         """
@@ -53,6 +152,8 @@ class BrandStyleKeeper:
             brand_model: 品牌模型
         """
         self.brand_model = brand_model
+        self._index_brand_model()
+        self._consistency_cache.clear()
         logger.debug(f"已設置品牌風格保持器的品牌模型: {brand_model.name}")
     
     def set_language_model(self, language_model: BrandLanguageModel) -> None:
@@ -63,8 +164,57 @@ class BrandStyleKeeper:
             language_model: 品牌語言模型
         """
         self.language_model = language_model
+        self._consistency_cache.clear()
         logger.debug(f"已設置品牌風格保持器的語言模型")
     
+    def _index_brand_model(self) -> None:
+        """預先整理品牌關鍵詞與風格屬性，避免每次檢查重複處理。"""
+        keywords = self.brand_model.keywords if self.brand_model else []
+        style_attributes = self.brand_model.style_attributes if self.brand_model else []
+        
+        # 風格屬性以平行陣列保存，供向量化評分使用
+        self._attr_names = [attr.name for attr in style_attributes]
+        self._attr_targets = np.array([attr.value for attr in style_attributes], dtype=np.float64)
+        self._attr_entries = [_ATTR_DISPATCH.get(attr.name.lower()) for attr in style_attributes]
+        
+        self._keywords_lower = [k.lower() for k in keywords]
+        self._keywords_lower_set = frozenset(self._keywords_lower)
+        self._keyword_automaton = None
+        self._keyword_pattern = None
+        
+        if not self._keywords_lower_set:
+            return
+        
+        if ahocorasick is not None:
+            # 關鍵詞自動機建立一次，之後每次檢查只需線性掃描內容
+            self._keyword_automaton = ahocorasick.Automaton()
+            for keyword_lower in self._keywords_lower_set:
+                self._keyword_automaton.add_word(keyword_lower, keyword_lower)
+            self._keyword_automaton.make_automaton()
+        else:
+            # 以前瞻交替正則在每個位置比對最長的關鍵詞，單次掃描即可找出所有關鍵詞
+            self._keyword_pattern = re.compile(
+                "(?=(" + "|".join(re.escape(k) for k in sorted(self._keywords_lower_set, key=len, reverse=True)) + "))"
+            )
+    
+    def _find_keywords(self, content_lower: str) -> set:
+        """
+        找出內容中出現的品牌關鍵詞。
+        
+        Args:
+            content_lower: 小寫內容
+            
+        Returns:
+            出現在內容中的小寫關鍵詞集合
+        """
+        if self._keyword_automaton is not None:
+            return {keyword_lower for _, keyword_lower in self._keyword_automaton.iter(content_lower)}
+        
+        found = set(self._keyword_pattern.findall(content_lower))
+        # 較短的關鍵詞可能包含在同一位置匹配到的較長關鍵詞中
+        shadowed = {k for k in self._keywords_lower_set - found if any(k in f for f in found)}
+        return found | shadowed
+    
     def check_consistency(self, content: str, content_type: ContentType) -> Dict[str, Any]:
         """
         檢查內容與品牌風格的一致性。
@@ -84,6 +234,26 @@ class BrandStyleKeeper:
                 "details": {}
             }
         
+        cache_key = (content, content_type)
+        result = self._consistency_cache.get(cache_key)
+        if result is None:
+            result = self._check_consistency_impl(content, content_type)
+            self._consistency_cache[cache_key] = result
+        
+        # 返回副本，調用方修改結果或建議列表時不會影響快取
+        return {**result, "suggestions": list(result["suggestions"])}
+    
+    def _check_consistency_impl(self, content: str, content_type: ContentType) -> Dict[str, Any]:
+        """
+        執行實際的一致性檢查（未經快取）。
+        
+        Args:
+            content: 要檢查的內容文本
+            content_type: 內容類型
+            
+        Returns:
+            一致性檢查結果，包含得分和建議
+        """
         # 初始化結果
         result = {
             "consistency_score": 0.0,
@@ -91,16 +261,19 @@ class BrandStyleKeeper:
             "details": {}
         }
         
+        # 只分詞、分句一次，供所有檢查共用
+        features = self._extract_features(content)
+        
         # 1. 關鍵詞檢查
-        keyword_score, keyword_details = self._check_keywords(content)
+        keyword_score, keyword_details = self._check_keywords(features)
         result["details"]["keywords"] = keyword_details
         
         # 2. 語句長度檢查
-        sentence_length_score, sentence_length_details = self._check_sentence_length(content)
+        sentence_length_score, sentence_length_details = self._check_sentence_length(features)
         result["details"]["sentence_length"] = sentence_length_details
         
         # 3. 風格屬性檢查
-        style_score, style_details = self._check_style_attributes(content)
+        style_score, style_details = self._check_style_attributes(features)
         result["details"]["style"] = style_details
         
         # 4. 語言模型評分（如果有）
@@ -164,6 +337,24 @@ class BrandStyleKeeper:
         
         return result
     
+    def check_consistency_batch(self, contents: List[str], content_type: ContentType) -> List[Dict[str, Any]]:
+        """
+        並行檢查多個內容與品牌風格的一致性。
+        
+        Args:
+            contents: 要檢查的內容文本列表
+            content_type: 內容類型
+            
+        Returns:
+            與輸入順序一致的一致性檢查結果列表
+        """
+        if not contents:
+            return []
+        
+        max_workers = min(len(contents), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda content: self.check_consistency(content, content_type), contents))
+    
     def enhance_consistency(self, content: str, content_type: ContentType) -> str:
         """
         增強內容與品牌風格的一致性。
@@ -179,6 +370,10 @@ class BrandStyleKeeper:
             logger.warning("未設置品牌模型或語言模型，無法增強風格一致性")
             return content
         
+        # 空白內容無需檢查或增強
+        if not content.strip():
+            return content
+        
         # 基本檢查
         check_result = self.check_consistency(content, content_type)
         
@@ -187,7 +382,45 @@ class BrandStyleKeeper:
             logger.debug("內容已經高度符合品牌風格，不需要增強")
             return content
         
-        # 使用語言模型進行風格增強
+        return self._enhance_with_language_model(content)
+    
+    def maybe_enhance(self, content: str, content_type: ContentType,
+                      threshold: float = 0.7) -> Tuple[str, float, List[str]]:
+        """
+        檢查一致性，僅在得分低於閾值時增強內容（只執行一次檢查）。
+        
+        Args:
+            content: 原始內容
+            content_type: 內容類型
+            threshold: 觸發增強的一致性得分閾值
+            
+        Returns:
+            (內容, 一致性得分, 建議列表)，得分與建議對應原始內容
+        """
+        check_result = self.check_consistency(content, content_type)
+        score = check_result["consistency_score"]
+        suggestions = check_result["suggestions"]
+        
+        if score >= threshold or not self.brand_model or not self.language_model:
+            return content, score, suggestions
+        
+        logger.debug(f"品牌風格一致性較低 ({score}), 嘗試增強")
+        enhanced_content = self._enhance_with_language_model(content)
+        if len(enhanced_content) > 10:  # 確保增強後的文本有效
+            content = enhanced_content
+        
+        return content, score, suggestions
+    
+    def _enhance_with_language_model(self, content: str) -> str:
+        """
+        使用語言模型進行風格增強。
+        
+        Args:
+            content: 原始內容
+            
+        Returns:
+            增強後的內容
+        """
         enhanced_content = self.language_model.enhance_text(
             content, 
             brand_style=True,
@@ -198,12 +431,59 @@ class BrandStyleKeeper:
         logger.debug(f"已增強內容風格一致性，原始長度: {len(content)}，增強後長度: {len(enhanced_content)}")
         return enhanced_content
     
-    def _check_keywords(self, content: str) -> Tuple[float, Dict[str, Any]]:
+    def _extract_features(self, content: str) -> Dict[str, Any]:
+        """
+        對內容進行一次性分詞和分句。
+        
+        Args:
+            content: 要分析的內容
+            
+        Returns:
+            包含原文、分句和小寫詞元的特徵字典
+        """
+        content_lower = content.lower()
+        sentences = [s for s in _SENT_RE.findall(content) if s.strip()]
+        tokens = _WORD_RE.findall(content_lower)
+        return {
+            "content": content,
+            "content_lower": content_lower,
+            "sentences": sentences,
+            "tokens": tokens,
+            "token_counts": Counter(tokens),
+            "sentence_lengths": np.fromiter(
+                (len(_WORD_RE.findall(s)) for s in sentences), dtype=np.int32, count=len(sentences)
+            ),
+            "marker_counts": self._scan_markers(content_lower)
+        }
+    
+    @staticmethod
+    def _scan_markers(content_lower: str) -> Counter:
+        """
+        單次掃描內容，依類別統計所有標記詞的出現次數。
+        
+        Args:
+            content_lower: 小寫內容
+            
+        Returns:
+            以標記詞類別為鍵的計數器
+        """
+        if ahocorasick is not None:
+            matches = (categories for _, categories in _MARKER_MATCHER.iter(content_lower))
+        else:
+            matches = (_MARKER_CATEGORIES[m.group(1)] for m in _MARKER_MATCHER.finditer(content_lower))
+        
+        counts = Counter()
+        for categories in matches:
+            for category in categories:
+                counts[category] += 1
+        return counts
+    
+    def _check_keywords(self, features: Dict[str, Any]) -> Tuple[float, Dict[str, Any]]:
         """
         檢查內容是否包含品牌關鍵詞。
         
         Args:
-            content: 要檢查的內容
+            features: 內容特徵
             
         Returns:
             (得分, 詳細信息)
@@ -211,17 +491,20 @@ class BrandStyleKeeper:
         if not self.brand_model or not self.brand_model.keywords:
             return 1.0, {"status": "未設置品牌關鍵詞"}
         
+        content_lower = features["content_lower"]
+        
         # 預處理內容
-        words = word_tokenize(content.lower())
-        words = [w for w in words if w not in self.stop_words and w not in string.punctuation]
+        words = [w for w in features["tokens"] if w not in _STOPWORDS and w not in _PUNCT]
         word_set = set(words)
         
         # 檢查關鍵詞
         found_keywords = []
         missing_keywords = []
         
-        for keyword in self.brand_model.keywords:
-            if keyword.lower() in content.lower():
+        found = self._find_keywords(content_lower)
+        
+        for keyword, keyword_lower in zip(self.brand_model.keywords, self._keywords_lower):
+            if keyword_lower in found:
                 found_keywords.append(keyword)
             else:
                 missing_keywords.append(keyword)
@@ -238,25 +521,24 @@ class BrandStyleKeeper:
             "coverage": f"{len(found_keywords)}/{len(self.brand_model.keywords)}"
         }
     
-    def _check_sentence_length(self, content: str) -> Tuple[float, Dict[str, Any]]:
+    def _check_sentence_length(self, features: Dict[str, Any]) -> Tuple[float, Dict[str, Any]]:
         """
         檢查句子長度是否符合品牌風格。
         
         Args:
-            content: 要檢查的內容
+            features: 內容特徵
             
         Returns:
             (得分, 詳細信息)
         """
-        # 分割句子
-        sentences = sent_tokenize(content)
+        sentences = features["sentences"]
         
         if not sentences:
             return 0.0, {"status": "無內容"}
         
         # 計算句子長度
-        lengths = [len(word_tokenize(s)) for s in sentences]
-        avg_length = sum(lengths) / len(lengths)
+        lengths = features["sentence_lengths"]
+        avg_length = float(lengths.mean())
         
         # 理想句長（可以從品牌模型中獲取，或根據行業設置）
         ideal_length = 15
@@ -273,122 +555,91 @@ class BrandStyleKeeper:
         return score, {
             "avg_length": avg_length,
             "ideal_length": ideal_length,
-            "min_length": min(lengths),
-            "max_length": max(lengths),
+            "min_length": int(lengths.min()),
+            "max_length": int(lengths.max()),
             "sentence_count": len(sentences)
         }
     
-    def _check_style_attributes(self, content: str) -> Tuple[float, Dict[str, Any]]:
+    def _check_style_attributes(self, features: Dict[str, Any]) -> Tuple[float, Dict[str, Any]]:
         """
         檢查內容是否符合品牌風格屬性。
         
         Args:
-            content: 要檢查的內容
+            features: 內容特徵
             
         Returns:
             (得分, 詳細信息)
         """
-        if not self.brand_model or not self.brand_model.style_attributes:
+        if not self._attr_names:
             return 1.0, {"status": "未設置品牌風格屬性"}
         
+        # 各屬性原始得分，再一次計算與目標值的差距
+        raw_scores = np.fromiter(
+            (self._evaluate_attribute(features, entry) for entry in self._attr_entries),
+            dtype=np.float64, count=len(self._attr_entries)
+        )
+        final_scores = np.maximum(0.0, 1.0 - np.abs(raw_scores - self._attr_targets))
+        
         # 風格屬性評分
         attributes = {}
-        total_score = 0.0
-        
-        for attr in self.brand_model.style_attributes:
-            attr_score, suggestion = self._evaluate_attribute(content, attr.name, attr.value)
-            attributes[attr.name] = {
-                "target_value": attr.value,
-                "score": attr_score,
-                "suggestion": suggestion
+        for name, entry, raw_score, target_value, final_score in zip(
+                self._attr_names, self._attr_entries, raw_scores, self._attr_targets, final_scores):
+            attributes[name] = {
+                "target_value": float(target_value),
+                "score": float(final_score),
+                "suggestion": self._attribute_suggestion(name, entry, raw_score, target_value)
             }
-            total_score += attr_score
         
         # 計算平均得分
-        avg_score = total_score / len(self.brand_model.style_attributes) if self.brand_model.style_attributes else 1.0
+        avg_score = float(final_scores.mean())
         
         return avg_score, {
             "attributes": attributes,
             "overall_score": avg_score
         }
     
-    def _evaluate_attribute(self, content: str, attribute: str, target_value: float) -> Tuple[float, str]:
+    def _evaluate_attribute(self, features: Dict[str, Any], entry: Optional[Tuple[str, str, str]]) -> float:
+        """
+        評估內容在特定風格屬性上的原始得分。
+        
+        Args:
+            features: 內容特徵
+            entry: 風格屬性對應的評估表項目，無法評估時為 None
+            
+        Returns:
+            原始得分（0-1）
+        """
+        if entry is None:
+            return 0.5  # 無法評估時給出中間值
+        return getattr(self, entry[0])(features)
+    
+    @staticmethod
+    def _attribute_suggestion(attribute: str, entry: Optional[Tuple[str, str, str]],
+                              score: float, target_value: float) -> str:
         """
-        評估內容在特定風格屬性上的得分。
+        根據原始得分與目標值產生風格屬性的改進建議。
         
         Args:
-            content: 要評估的內容
             attribute: 風格屬性名稱
+            entry: 風格屬性對應的評估表項目
+            score: 原始得分
             target_value: 目標值（0-1）
             
         Returns:
-            (得分, 改進建議)
+            改進建議
         """
-        # 這裡根據不同的風格屬性使用不同的評估方法
-        # 下面是一些常見屬性的示例評估方法
-        
-        attribute_lower = attribute.lower()
-        
-        # 正式/非正式程度
-        if attribute_lower in ["正式", "formal"]:
-            score = self._evaluate_formality(content)
-            suggestion = "使用更正式的用語和句式" if score < target_value else "略微減少正式程度"
-        
-        # 專業程度
-        elif attribute_lower in ["專業", "professional"]:
-            score = self._evaluate_professionalism(content)
-            suggestion = "增加專業術語和行業詞彙" if score < target_value else "簡化一些專業術語"
-        
-        # 幽默程度
-        elif attribute_lower in ["幽默", "humorous"]:
-            score = self._evaluate_humor(content)
-            suggestion = "增加一些輕鬆、幽默的表達" if score < target_value else "減少幽默元素，增加正式內容"
-        
-        # 情感程度
-        elif attribute_lower in ["情感", "emotional"]:
-            score = self._evaluate_emotion(content)
-            suggestion = "使用更具情感的語言和表達" if score < target_value else "使用更客觀、中性的語言"
-        
-        # 簡潔程度
-        elif attribute_lower in ["簡潔", "concise"]:
-            score = self._evaluate_conciseness(content)
-            suggestion = "精簡內容，刪除冗餘表達" if score < target_value else "添加更多細節和描述"
-        
-        # 直接程度
-        elif attribute_lower in ["直接", "direct"]:
-            score = self._evaluate_directness(content)
-            suggestion = "更直接地表達主要觀點" if score < target_value else "使用更委婉、間接的表達方式"
-        
-        # 默認情況
-        else:
-            score = 0.5  # 無法評估時給出中間值
-            suggestion = f"調整 '{attribute}' 特性以符合品牌風格"
-        
-        # 計算差距並評分
-        gap = abs(score - target_value)
-        final_score = max(0, 1 - gap)
-        
-        return final_score, suggestion
+        if entry is None:
+            return f"調整 '{attribute}' 特性以符合品牌風格"
+        _, raise_suggestion, lower_suggestion = entry
+        return raise_suggestion if score < target_value else lower_suggestion
     
-    def _evaluate_formality(self, content: str) -> float:
+    def _evaluate_formality(self, features: Dict[str, Any]) -> float:
         """評估內容的正式程度。"""
-        # 正式標記詞
-        formal_markers = ["furthermore", "therefore", "consequently", "nevertheless", "regarding", 
-                         "accordingly", "hereby", "thus", "hence", "wherein"]
-        # 非正式標記詞
-        informal_markers = ["anyway", "well", "you know", "kind of", "sort of", "like", "stuff", 
-                           "thing", "okay", "OK", "guys", "pretty", "really", "gonna", "wanna"]
-        
         # 計算標記詞出現頻率
-        content_lower = content.lower()
-        formal_count = sum(content_lower.count(marker) for marker in formal_markers)
-        informal_count = sum(content_lower.count(marker) for marker in informal_markers)
-        
-        # 收縮形式（如 don't, can't）通常表示非正式
-        contractions = ["n't", "'ll", "'re", "'ve", "'m", "'d"]
-        contraction_count = sum(content_lower.count(c) for c in contractions)
-        
-        informal_count += contraction_count
+        # 收縮形式（如 don't, can't）已計入非正式類別
+        marker_counts = features["marker_counts"]
+        formal_count = marker_counts["formal"]
+        informal_count = marker_counts["informal"]
         
         # 計算正式程度得分
         if formal_count + informal_count == 0:
@@ -397,8 +648,8 @@ class BrandStyleKeeper:
         formality_score = formal_count / (formal_count + informal_count) if formal_count + informal_count > 0 else 0.5
         
         # 句子複雜度也影響正式程度
-        sentences = sent_tokenize(content)
-        avg_length = sum(len(word_tokenize(s)) for s in sentences) / len(sentences) if sentences else 0
+        lengths = features["sentence_lengths"]
+        avg_length = float(lengths.mean()) if lengths.size else 0
         
         # 長句子通常更正式
         length_factor = min(1.0, avg_length / 20)  # 20 詞的句子被視為相當正式
@@ -408,23 +659,16 @@ class BrandStyleKeeper:
         
         return combined_score
     
-    def _evaluate_professionalism(self, content: str) -> float:
+    def _evaluate_professionalism(self, features: Dict[str, Any]) -> float:
         """評估內容的專業程度。"""
         # 簡化實現
         # 真實系統中可使用行業特定詞彙表和更複雜的指標
         
-        content_lower = content.lower()
-        
-        # 專業標記詞（通用）
-        professional_markers = ["analysis", "research", "data", "methodology", "results", 
-                              "implement", "strategy", "objective", "criteria", "evaluation"]
-        
-        # 計算標記詞出現頻率
-        marker_count = sum(content_lower.count(marker) for marker in professional_markers)
+        # 計算專業標記詞出現頻率
+        marker_count = sum(features["token_counts"][marker] for marker in _PROFESSIONAL_MARKERS)
         
         # 專業度根據標記詞密度計算
-        words = word_tokenize(content_lower)
-        word_count = len(words)
+        word_count = len(features["tokens"])
         
         if word_count == 0:
             return 0.0
@@ -436,46 +680,36 @@ class BrandStyleKeeper:
         
         return professionalism_score
     
-    def _evaluate_humor(self, content: str) -> float:
+    def _evaluate_humor(self, features: Dict[str, Any]) -> float:
         """評估內容的幽默程度。"""
         # 簡化實現
-        content_lower = content.lower()
-        
-        # 幽默標記
-        humor_markers = ["laugh", "funny", "joke", "humor", "witty", "haha", "lol", "smile", 
-                        "amusing", "hilarious", "ironic", "sarcastic", "playful", "teasing"]
+        content = features["content"]
         
         # 標點符號（感嘆號和問號可能表示幽默或誇張）
         exclamations = content.count('!')
         questions = content.count('?')
         
         # 計算標記詞出現頻率
-        marker_count = sum(content_lower.count(marker) for marker in humor_markers)
+        marker_count = features["marker_counts"]["humor"]
         
         # 根據標記詞和標點符號計算幽默度
         humor_score = min(1.0, (marker_count * 0.3 + exclamations * 0.1 + questions * 0.05))
         
         return humor_score
     
-    def _evaluate_emotion(self, content: str) -> float:
+    def _evaluate_emotion(self, features: Dict[str, Any]) -> float:
         """評估內容的情感程度。"""
         # 簡化實現
-        content_lower = content.lower()
-        
-        # 情感詞表（正面和負面）
-        emotional_words = ["love", "hate", "excited", "thrilled", "amazing", "terrible", "wonderful", 
-                          "awful", "delighted", "disappointed", "happy", "sad", "angry", "joyful", 
-                          "proud", "ashamed", "grateful", "hurt", "inspired", "devastated"]
+        content = features["content"]
         
         # 情感標點符號
         exclamations = content.count('!')
         
         # 計算情感詞出現頻率
-        emotion_count = sum(content_lower.count(word) for word in emotional_words)
+        emotion_count = sum(features["token_counts"][word] for word in _EMOTIONAL_WORDS)
         
         # 計算情感得分
-        words = word_tokenize(content_lower)
-        word_count = len(words)
+        word_count = len(features["tokens"])
         
         if word_count == 0:
             return 0.0
@@ -485,25 +719,20 @@ class BrandStyleKeeper:
         
         return emotion_score
     
-    def _evaluate_conciseness(self, content: str) -> float:
+    def _evaluate_conciseness(self, features: Dict[str, Any]) -> float:
         """評估內容的簡潔程度。"""
         # 簡化實現
         
         # 分析句子長度
-        sentences = sent_tokenize(content)
-        if not sentences:
+        lengths = features["sentence_lengths"]
+        if not lengths.size:
             return 0.0
         
         # 計算平均句長
-        avg_length = sum(len(word_tokenize(s)) for s in sentences) / len(sentences)
+        avg_length = float(lengths.mean())
         
         # 計算冗詞
-        content_lower = content.lower()
-        filler_words = ["basically", "actually", "literally", "virtually", "definitely", 
-                       "certainly", "probably", "essentially", "totally", "completely", 
-                       "absolutely", "really", "very", "quite", "somewhat", "rather"]
-        
-        filler_count = sum(content_lower.count(word) for word in filler_words)
+        filler_count = features["marker_counts"]["filler"]
         
         # 根據句長和冗詞計算簡潔度（反向關係）
         length_factor = max(0, 1 - (avg_length / 20))  # 20詞以上被視為較長
@@ -513,28 +742,18 @@ class BrandStyleKeeper:
         
         return conciseness_score
     
-    def _evaluate_directness(self, content: str) -> float:
+    def _evaluate_directness(self, features: Dict[str, Any]) -> float:
         """評估內容的直接程度。"""
         # 簡化實現
-        content_lower = content.lower()
-        
-        # 間接表達標記
-        indirect_markers = ["perhaps", "maybe", "might", "could", "possibly", "potentially", 
-                          "seemingly", "appears to", "it seems", "somewhat", "rather", 
-                          "in a sense", "from a certain perspective", "one might say"]
-        
-        # 直接表達標記
-        direct_markers = ["definitely", "absolutely", "certainly", "clearly", "obviously", 
-                        "without doubt", "must", "always", "never", "undoubtedly"]
-        
         # 疑問句比例（可能表示間接）
-        sentences = sent_tokenize(content)
+        sentences = features["sentences"]
         question_count = sum(1 for s in sentences if s.strip().endswith('?'))
         question_ratio = question_count / len(sentences) if sentences else 0
         
         # 計算標記詞出現頻率
-        indirect_count = sum(content_lower.count(marker) for marker in indirect_markers)
-        direct_count = sum(content_lower.count(marker) for marker in direct_markers)
+        marker_counts = features["marker_counts"]
+        indirect_count = marker_counts["indirect"]
+        direct_count = marker_counts["direct"]
         
         # 計算直接度得分
         total_markers = indirect_count + direct_count
@@ -42,7 +42,9 @@ class PlatformAdapter:
         
         if platform not in self.adapters:
             logger.warning(f"No adapter available for platform: {platform}. Using generic adaptation.")
-            return self._generic_adapt(content, platform)
+            adapted = self._generic_adapt(content, platform)
+            adapted["notes"] = "\n".join(adapted["notes"])
+            return adapted
         
         logger.info(f"Adapting content for platform: {platform}")
         return self.adapters[platform].adapt(content, business_info)
@@ -56,7 +58,7 @@ class PlatformAdapter:
             platform: Target platform name
             
         Returns:
-            Minimally adapted content
+            Minimally adapted content, with "notes" as a list of note lines
         """
         # Create a copy to avoid modifying the original
         adapted = content.copy()
@@ -64,9 +66,10 @@ class PlatformAdapter:
         # Add platform indicator
         adapted["platform"] = platform
         
-        # Add generic platform notice
-        if "notes" not in adapted:
-            adapted["notes"] = ""
-        adapted["notes"] += f"\nThis content has been generically adapted for {platform}."
+        # Collect notes in a list; they are joined once at the adapt_content boundary
+        notes = adapted.get("notes") or []
+        if isinstance(notes, str):
+            notes = [notes]
+        adapted["notes"] = notes + [f"This content has been generically adapted for {platform}."]
         
         return adapted
\ No newline at end of file
@@ -5,8 +5,10 @@
 Content generator for creating multi-platform marketing content.
 """
 
+import re
 import autogen
 from marketgenius.utils.logger import get_logger
+from marketgenius.utils.helpers import LRUCache
 from marketgenius.content.text import TextGenerator
 from marketgenius.content.image import ImageGenerator
 from marketgenius.content.video import VideoGenerator
@@ -14,6 +16,9 @@ from marketgenius.content.adapter import PlatformAdapter
 
 logger = get_logger(__name__)
 
+# Markdown "## " section headings in editor output
+_SECTION_RE = re.compile(r'(?m)^## (.*)$')
+
 
 class ContentGenerationPipeline:
     """Pipeline for generating marketing content."""
@@ -31,6 +36,9 @@ class ContentGenerationPipeline:
         self.brand_model = brand_model
         self.config = config
         
+        # Business name -> (brand model version, voice parameters)
+        self._voice_cache = LRUCache(maxsize=128)
+        
         # Initialize content generators
         self.text_generator = TextGenerator(config.get("text_generation", {}))
         self.image_generator = ImageGenerator(config.get("image_generation", {}))
@@ -106,10 +114,28 @@ class ContentGenerationPipeline:
         logger.info(f"Content generation completed for platforms: {platforms}")
         return adapted_content
     
+    def _get_brand_voice(self, business_name):
+        """
+        Get brand voice parameters for a business, caching the lookup.
+        
+        Entries are tagged with the brand model's version, so a brand created
+        or updated elsewhere (e.g. the brand tab) is picked up on the next call.
+        Empty results are not cached.
+        """
+        version = self.brand_model.model_version
+        cached = self._voice_cache.get(business_name)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        
+        brand_voice = self.brand_model.get_brand_voice_parameters(business_name)
+        if brand_voice:
+            self._voice_cache[business_name] = (version, brand_voice)
+        return brand_voice
+    
     def _prepare_content_request(self, business_info, content_request):
         """Prepare the content request message for the agents."""
         # Extract brand voice parameters
-        brand_voice = self.brand_model.get_brand_voice_parameters(business_info.get("name", ""))
+        brand_voice = self._get_brand_voice(business_info.get("name", ""))
         
         # Build the initial message
         message = f"""
@@ -144,39 +170,38 @@ class ContentGenerationPipeline:
         if not brand_voice:
             return "No brand voice parameters available."
             
-        formatted = "```\n"
+        parts = ["```"]
         for key, value in brand_voice.items():
             if isinstance(value, dict):
-                formatted += f"{key}:\n"
-                for subkey, subvalue in value.items():
-                    formatted += f"  - {subkey}: {subvalue}\n"
+                parts.append(f"{key}:")
+                parts.extend(f"  - {subkey}: {subvalue}" for subkey, subvalue in value.items())
             elif isinstance(value, list):
-                formatted += f"{key}: {', '.join(value)}\n"
+                parts.append(f"{key}: {', '.join(map(str, value))}")
             else:
-                formatted += f"{key}: {value}\n"
-        formatted += "```"
+                parts.append(f"{key}: {value}")
+        parts.append("```")
         
-        return formatted
+        return "\n".join(parts)
     
     def _extract_results_from_chat(self):
         """Extract the generated content from the group chat."""
         # Get the chat history
         chat_history = self.groupchat.messages
         
-        # Find the last message from the editor agent
-        editor_messages = [
-            msg for msg in chat_history 
-            if msg.get("role") == "assistant" and 
-               msg.get("name") == self.agents["editor"].name
-        ]
+        # Find the last message from the editor agent, scanning from the end
+        editor_name = self.agents["editor"].name
+        last_editor_message = next(
+            (
+                msg.get("content", "") for msg in reversed(chat_history)
+                if msg.get("role") == "assistant" and msg.get("name") == editor_name
+            ),
+            None
+        )
         
-        if not editor_messages:
+        if last_editor_message is None:
             logger.warning("No editor messages found in chat history")
             return {"error": "No content generated"}
         
-        # Get the last message from the editor
-        last_editor_message = editor_messages[-1].get("content", "")
-        
         # Parse the content (assuming it's in a structured format)
         try:
             content = self._parse_editor_content(last_editor_message)
@@ -188,26 +213,14 @@ class ContentGenerationPipeline:
     def _parse_editor_content(self, message):
         """Parse the content from the editor's message."""
         # Simple parsing logic - would be more sophisticated in production
-        lines = message.split("\n")
-        content = {}
+        # Splitting yields [preamble, heading1, body1, heading2, body2, ...]
+        parts = _SECTION_RE.split(message)
+        sections = iter(parts[1:])
         
-        current_section = None
-        section_content = []
-        
-        for line in lines:
-            if line.startswith("## "):
-                # Save previous section if it exists
-                if current_section:
-                    content[current_section] = "\n".join(section_content).strip()
-                    section_content = []
-                
-                # Start new section
-                current_section = line[3:].strip().lower().replace(" ", "_")
-            elif current_section:
-                section_content.append(line)
-        
-        # Save the last section
-        if current_section and section_content:
-            content[current_section] = "\n".join(section_content).strip()
+        content = {}
+        for heading, body in zip(sections, sections):
+            section = heading.strip().lower().replace(" ", "_")
+            if section:
+                content[section] = body.strip()
         
         return content
\ No newline at end of file
@@ -7,14 +7,94 @@ Image generator module for creating visual content.
 
 import os
 import io
+import json
+import hashlib
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+import httpx
 import requests
-import base64
+from requests.adapters import HTTPAdapter
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_random_exponential
 from PIL import Image, ImageDraw, ImageFont
 import numpy as np
 from marketgenius.utils.logger import get_logger
+from marketgenius.utils.helpers import LRUCache
+from marketgenius.content.semantic_cache import SemanticCache
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 logger = get_logger(__name__)
 
+# Shared keep-alive session so repeated API calls reuse pooled connections
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=32))
+
+# Basic CSS colour keywords, used to normalise brand colour names to hex
+_CSS_COLORS = {
+    "black": "#000000",
+    "silver": "#c0c0c0",
+    "gray": "#808080",
+    "grey": "#808080",
+    "white": "#ffffff",
+    "maroon": "#800000",
+    "red": "#ff0000",
+    "purple": "#800080",
+    "fuchsia": "#ff00ff",
+    "green": "#008000",
+    "lime": "#00ff00",
+    "olive": "#808000",
+    "yellow": "#ffff00",
+    "navy": "#000080",
+    "blue": "#0000ff",
+    "teal": "#008080",
+    "aqua": "#00ffff",
+    "orange": "#ffa500",
+    "pink": "#ffc0cb",
+    "brown": "#a52a2a",
+    "gold": "#ffd700",
+}
+
+# Transient API statuses worth retrying with backoff
+_RETRYABLE_STATUS = frozenset({429, 500, 502, 503, 504})
+
+_api_retry = retry(
+    wait=wait_random_exponential(min=1, max=30),
+    stop=stop_after_attempt(4),
+    retry=retry_if_exception_type((
+        requests.HTTPError, requests.ConnectionError, requests.Timeout,
+        httpx.HTTPStatusError, httpx.TransportError
+    )),
+    reraise=True
+)
+
+
+def _dump_json(payload):
+    """Serialize a request payload to UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=16)
+def _get_font(size):
+    """Load the text font at the given size, falling back to PIL's default font."""
+    try:
+        return ImageFont.truetype("Arial.ttf", size)
+    except IOError:
+        return ImageFont.load_default()
+
+
+@functools.lru_cache(maxsize=4096)
+def _text_size(font_size, text):
+    """Measure the (width, height) of text rendered with the font of the given size."""
+    left, _, right, bottom = _get_font(font_size).getbbox(text)
+    return right - left, bottom
+
 
 class ImageGenerator:
     """Generator for creating visual content for marketing."""
@@ -31,8 +111,33 @@ class ImageGenerator:
         self.default_model = config.get("model", "stable-diffusion-v1-5")
         self.default_size = config.get("default_size", "1024x1024")
         
-        # Cache for storing generated images to avoid redundant API calls
-        self.cache = {}
+        # Per-instance random generator for placeholder patterns (seedable for reproducibility)
+        self._rng = np.random.default_rng(config.get("seed"))
+        
+        # Small in-memory cache of decoded images (L1) to avoid redundant API calls
+        self.cache = LRUCache(maxsize=config.get("cache_size", 16))
+        self.max_cache_bytes = config.get("max_cache_bytes", 256 * 1024 * 1024)
+        self._cache_bytes = 0
+        self._cache_lock = threading.Lock()
+        
+        # Optional on-disk cache of compressed images (L2), shareable across processes
+        self.cache_dir = config.get("cache_dir")
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+        
+        # Async client and concurrency limit, created lazily per event loop
+        self._async_client = None
+        self._async_semaphore = None
+        self._async_loop = None
+        
+        # Optional cache matching near-duplicate prompts; it maps prompts to
+        # L1/disk cache keys, so images stay under the limits above
+        self.semantic_cache = None
+        if config.get("semantic_cache"):
+            self.semantic_cache = SemanticCache(
+                threshold=config.get("semantic_cache_threshold", 0.92),
+                maxsize=config.get("cache_size", 128)
+            )
     
     def generate_image(self, prompt, size=None, model=None, brand_colors=None):
         """
@@ -50,14 +155,9 @@ class ImageGenerator:
         size = size or self.default_size
         model = model or self.default_model
         
-        # Check cache
-        cache_key = f"{prompt}_{size}_{model}"
-        if cache_key in self.cache:
-            logger.info(f"Using cached image for prompt: {prompt[:30]}...")
-            return self.cache[cache_key]
-        
-        # Enhance prompt with brand colors if provided
-        enhanced_prompt = self._enhance_prompt_with_brand_colors(prompt, brand_colors)
+        cache_key, enhanced_prompt, cached_image = self._lookup_cached(prompt, size, model, brand_colors)
+        if cached_image is not None:
+            return cached_image
         
         logger.info(f"Generating image with prompt: {enhanced_prompt[:50]}...")
         
@@ -78,43 +178,247 @@ class ImageGenerator:
                 logger.warning("Falling back to placeholder image generation")
                 image = self._generate_placeholder(enhanced_prompt, size)
             
-            # Cache the result
-            self.cache[cache_key] = image
+            self._store_generated(cache_key, enhanced_prompt, image, size, model)
             return image
             
         except Exception as e:
             logger.error(f"Error generating image: {e}")
             return self._generate_error_image(str(e), size)
     
+    async def agenerate_image(self, prompt, size=None, model=None, brand_colors=None):
+        """
+        Asynchronously generate an image based on the provided prompt.
+        
+        Args:
+            prompt: Text description of the image to generate
+            size: Size of the image (default from config)
+            model: Model to use for generation (default from config)
+            brand_colors: List of brand colors to incorporate
+            
+        Returns:
+            PIL Image object
+        """
+        size = size or self.default_size
+        model = model or self.default_model
+        
+        cache_key, enhanced_prompt, cached_image = self._lookup_cached(prompt, size, model, brand_colors)
+        if cached_image is not None:
+            return cached_image
+        
+        logger.info(f"Generating image with prompt: {enhanced_prompt[:50]}...")
+        
+        try:
+            # Race the configured API backends, hedging slow Stable Diffusion calls
+            image = await self._agenerate_hedged(enhanced_prompt, size, model)
+            
+            # Last resort: generate a placeholder image
+            if image is None:
+                logger.warning("Falling back to placeholder image generation")
+                image = self._generate_placeholder(enhanced_prompt, size)
+            
+            self._store_generated(cache_key, enhanced_prompt, image, size, model)
+            return image
+            
+        except Exception as e:
+            logger.error(f"Error generating image: {e}")
+            return self._generate_error_image(str(e), size)
+    
+    async def generate_images_concurrent(self, prompts, size=None, model=None, brand_colors=None):
+        """
+        Asynchronously generate images for several prompts in parallel.
+        
+        Args:
+            prompts: List of text descriptions of the images to generate
+            size: Size of the images (default from config)
+            model: Model to use for generation (default from config)
+            brand_colors: List of brand colors to incorporate
+            
+        Returns:
+            List of PIL Image objects in the same order as prompts
+        """
+        return await asyncio.gather(
+            *[self.agenerate_image(prompt, size, model, brand_colors) for prompt in prompts]
+        )
+    
+    async def aclose(self):
+        """Close the async HTTP client."""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+            self._async_semaphore = None
+            self._async_loop = None
+    
+    def _lookup_cached(self, prompt, size, model, brand_colors):
+        """
+        Look up an image in the exact and semantic caches.
+        
+        Returns:
+            Tuple of (cache key, enhanced prompt, cached image or None)
+        """
+        cache_key = self._cache_key(prompt, size, model)
+        cached_image = self._cache_get(cache_key)
+        if cached_image is not None:
+            logger.info(f"Using cached image for prompt: {prompt[:30]}...")
+            return cache_key, None, cached_image
+        
+        # Enhance prompt with brand colors if provided
+        enhanced_prompt = self._enhance_prompt_with_brand_colors(prompt, brand_colors)
+        
+        # Check for a cached image from a semantically similar prompt
+        if self.semantic_cache:
+            similar_key = self.semantic_cache.get(enhanced_prompt, namespace=(size, model))
+            if similar_key is not None:
+                similar_image = self._cache_get(similar_key)
+                if similar_image is not None:
+                    return cache_key, enhanced_prompt, similar_image
+        
+        return cache_key, enhanced_prompt, None
+    
+    def _store_generated(self, cache_key, enhanced_prompt, image, size, model):
+        """Cache a freshly generated image."""
+        self._cache_put(cache_key, image)
+        if self.semantic_cache:
+            self.semantic_cache.put(enhanced_prompt, cache_key, namespace=(size, model))
+    
+    def clear_cache(self):
+        """Remove all cached images."""
+        with self._cache_lock:
+            self.cache.clear()
+            self._cache_bytes = 0
+        
+        if self.cache_dir:
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".webp"):
+                        try:
+                            os.remove(entry.path)
+                        except FileNotFoundError:
+                            pass
+        if self.semantic_cache:
+            self.semantic_cache.clear()
+    
+    @staticmethod
+    def _cache_key(prompt, size, model):
+        """Build a compact cache key, also used as the on-disk file name."""
+        return hashlib.sha256(f"{prompt}|{size}|{model}".encode("utf-8")).hexdigest()[:24]
+    
+    def _cache_path(self, key):
+        """Path of the on-disk cache file for a key."""
+        return os.path.join(self.cache_dir, f"{key}.webp")
+    
+    def _cache_get(self, key):
+        """Look up an image in memory, then on disk, promoting disk hits to memory."""
+        image = self.cache.get(key)
+        if image is not None or not self.cache_dir:
+            return image
+        
+        try:
+            with Image.open(self._cache_path(key)) as cached:
+                image = cached.convert("RGB")
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"Could not read cached image {key}: {e}")
+            return None
+        
+        self._cache_put(key, image, persist=False)
+        return image
+    
+    @staticmethod
+    def _image_nbytes(image):
+        """Approximate decoded size of an image in bytes."""
+        width, height = image.size
+        return width * height * len(image.getbands())
+    
+    def _cache_put(self, key, image, persist=True):
+        """Cache an image, evicting least recently used entries beyond the count and byte limits."""
+        if persist and self.cache_dir:
+            self._persist_image(key, image)
+        
+        with self._cache_lock:
+            if key in self.cache:
+                self._cache_bytes -= self._image_nbytes(self.cache.pop(key))
+            
+            # Evict by byte budget first, then let the LRU enforce the entry count
+            image_bytes = self._image_nbytes(image)
+            while self.cache and self._cache_bytes + image_bytes > self.max_cache_bytes:
+                _, evicted = self.cache.popitem(last=False)
+                self._cache_bytes -= self._image_nbytes(evicted)
+            
+            if len(self.cache) >= self.cache.maxsize:
+                _, evicted = self.cache.popitem(last=False)
+                self._cache_bytes -= self._image_nbytes(evicted)
+            
+            self.cache[key] = image
+            self._cache_bytes += image_bytes
+    
+    def _persist_image(self, key, image):
+        """Write an image to the on-disk cache atomically."""
+        path = self._cache_path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            image.save(tmp_path, "WEBP", quality=90)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not write cached image {key}: {e}")
+            try:
+                os.remove(tmp_path)
+            except FileNotFoundError:
+                pass
+    
+    def generate_images(self, prompts, size=None, model=None, brand_colors=None):
+        """
+        Generate images for several prompts, running API calls concurrently.
+        
+        Duplicate prompts are generated once and share the resulting image.
+        
+        Args:
+            prompts: List of text descriptions of the images to generate
+            size: Size of the images (default from config)
+            model: Model to use for generation (default from config)
+            brand_colors: List of brand colors to incorporate
+            
+        Returns:
+            List of PIL Image objects in the same order as prompts
+        """
+        unique_prompts = list(dict.fromkeys(prompts))
+        if not unique_prompts:
+            return []
+        
+        max_workers = min(len(unique_prompts), self.config.get("max_concurrency", 4))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            images = executor.map(
+                lambda prompt: self.generate_image(prompt, size, model, brand_colors),
+                unique_prompts
+            )
+            images_by_prompt = dict(zip(unique_prompts, images))
+        
+        return [images_by_prompt[prompt] for prompt in prompts]
+    
     def _enhance_prompt_with_brand_colors(self, prompt, brand_colors):
         """Enhance the image prompt with brand colors."""
         if not brand_colors:
             return prompt
             
         # Convert color names to hex if they're not already
-        color_specs = []
-        for color in brand_colors:
-            if color.startswith('#'):
-                color_specs.append(color)
-            else:
-                color_specs.append(color)
+        color_text = ", ".join(_CSS_COLORS.get(color.lower(), color) for color in brand_colors)
         
         # Add color information to the prompt
-        color_text = ", ".join(color_specs)
         enhanced_prompt = f"{prompt}. Use the following brand colors: {color_text}."
         
         return enhanced_prompt
     
-    def _generate_with_stable_diffusion(self, prompt, size, model):
-        """Generate image using Stable Diffusion API."""
+    def _stable_diffusion_request(self, prompt, size):
+        """Build the URL, headers and encoded JSON body for a Stable Diffusion API call."""
         width, height = self._parse_size(size)
         
         url = "https://api.stability.ai/v1/generation/stable-diffusion-v1-5/text-to-image"
         
         headers = {
             "Content-Type": "application/json",
-            "Accept": "application/json",
-            "Authorization": f"Bearer {self.api_key}"
+            "Accept": "image/png",
+            "Authorization": f"Bearer {self.api_key}",
+            "Connection": "keep-alive"
         }
         
         payload = {
@@ -126,22 +430,120 @@ class ImageGenerator:
             "steps": 30,
         }
         
+        return url, headers, _dump_json(payload)
+    
+    def _generate_with_stable_diffusion(self, prompt, size, model):
+        """Generate image using Stable Diffusion API."""
+        url, headers, payload = self._stable_diffusion_request(prompt, size)
+        
         try:
-            response = requests.post(url, headers=headers, json=payload)
+            return self._post_stable_diffusion(url, headers, payload)
+        except Exception as e:
+            logger.error(f"Error with Stable Diffusion: {e}")
+            return None
+    
+    @_api_retry
+    def _post_stable_diffusion(self, url, headers, payload):
+        """Call the Stable Diffusion API, raising on transient errors so they are retried."""
+        with _SESSION.post(url, headers=headers, data=payload, timeout=(5, 60), stream=True) as response:
+            if response.status_code in _RETRYABLE_STATUS:
+                response.raise_for_status()
             
-            if response.status_code == 200:
-                data = response.json()
-                image_data = base64.b64decode(data["artifacts"][0]["base64"])
-                image = Image.open(io.BytesIO(image_data))
-                return image
-            else:
+            if response.status_code != 200:
                 logger.error(f"Stable Diffusion API error: {response.status_code}, {response.text}")
                 return None
-                
+            
+            # Decode the PNG body straight from the socket
+            response.raw.decode_content = True
+            image = Image.open(response.raw)
+            image.load()
+            return image
+    
+    async def _agenerate_with_stable_diffusion(self, prompt, size, model):
+        """Asynchronously generate image using Stable Diffusion API."""
+        url, headers, payload = self._stable_diffusion_request(prompt, size)
+        
+        try:
+            return await self._apost_stable_diffusion(url, headers, payload)
         except Exception as e:
             logger.error(f"Error with Stable Diffusion: {e}")
             return None
     
+    @_api_retry
+    async def _apost_stable_diffusion(self, url, headers, payload):
+        """Asynchronously call the Stable Diffusion API, raising on transient errors so they are retried."""
+        client, semaphore = self._get_async_client()
+        async with semaphore:
+            response = await client.post(url, headers=headers, content=payload)
+        
+        if response.status_code in _RETRYABLE_STATUS:
+            response.raise_for_status()
+        
+        if response.status_code != 200:
+            logger.error(f"Stable Diffusion API error: {response.status_code}, {response.text}")
+            return None
+        
+        image = Image.open(io.BytesIO(response.content))
+        image.load()
+        return image
+    
+    async def _agenerate_with_huggingface(self, prompt, size):
+        """Asynchronously generate image using Hugging Face Inference API."""
+        return self._generate_with_huggingface(prompt, size)
+    
+    async def _agenerate_hedged(self, prompt, size, model):
+        """
+        Generate an image with the enabled API backends, taking the first success.
+        
+        Stable Diffusion is tried first; Hugging Face is started as well if
+        Stable Diffusion fails or has not responded within `hedge_after_ms`.
+        
+        Returns:
+            PIL Image object, or None if every backend failed
+        """
+        use_sd = self.config.get("use_stable_diffusion") and self.api_key
+        use_hf = self.config.get("use_huggingface")
+        
+        if use_sd and not use_hf:
+            return await self._agenerate_with_stable_diffusion(prompt, size, model)
+        if use_hf and not use_sd:
+            return await self._agenerate_with_huggingface(prompt, size)
+        if not use_sd:
+            return None
+        
+        hedge_after = self.config.get("hedge_after_ms", 2000) / 1000
+        pending = {asyncio.create_task(self._agenerate_with_stable_diffusion(prompt, size, model))}
+        try:
+            done, pending = await asyncio.wait(pending, timeout=hedge_after)
+            for task in done:
+                if task.result() is not None:
+                    return task.result()
+            
+            # Stable Diffusion is slow or failed: start the Hugging Face request too
+            pending.add(asyncio.create_task(self._agenerate_with_huggingface(prompt, size)))
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.result() is not None:
+                        return task.result()
+            return None
+        finally:
+            for task in pending:
+                task.cancel()
+    
+    def _get_async_client(self):
+        """Return the async HTTP client and semaphore bound to the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            max_concurrency = self.config.get("max_concurrency", 4)
+            self._async_client = httpx.AsyncClient(
+                timeout=httpx.Timeout(60.0, connect=5.0),
+                limits=httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency)
+            )
+            self._async_semaphore = asyncio.Semaphore(max_concurrency)
+            self._async_loop = loop
+        return self._async_client, self._async_semaphore
+    
     def _generate_with_huggingface(self, prompt, size):
         """Generate image using Hugging Face Inference API."""
         # This would use the Hugging Face Inference API
@@ -154,12 +556,12 @@ class ImageGenerator:
         """Generate a placeholder image with the prompt text."""
         width, height = self._parse_size(size)
         
-        # Create a blank image
-        image = Image.new('RGB', (width, height), color=(240, 240, 240))
-        draw = ImageDraw.Draw(image)
+        # Create a blank canvas and add a background pattern
+        canvas = np.full((height, width, 3), 240, dtype=np.uint8)
+        self._add_background_pattern(canvas)
         
-        # Add background pattern
-        self._add_background_pattern(image, draw)
+        image = Image.fromarray(canvas, 'RGB')
+        draw = ImageDraw.Draw(image)
         
         # Add text
         self._add_text_to_image(image, draw, prompt)
@@ -171,7 +573,8 @@ class ImageGenerator:
         width, height = self._parse_size(size)
         
         # Create a blank image
-        image = Image.new('RGB', (width, height), color=(255, 200, 200))
+        canvas = np.full((height, width, 3), (255, 200, 200), dtype=np.uint8)
+        image = Image.fromarray(canvas, 'RGB')
         draw = ImageDraw.Draw(image)
         
         # Add error text
@@ -179,38 +582,38 @@ class ImageGenerator:
         
         return image
     
-    def _add_background_pattern(self, image, draw):
-        """Add a background pattern to the image."""
-        width, height = image.size
+    def _add_background_pattern(self, canvas):
+        """Paint a background pattern of random ellipses into an RGB canvas array."""
+        height, width = canvas.shape[:2]
         
         # Draw some random shapes for visual interest
-        for _ in range(20):
-            x1 = np.random.randint(0, width)
-            y1 = np.random.randint(0, height)
-            x2 = np.random.randint(0, width)
-            y2 = np.random.randint(0, height)
-            color = (
-                np.random.randint(200, 240),
-                np.random.randint(200, 240)
-            )
-            draw.ellipse([x1, y1, x2, y2], fill=color, outline=None)
+        coords = self._rng.integers(0, [width, height, width, height], size=(20, 4))
+        colors = self._rng.integers(200, 240, size=(20, 3), dtype=np.uint8)
+        
+        xs = np.sort(coords[:, [0, 2]], axis=1)
+        ys = np.sort(coords[:, [1, 3]], axis=1)
+        
+        # Fill each ellipse within its bounding box, in drawing order
+        for (x0, x1), (y0, y1), color in zip(xs, ys, colors):
+            cx, cy = (x0 + x1) / 2, (y0 + y1) / 2
+            rx, ry = max((x1 - x0) / 2, 0.5), max((y1 - y0) / 2, 0.5)
+            dx = (np.arange(x0, x1 + 1) - cx) / rx
+            dy = (np.arange(y0, y1 + 1) - cy) / ry
+            mask = dy[:, None] ** 2 + dx[None, :] ** 2 <= 1
+            canvas[y0:y1 + 1, x0:x1 + 1][mask] = color
     
     def _add_text_to_image(self, image, draw, text, fill=(100, 100, 100)):
         """Add text to the image."""
         width, height = image.size
-        
-        # Try to load a font, fall back to default if not available
-        try:
-            font = ImageFont.truetype("Arial.ttf", 20)
-        except IOError:
-            font = ImageFont.load_default()
+        font_size = 20
+        font = _get_font(font_size)
         
         # Wrap text to fit the image width
         max_width = int(width * 0.8)
-        lines = self._wrap_text(text, font, max_width)
+        lines = self._wrap_text(text, font_size, max_width)
         
         # Calculate text dimensions
-        line_height = font.getsize("A")[1] + 5
+        line_height = _text_size(font_size, "A")[1] + 5
         text_height = line_height * len(lines)
         
         # Position text in the center of the image
@@ -218,29 +621,33 @@ class ImageGenerator:
         
         # Draw each line of text
         for line in lines:
-            line_width = font.getsize(line)[0]
+            line_width = _text_size(font_size, line)[0]
             x_position = (width - line_width) // 2
             draw.text((x_position, y_position), line, font=font, fill=fill)
             y_position += line_height
     
-    def _wrap_text(self, text, font, max_width):
+    def _wrap_text(self, text, font_size, max_width):
         """Wrap text to fit within a specified width."""
         words = text.split()
         lines = []
         current_line = []
+        current_width = 0
+        space_width = _text_size(font_size, " ")[0]
         
         for word in words:
-            # Try adding the word to the current line
-            test_line = " ".join(current_line + [word])
-            line_width = font.getsize(test_line)[0]
+            # Try adding the word to the current line, summing cached word widths
+            word_width = _text_size(font_size, word)[0]
+            line_width = current_width + space_width + word_width if current_line else word_width
             
             if line_width <= max_width:
                 current_line.append(word)
+                current_width = line_width
             else:
                 # Start a new line
                 if current_line:
                     lines.append(" ".join(current_line))
                 current_line = [word]
+                current_width = word_width
         
         # Add the last line
         if current_line:
@@ -278,20 +685,16 @@ class ImageGenerator:
         
         width, height = img_copy.size
         
-        # Try to load a font, fall back to default if not available
-        try:
-            # Try different font sizes based on image size
-            font_size = int(min(width, height) / 15)
-            font = ImageFont.truetype("Arial.ttf", font_size)
-        except IOError:
-            font = ImageFont.load_default()
+        # Scale the font size with the image size
+        font_size = int(min(width, height) / 15)
+        font = _get_font(font_size)
         
         # Wrap text to fit the image width
         max_width = int(width * 0.8)
-        lines = self._wrap_text(text, font, max_width)
+        lines = self._wrap_text(text, font_size, max_width)
         
         # Calculate text dimensions
-        line_height = font.getsize("A")[1] + 5
+        line_height = _text_size(font_size, "A")[1] + 5
         text_height = line_height * len(lines)
         
         # Determine text position
@@ -304,7 +707,7 @@ class ImageGenerator:
         
         # Add a semi-transparent background for text readability
         for line in lines:
-            line_width = font.getsize(line)[0]
+            line_width = _text_size(font_size, line)[0]
             x_position = (width - line_width) // 2
             
             # Draw background rectangle
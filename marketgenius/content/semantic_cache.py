@@ -0,0 +1,119 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Semantic cache for reusing generation results across near-duplicate prompts.
+"""
+
+import threading
+import itertools
+import numpy as np
+from marketgenius.utils.logger import get_logger
+from marketgenius.utils.helpers import LRUCache
+
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:  # pragma: no cover - optional dependency
+    SentenceTransformer = None
+
+logger = get_logger(__name__)
+
+
+class SemanticCache:
+    """Cache that returns results stored for prompts with similar embeddings."""
+
+    def __init__(self, model_name="all-MiniLM-L6-v2", threshold=0.92, maxsize=256):
+        """
+        Initialize the semantic cache.
+
+        Args:
+            model_name: Sentence-transformers model used to embed prompts
+            threshold: Minimum cosine similarity for a cache hit
+            maxsize: Maximum number of cached results
+        """
+        self.model_name = model_name
+        self.threshold = threshold
+        self._encoder = None
+        self._ids = itertools.count()
+        self._lock = threading.Lock()
+
+        # id -> (namespace, normalized embedding, value)
+        self._entries = LRUCache(maxsize=maxsize)
+        # prompt -> embedding, so a lookup followed by a store encodes only once
+        self._embeddings = LRUCache(maxsize=maxsize)
+
+        if SentenceTransformer is None:
+            logger.warning("sentence-transformers not installed; semantic cache disabled")
+
+    @property
+    def enabled(self):
+        """Whether embeddings can be computed."""
+        return SentenceTransformer is not None
+
+    def get(self, prompt, namespace=None):
+        """
+        Find a cached result for a semantically similar prompt.
+
+        Args:
+            prompt: Prompt text
+            namespace: Hashable key that must match exactly (e.g. size/model)
+
+        Returns:
+            Cached value or None
+        """
+        if not self.enabled:
+            return None
+
+        query = self._encode(prompt)
+
+        with self._lock:
+            candidates = [
+                (entry_id, embedding)
+                for entry_id, (entry_namespace, embedding, _) in self._entries.items()
+                if entry_namespace == namespace
+            ]
+            if not candidates:
+                return None
+
+            # Inner product of normalized vectors is cosine similarity
+            scores = np.stack([embedding for _, embedding in candidates]) @ query
+            best = int(np.argmax(scores))
+            if scores[best] < self.threshold:
+                return None
+
+            logger.info(f"Semantic cache hit (similarity {scores[best]:.3f})")
+            return self._entries[candidates[best][0]][2]
+
+    def put(self, prompt, value, namespace=None):
+        """
+        Store a result for a prompt.
+
+        Args:
+            prompt: Prompt text
+            value: Result to cache
+            namespace: Hashable key that must match exactly on lookup
+        """
+        if not self.enabled:
+            return
+
+        embedding = self._encode(prompt)
+        with self._lock:
+            self._entries[next(self._ids)] = (namespace, embedding, value)
+
+    def clear(self):
+        """Remove all cached results."""
+        with self._lock:
+            self._entries.clear()
+            self._embeddings.clear()
+
+    def _encode(self, prompt):
+        """Embed a prompt as a normalized float32 vector."""
+        embedding = self._embeddings.get(prompt)
+        if embedding is None:
+            if self._encoder is None:
+                self._encoder = SentenceTransformer(self.model_name)
+            embedding = np.asarray(
+                self._encoder.encode(prompt, normalize_embeddings=True), dtype=np.float32
+            )
+            self._embeddings[prompt] = embedding
+        return embedding
@@ -8,42 +8,131 @@ MarketGenius 文本生成模組。
 
 import os
 import re
+import asyncio
+import json
+import functools
 import random
 import logging
 import hashlib
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-import openai
+import httpx
+from openai import AsyncOpenAI
 from tenacity import retry, stop_after_attempt, wait_random_exponential
 
 from marketgenius.brand.modeler import BrandLanguageModel
 from marketgenius.brand.voice_keeper import BrandStyleKeeper
+from marketgenius.content.semantic_cache import SemanticCache
 from marketgenius.data.schemas import ContentType, Platform, ContentTone, BrandModel
+from marketgenius.utils.helpers import LRUCache
+
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    _HTTP2_AVAILABLE = False
+
+try:
+    import tiktoken
+except ImportError:  # pragma: no cover - optional dependency
+    tiktoken = None
 
 logger = logging.getLogger(__name__)
 
+# 串流輸出時，每累積此字元數回調一次 on_token
+_STREAM_FLUSH_CHARS = 200
+
+# 生成內容的最大詞元數，以及提示詞預算的安全餘量
+_MAX_COMPLETION_TOKENS = 1500
+_PROMPT_TOKEN_MARGIN = 256
+
+# 主題標籤匹配
+_HASHTAG_RE = re.compile(r'#(\w+)')
+
+# 表情符號匹配（簡化實現 - 實際應使用更完整的表情符號檢測庫）
+_EMOJI_RE = re.compile(
+    "["
+    "\U0001F600-\U0001F64F"  # 表情符號
+    "\U0001F300-\U0001F5FF"  # 符號和象形文字
+    "\U0001F680-\U0001F6FF"  # 交通和地圖
+    "\U0001F700-\U0001F77F"  # 警告符號
+    "\U0001F780-\U0001F7FF"  # 幾何符號
+    "\U0001F800-\U0001F8FF"  # 補充符號和象形文字
+    "\U0001F900-\U0001F9FF"  # 補充符號和象形文字
+    "\U0001FA00-\U0001FA6F"  # 擴展符號和象形文字
+    "\U0001FA70-\U0001FAFF"  # 擴展符號和象形文字
+    "\U00002702-\U000027B0"  # 雜項符號
+    "\U000024C2-\U0001F251" 
+    "]+"
+)
+
+
+@functools.lru_cache(maxsize=4)
+def _get_encoding(model: str):
+    """
+    獲取模型的 tiktoken 編碼器（載入成本較高，因此快取）。
+    
+    Args:
+        model: 模型名稱
+        
+    Returns:
+        編碼器，tiktoken 未安裝時返回 None
+    """
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+@functools.lru_cache(maxsize=8)
+def _get_openai_client(api_key: str) -> AsyncOpenAI:
+    """
+    獲取共用的 OpenAI 非同步客戶端（每個 API 密鑰一個），以重用連接池。
+    
+    Args:
+        api_key: OpenAI API 密鑰
+        
+    Returns:
+        AsyncOpenAI 客戶端
+    """
+    http_client = httpx.AsyncClient(
+        http2=_HTTP2_AVAILABLE,
+        limits=httpx.Limits(max_connections=50, max_keepalive_connections=20)
+    )
+    return AsyncOpenAI(api_key=api_key, http_client=http_client)
+
 
 class TextGenerator:
     """文本內容生成器。"""
     
     def __init__(self, api_key: Optional[str] = None, 
-                 brand_style_keeper: Optional[BrandStyleKeeper] = None):
+                 brand_style_keeper: Optional[BrandStyleKeeper] = None,
+                 semantic_cache: Optional[SemanticCache] = None):
         """
         初始化文本生成器。
         
         Args:
             api_key: OpenAI API 密鑰（如果未提供，則從環境變量獲取）
             brand_style_keeper: 品牌風格保持器實例
+            semantic_cache: 語意快取（可選），重用相似提示詞的生成結果
         """
         self.api_key = api_key or os.environ.get("OPENAI_API_KEY")
+        self._client = None
         if self.api_key:
-            openai.api_key = self.api_key
+            self._client = _get_openai_client(self.api_key)
         else:
             logger.warning("未提供 OpenAI API 密鑰，文本生成可能無法正常工作")
         
         self.brand_style_keeper = brand_style_keeper
+        self.semantic_cache = semantic_cache
         self.model = "gpt-4-turbo"  # 默認使用的語言模型
+        self.context_limit = 128000  # 模型上下文長度（詞元數）
+        
+        # 系統提示詞快取，鍵為 (品牌指紋, 平台, 內容類型)
+        self._system_prompt_cache = LRUCache(maxsize=64)
     
     def set_brand_style_keeper(self, keeper: BrandStyleKeeper) -> None:
         """
@@ -77,7 +166,8 @@ class TextGenerator:
                           include_emoji: bool = False,
                           include_call_to_action: bool = False,
                           reference_content: Optional[str] = None,
-                          additional_instructions: Optional[str] = None) -> Dict[str, Any]:
+                          additional_instructions: Optional[str] = None,
+                          on_token: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
         """
         生成文本內容。
         
@@ -93,6 +183,7 @@ class TextGenerator:
             include_call_to_action: 是否包含號召性用語
             reference_content: 參考內容
             additional_instructions: 額外指示
+            on_token: 串流回調（可選），生成過程中分段接收部分輸出
             
         Returns:
             生成的文本內容
@@ -121,34 +212,103 @@ class TextGenerator:
             additional_instructions
         )
         
+        # 在調用 API 前檢查提示詞長度，超出預算時先截斷參考內容
+        encoding = _get_encoding(self.model)
+        if encoding is not None:
+            # 文本中的特殊詞元字串（如 <|endoftext|>）按普通文本計算，避免 encode 拋出異常
+            encode = functools.partial(encoding.encode, disallowed_special=())
+            budget = self.context_limit - _MAX_COMPLETION_TOKENS - _PROMPT_TOKEN_MARGIN
+            overflow = len(encode(system_prompt)) + len(encode(user_prompt)) - budget
+            
+            if overflow > 0 and reference_content:
+                reference_tokens = encode(reference_content)
+                keep = max(len(reference_tokens) - overflow, 0)
+                logger.warning(f"提示詞超出詞元預算 {overflow} 個，截斷參考內容至 {keep} 個詞元")
+                reference_content = encoding.decode(reference_tokens[:keep])
+                user_prompt = self._create_user_prompt(
+                    topic, 
+                    brand_model,
+                    platform, 
+                    content_type, 
+                    tone, 
+                    target_length, 
+                    include_hashtags, 
+                    include_emoji, 
+                    include_call_to_action,
+                    reference_content,
+                    additional_instructions
+                )
+                overflow = len(encode(system_prompt)) + len(encode(user_prompt)) - budget
+            
+            if overflow > 0:
+                logger.error(f"提示詞超出模型上下文長度 {overflow} 個詞元")
+                return {
+                    "success": False,
+                    "error": "提示詞超出模型上下文長度",
+                    "text": ""
+                }
+        
+        # 檢查語意快取：僅在品牌、平台、類型、語調及生成選項都相同時才比較提示詞相似度，
+        # 主題與額外指示屬於提示詞內容，交由相似度閾值判斷
+        cache_namespace = (
+            brand_model.id, platform, content_type, tone,
+            target_length, include_hashtags, include_emoji, include_call_to_action
+        )
+        if self.semantic_cache:
+            # 嵌入計算較慢，在執行緒中進行以免阻塞事件循環
+            cached_result = await asyncio.to_thread(
+                self.semantic_cache.get, user_prompt, namespace=cache_namespace
+            )
+            if cached_result is not None:
+                # 串流調用方同樣需要收到內容
+                if on_token and cached_result.get("text"):
+                    on_token(cached_result["text"])
+                return cached_result
+        
         try:
             # 調用 API 生成文本
-            response = await openai.ChatCompletion.acreate(
+            stream = await self._client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": user_prompt}
                 ],
                 temperature=0.7,
-                max_tokens=1500,
-                n=1
+                max_tokens=_MAX_COMPLETION_TOKENS,
+                n=1,
+                stream=True
             )
             
-            # 提取生成的文本
-            generated_text = response.choices[0].message.content.strip()
+            # 串流接收生成的文本
+            chunks = []
+            pending = []
+            pending_chars = 0
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                
+                chunks.append(delta)
+                if on_token:
+                    pending.append(delta)
+                    pending_chars += len(delta)
+                    if pending_chars >= _STREAM_FLUSH_CHARS:
+                        on_token("".join(pending))
+                        pending = []
+                        pending_chars = 0
+            
+            if on_token and pending:
+                on_token("".join(pending))
             
-            # 使用品牌風格保持器增強一致性（如果可用）
+            generated_text = "".join(chunks).strip()
+            
+            # 使用品牌風格保持器檢查並在一致性較低時增強（如果可用）
             if self.brand_style_keeper:
-                consistency_check = self.brand_style_keeper.check_consistency(
+                generated_text, style_score, style_suggestions = self.brand_style_keeper.maybe_enhance(
                     generated_text, content_type
                 )
-                
-                # 如果一致性得分較低，嘗試增強
-                if consistency_check["consistency_score"] < 0.7:
-                    logger.debug(f"品牌風格一致性較低 ({consistency_check['consistency_score']}), 嘗試增強")
-                    enhanced_text = self.brand_style_keeper.enhance_consistency(generated_text, content_type)
-                    if len(enhanced_text) > 10:  # 確保增強後的文本有效
-                        generated_text = enhanced_text
             
             # 提取主題標籤（如果有）
             hashtags = self._extract_hashtags(generated_text) if include_hashtags else []
@@ -171,8 +331,13 @@ class TextGenerator:
             }
             
             if self.brand_style_keeper:
-                result["style_consistency"] = consistency_check["consistency_score"]
-                result["style_suggestions"] = consistency_check["suggestions"]
+                result["style_consistency"] = style_score
+                result["style_suggestions"] = style_suggestions
+            
+            if self.semantic_cache:
+                await asyncio.to_thread(
+                    self.semantic_cache.put, user_prompt, result, namespace=cache_namespace
+                )
             
             return result
             
@@ -184,10 +349,65 @@ class TextGenerator:
                 "text": ""
             }
     
+    async def generate_many(self, specs: List[Dict[str, Any]], 
+                           max_concurrency: int = 8) -> List[Dict[str, Any]]:
+        """
+        並行生成多個文本內容。
+        
+        Args:
+            specs: generate_text 的參數字典列表
+            max_concurrency: 同時進行的最大請求數
+            
+        Returns:
+            生成結果列表（順序與 specs 相同）
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def _generate(spec: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.generate_text(**spec)
+        
+        return await asyncio.gather(*(_generate(spec) for spec in specs))
+    
     def _create_system_prompt(self, brand_model: BrandModel, platform: Platform, 
                              content_type: ContentType) -> str:
         """
-        創建系統提示詞。
+        創建系統提示詞（相同品牌、平台與內容類型時重用快取結果）。
+        
+        Args:
+            brand_model: 品牌模型
+            platform: 目標平台
+            content_type: 內容類型
+            
+        Returns:
+            系統提示詞
+        """
+        cache_key = (self._brand_fingerprint(brand_model), platform, content_type)
+        system_prompt = self._system_prompt_cache.get(cache_key)
+        if system_prompt is None:
+            system_prompt = self._build_system_prompt(brand_model, platform, content_type)
+            self._system_prompt_cache[cache_key] = system_prompt
+        return system_prompt
+    
+    @staticmethod
+    def _brand_fingerprint(brand_model: BrandModel) -> str:
+        """
+        計算品牌模型內容的穩定雜湊值（不含時間戳）。
+        
+        Args:
+            brand_model: 品牌模型
+            
+        Returns:
+            雜湊字串
+        """
+        data = brand_model.model_dump(exclude={"created_at", "updated_at"})
+        serialized = json.dumps(data, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.blake2b(serialized.encode("utf-8"), digest_size=16).hexdigest()
+    
+    def _build_system_prompt(self, brand_model: BrandModel, platform: Platform, 
+                            content_type: ContentType) -> str:
+        """
+        構建系統提示詞。
         
         Args:
             brand_model: 品牌模型
@@ -308,7 +528,9 @@ class TextGenerator:
         
         return user_prompt
     
-    def _get_platform_guidelines(self, platform: Platform, content_type: ContentType) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _get_platform_guidelines(platform: Platform, content_type: ContentType) -> str:
         """
         獲取平台特定的內容指南。
         
@@ -378,8 +600,7 @@ class TextGenerator:
             主題標籤列表
         """
         # 使用正則表達式匹配 # 開頭的標籤
-        hashtags = re.findall(r'#(\w+)', text)
-        return hashtags
+        return _HASHTAG_RE.findall(text)
     
     def _count_emoji(self, text: str) -> int:
         """
@@ -391,32 +612,16 @@ class TextGenerator:
         Returns:
             表情符號數量
         """
-        # 簡化實現 - 實際應使用更完整的表情符號檢測庫
-        emoji_pattern = re.compile(
-            "["
-            "\U0001F600-\U0001F64F"  # 表情符號
-            "\U0001F300-\U0001F5FF"  # 符號和象形文字
-            "\U0001F680-\U0001F6FF"  # 交通和地圖
-            "\U0001F700-\U0001F77F"  # 警告符號
-            "\U0001F780-\U0001F7FF"  # 幾何符號
-            "\U0001F800-\U0001F8FF"  # 補充符號和象形文字
-            "\U0001F900-\U0001F9FF"  # 補充符號和象形文字
-            "\U0001FA00-\U0001FA6F"  # 擴展符號和象形文字
-            "\U0001FA70-\U0001FAFF"  # 擴展符號和象形文字
-            "\U00002702-\U000027B0"  # 雜項符號
-            "\U000024C2-\U0001F251" 
-            "]+"
-        )
-        return len(emoji_pattern.findall(text))
+        return sum(1 for _ in _EMOJI_RE.finditer(text))
     
-    def generate_social_media_post(self, 
-                                 topic: str, 
-                                 brand_model: BrandModel,
-                                 platform: Platform,
-                                 tone: Optional[ContentTone] = None,
-                                 reference_content: Optional[str] = None,
-                                 include_hashtags: bool = True,
-                                 include_emoji: bool = True) -> Dict[str, Any]:
+    async def generate_social_media_post(self, 
+                                       topic: str, 
+                                       brand_model: BrandModel,
+                                       platform: Platform,
+                                       tone: Optional[ContentTone] = None,
+                                       reference_content: Optional[str] = None,
+                                       include_hashtags: bool = True,
+                                       include_emoji: bool = True) -> Dict[str, Any]:
         """
         生成社交媒體貼文。
         
@@ -441,7 +646,7 @@ class TextGenerator:
         elif platform == Platform.LINKEDIN:
             target_length = 200
         
-        return self.generate_text(
+        return await self.generate_text(
             topic=topic,
             brand_model=brand_model,
             platform=platform,
@@ -454,13 +659,13 @@ class TextGenerator:
             reference_content=reference_content
         )
     
-    def generate_article(self,
-                       topic: str,
-                       brand_model: BrandModel,
-                       tone: Optional[ContentTone] = None,
-                       target_length: int = 800,
-                       sections: Optional[List[str]] = None,
-                       reference_content: Optional[str] = None) -> Dict[str, Any]:
+    async def generate_article(self,
+                             topic: str,
+                             brand_model: BrandModel,
+                             tone: Optional[ContentTone] = None,
+                             target_length: int = 800,
+                             sections: Optional[List[str]] = None,
+                             reference_content: Optional[str] = None) -> Dict[str, Any]:
         """
         生成文章或部落格貼文。
         
@@ -479,7 +684,7 @@ class TextGenerator:
         if sections:
             additional_instructions = f"請使用以下章節結構:\n" + "\n".join(f"- {section}" for section in sections)
         
-        return self.generate_text(
+        return await self.generate_text(
             topic=topic,
             brand_model=brand_model,
             platform=Platform.LINKEDIN,  # 使用 LinkedIn 作為文章平台
@@ -493,12 +698,12 @@ class TextGenerator:
             additional_instructions=additional_instructions
         )
     
-    def generate_product_description(self,
-                                   product_name: str,
-                                   product_features: List[str],
-                                   brand_model: BrandModel,
-                                   tone: Optional[ContentTone] = None,
-                                   target_length: int = 300) -> Dict[str, Any]:
+    async def generate_product_description(self,
+                                         product_name: str,
+                                         product_features: List[str],
+                                         brand_model: BrandModel,
+                                         tone: Optional[ContentTone] = None,
+                                         target_length: int = 300) -> Dict[str, Any]:
         """
         生成產品描述。
         
@@ -524,7 +729,7 @@ class TextGenerator:
 5. 強烈的號召性用語
         """
         
-        return self.generate_text(
+        return await self.generate_text(
             topic=f"{product_name} 產品描述",
             brand_model=brand_model,
             platform=Platform.FACEBOOK,  # 使用通用平台
@@ -538,12 +743,12 @@ class TextGenerator:
             additional_instructions=additional_instructions
         )
     
-    def generate_captions(self,
-                        image_description: str,
-                        brand_model: BrandModel,
-                        platform: Platform,
-                        tone: Optional[ContentTone] = None,
-                        include_hashtags: bool = True) -> Dict[str, Any]:
+    async def generate_captions(self,
+                              image_description: str,
+                              brand_model: BrandModel,
+                              platform: Platform,
+                              tone: Optional[ContentTone] = None,
+                              include_hashtags: bool = True) -> Dict[str, Any]:
         """
         生成圖像說明文字。
         
@@ -572,7 +777,7 @@ class TextGenerator:
 4. 鼓勵互動和參與
         """
         
-        return self.generate_text(
+        return await self.generate_text(
             topic=f"圖像說明文字",
             brand_model=brand_model,
             platform=platform,
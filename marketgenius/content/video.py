@@ -8,30 +8,291 @@ MarketGenius 影片生成模組。
 
 import os
 import re
+import asyncio
+import functools
 import json
 import logging
 import tempfile
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any, Union
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Any, Union
 from datetime import datetime
 
-import openai
-import requests
-from tenacity import retry, stop_after_attempt, wait_random_exponential
-
-from marketgenius.brand.voice_keeper import BrandStyleKeeper
 from marketgenius.data.schemas import BrandModel, ContentType, Platform, VideoContent
-from marketgenius.content.text import TextGenerator
+
+if TYPE_CHECKING:
+    # 僅用於類型標註，避免導入時載入 openai、nltk 等重量級依賴
+    from marketgenius.brand.voice_keeper import BrandStyleKeeper
+    from marketgenius.content.text import TextGenerator
+
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover - optional dependency
+    _HTTP2_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# 腳本組成部分（標題、描述、腳本內容）的匹配模式
+_TITLE_RE = re.compile(r'#\s*(.*?)(?:\n|$)')
+_DESC_RE = re.compile(r'##\s*影片描述\s*\n(.*?)(?:\n##|\Z)', re.DOTALL)
+_SCRIPT_RE = re.compile(r'##\s*腳本\s*\n(.*?)(?:\Z)', re.DOTALL)
+
+
+def _is_transient_error(exc: BaseException) -> bool:
+    """
+    判斷 OpenAI 錯誤是否為可重試的暫時性錯誤（限流、連接、超時、服務端錯誤）。
+    
+    Args:
+        exc: 捕獲的異常
+        
+    Returns:
+        是否應重試
+    """
+    from openai import APIConnectionError, InternalServerError, RateLimitError
+    return isinstance(exc, (RateLimitError, APIConnectionError, InternalServerError))
+
+
+def _chat_retry():
+    """
+    構建聊天 API 的重試裝飾器；未安裝 tenacity 時不重試。
+    
+    Returns:
+        方法裝飾器
+    """
+    try:
+        from tenacity import retry, retry_if_exception, stop_after_attempt, wait_random_exponential
+    except ImportError:  # pragma: no cover - optional dependency
+        return lambda func: func
+    
+    return retry(
+        wait=wait_random_exponential(min=1, max=60),
+        stop=stop_after_attempt(5),
+        retry=retry_if_exception(_is_transient_error),
+        reraise=True
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _format_style_summary(style_attributes: Tuple[Tuple[str, float], ...], default: str) -> str:
+    """
+    格式化品牌風格屬性摘要。
+    
+    Args:
+        style_attributes: (屬性名稱, 屬性值) 元組
+        default: 無風格屬性時使用的描述
+        
+    Returns:
+        風格摘要文本
+    """
+    if not style_attributes:
+        return default
+    return "; ".join(f"{name}: {value:.1f}/1.0" for name, value in style_attributes)
+
+
+def _style_summary(brand_model: BrandModel, default: str) -> str:
+    """
+    獲取品牌風格屬性摘要（按屬性內容快取）。
+    
+    Args:
+        brand_model: 品牌模型
+        default: 無風格屬性時使用的描述
+        
+    Returns:
+        風格摘要文本
+    """
+    key = tuple((attr.name, attr.value) for attr in brand_model.style_attributes)
+    return _format_style_summary(key, default)
+
+
+def _script_excerpt(script: str, limit: int) -> str:
+    """
+    截取腳本開頭作為摘要，超出長度時加上省略號。
+    
+    Args:
+        script: 影片腳本
+        limit: 最大字元數
+        
+    Returns:
+        腳本摘要
+    """
+    if len(script) <= limit:
+        return script
+    return script[:limit] + "..."
+
+
+@functools.lru_cache(maxsize=None)
+def _get_platform_video_guidelines(platform: Platform) -> str:
+    """
+    獲取平台特定的影片指南。
+    
+    Args:
+        platform: 目標平台
+        
+    Returns:
+        平台影片指南
+    """
+    guidelines = f"{platform.value} 影片指南:\n"
+    
+    if platform == Platform.YOUTUBE:
+        guidelines += """
+- 前 15 秒最為關鍵，應包含吸引人的開場和主題概述
+- 保持節奏適中，每 3-4 分鐘引入新元素以保持觀眾注意力
+- 包含清晰的號召性用語（訂閱、點贊、評論）
+- 標題應引人注目且包含關鍵詞，長度控制在 60 字元以內
+- 在結尾預告下一影片或引導至其他相關內容
+- 考慮添加時間戳，幫助觀眾導航較長的影片
+        """
+    
+    elif platform == Platform.INSTAGRAM:
+        guidelines += """
+- Instagram Feed 影片應保持在 60 秒以內，Reels 可達 90 秒
+- 開場需在前 3 秒吸引注意力
+- 使用動態視覺元素和快節奏內容
+- 設計適合無聲觀看的內容，確保字幕覆蓋關鍵信息
+- 考慮垂直 9:16 的格式，尤其是 Reels
+- 內容應簡潔有力，直接進入主題
+        """
+    
+    elif platform == Platform.FACEBOOK:
+        guidelines += """
+- 開場需在 3-5 秒內吸引注意力，考慮添加引人入勝的問題或陳述
+- 理想長度為 1-3 分鐘，內容豐富但簡明
+- 設計適合無聲觀看的內容，添加清晰的字幕
+- 包含引導分享或評論的號召性用語
+- 考慮觀眾可能在移動設備上觀看的因素
+- 可考慮正方形 1:1 格式以最大化動態消息中的可見性
+        """
+    
+    elif platform == Platform.LINKEDIN:
+        guidelines += """
+- 內容應專業、信息豐富，提供具體價值
+- 理想長度為 1-3 分鐘
+- 使用專業語調，但避免過於正式或充滿行業術語
+- 包含可操作的見解或建議，而非僅僅是宣傳
+- 設計適合辦公環境觀看的內容（考慮無聲觀看）
+- 引用數據、研究或專家觀點以增加可信度
+        """
+    
+    else:
+        guidelines += "- 請遵循一般影片內容最佳實踐，創建簡潔、引人入勝且與平台適配的內容。"
+    
+    return guidelines
+
+
+def _script_brand_key(brand_model: BrandModel) -> Tuple:
+    """
+    將腳本系統提示詞用到的品牌字段轉換為可雜湊的鍵。
+    
+    Args:
+        brand_model: 品牌模型
+        
+    Returns:
+        品牌內容鍵
+    """
+    return (
+        brand_model.name,
+        brand_model.description,
+        brand_model.industry,
+        tuple(brand_model.target_audience or ()),
+        tuple((attr.name, attr.value, attr.description) for attr in brand_model.style_attributes),
+        tuple(brand_model.keywords or ())
+    )
+
+
+@functools.lru_cache(maxsize=512)
+def _build_script_system_prompt(brand_key: Tuple, platform: Platform, 
+                                style: Optional[str] = None) -> str:
+    """
+    構建影片腳本系統提示詞。
+    
+    Args:
+        brand_key: 由 _script_brand_key 生成的品牌內容鍵
+        platform: 目標平台
+        style: 影片風格
+        
+    Returns:
+        系統提示詞
+    """
+    name, description, industry, target_audience, style_attributes, keywords = brand_key
+    
+    # 品牌說明
+    brand_description = f"你是 {name} 的影片腳本撰寫專家。"
+    
+    if description:
+        brand_description += f" {description}"
+    
+    if industry:
+        brand_description += f" 品牌所在行業: {industry}。"
+    
+    # 品牌風格屬性
+    style_instructions = "品牌風格特徵:\n"
+    if style_attributes:
+        for attr_name, attr_value, attr_description in style_attributes:
+            style_instructions += f"- {attr_name}: {attr_value:.1f}/1.0"
+            if attr_description:
+                style_instructions += f" ({attr_description})"
+            style_instructions += "\n"
+    else:
+        style_instructions += "- 未指定特定風格屬性，請保持專業、清晰的風格。\n"
+    
+    # 目標受眾
+    audience_info = ""
+    if target_audience:
+        audience_info = f"目標受眾: {', '.join(target_audience)}。\n"
+    
+    # 風格指南
+    style_guide = ""
+    if style:
+        style_guide = f"""
+影片風格: {style}
+請確保腳本符合這種風格，包括語調、節奏和內容結構。
+        """
+    
+    # 平台特定指南
+    platform_guide = _get_platform_video_guidelines(platform)
+    
+    # 組合系統提示詞
+    system_prompt = f"""
+{brand_description}
+
+{audience_info}
+
+{style_instructions}
+
+關鍵詞和主題:
+{', '.join(keywords) if keywords else '未提供特定關鍵詞'}
+
+{style_guide}
+
+{platform_guide}
+
+你的任務是創建一個專業的影片腳本，該腳本:
+1. 與品牌風格和語調一致
+2. 適合指定的平台和影片風格
+3. 結構清晰，包括開場、主體內容和結尾
+4. 節奏適當，能在指定時間內完成
+5. 包含對視覺元素的引導（如需要）
+6. 具有吸引力，能保持觀眾注意力
+
+請提供完整的腳本，包括:
+- 影片標題
+- 影片描述（如適用）
+- 完整的旁白/對白文本
+- 場景描述和視覺引導（如需要）
+    """
+    
+    return system_prompt.strip()
+
 
 class VideoGenerator:
     """影片內容生成器。"""
     
+    # 默認臨時目錄，首次使用時解析並創建，之後所有實例共用
+    _default_temp_dir: Optional[Path] = None
+    
     def __init__(self, api_key: Optional[str] = None,
-                text_generator: Optional[TextGenerator] = None,
-                brand_style_keeper: Optional[BrandStyleKeeper] = None,
+                text_generator: Optional["TextGenerator"] = None,
+                brand_style_keeper: Optional["BrandStyleKeeper"] = None,
                 temp_dir: Optional[str] = None):
         """
         初始化影片生成器。
@@ -43,19 +304,76 @@ class VideoGenerator:
             temp_dir: 臨時文件目錄
         """
         self.api_key = api_key or os.environ.get("OPENAI_API_KEY")
+        self.client = None
         if self.api_key:
-            openai.api_key = self.api_key
+            import httpx
+            from openai import AsyncOpenAI
+            
+            # 持久化的非同步客戶端，透過 HTTP/2 在同一連接上多路復用並行請求
+            self.client = AsyncOpenAI(
+                api_key=self.api_key,
+                http_client=httpx.AsyncClient(
+                    http2=_HTTP2_AVAILABLE,
+                    limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+                    timeout=httpx.Timeout(60.0, connect=5.0)
+                )
+            )
         else:
             logger.warning("未提供 OpenAI API 密鑰，影片生成可能無法正常工作")
         
         self.text_generator = text_generator
         self.brand_style_keeper = brand_style_keeper
-        self.temp_dir = Path(temp_dir) if temp_dir else Path(tempfile.gettempdir()) / "marketgenius"
-        self.temp_dir.mkdir(parents=True, exist_ok=True)
+        if temp_dir:
+            self.temp_dir = Path(temp_dir)
+            self.temp_dir.mkdir(parents=True, exist_ok=True)
+        else:
+            self.temp_dir = self._get_default_temp_dir()
         
         self.model = "gpt-4-turbo"  # 默認使用的語言模型
     
-    def set_text_generator(self, generator: TextGenerator) -> None:
+    @classmethod
+    def _get_default_temp_dir(cls) -> Path:
+        """
+        獲取（必要時創建）默認臨時目錄。
+        
+        Returns:
+            臨時目錄路徑
+        """
+        if cls._default_temp_dir is None:
+            temp_dir = Path(tempfile.gettempdir()) / "marketgenius"
+            temp_dir.mkdir(parents=True, exist_ok=True)
+            cls._default_temp_dir = temp_dir
+        return cls._default_temp_dir
+    
+    async def aclose(self) -> None:
+        """關閉 OpenAI 客戶端及其連接池。"""
+        if self.client is not None:
+            await self.client.close()
+    
+    @_chat_retry()
+    async def _chat(self, messages: List[Dict[str, str]], *, max_tokens: int, 
+                    temperature: float = 0.7) -> str:
+        """
+        調用聊天 API，僅對暫時性錯誤（限流、連接、超時、服務端錯誤）重試。
+        
+        Args:
+            messages: 對話消息列表
+            max_tokens: 最大生成詞元數
+            temperature: 取樣溫度
+            
+        Returns:
+            生成的文本（已去除首尾空白）
+        """
+        response = await self.client.chat.completions.create(
+            model=self.model,
+            messages=messages,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            n=1
+        )
+        return response.choices[0].message.content.strip()
+    
+    def set_text_generator(self, generator: "TextGenerator") -> None:
         """
         設置文本生成器。
         
@@ -65,7 +383,7 @@ class VideoGenerator:
         self.text_generator = generator
         logger.debug("已設置文本生成器")
     
-    def set_brand_style_keeper(self, keeper: BrandStyleKeeper) -> None:
+    def set_brand_style_keeper(self, keeper: "BrandStyleKeeper") -> None:
         """
         設置品牌風格保持器。
         
@@ -85,7 +403,6 @@ class VideoGenerator:
         self.model = model_name
         logger.debug(f"已設置影片生成模型: {model_name}")
     
-    @retry(wait=wait_random_exponential(min=1, max=60), stop=stop_after_attempt(3))
     async def generate_video_script(self,
                                   topic: str,
                                   brand_model: BrandModel,
@@ -138,20 +455,14 @@ class VideoGenerator:
         
         try:
             # 調用 API 生成腳本
-            response = await openai.ChatCompletion.acreate(
-                model=self.model,
+            generated_script = await self._chat(
                 messages=[
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": user_prompt}
                 ],
-                temperature=0.7,
-                max_tokens=3000,
-                n=1
+                max_tokens=3000
             )
             
-            # 提取生成的腳本
-            generated_script = response.choices[0].message.content.strip()
-            
             # 使用品牌風格保持器檢查一致性（如果可用）
             style_consistency = None
             style_suggestions = None
@@ -222,7 +533,7 @@ class VideoGenerator:
         
         # 使用文本生成器生成描述
         topic = f"{title} 影片描述"
-        reference_content = f"影片標題: {title}\n\n影片腳本摘要: {script[:500]}..." if len(script) > 500 else script
+        reference_content = f"影片標題: {title}\n\n影片腳本摘要: {_script_excerpt(script, 500)}"
         
         additional_instructions = f"""
 請為該影片創建一個引人入勝的描述，適合 {platform.value} 平台，應該:
@@ -266,7 +577,6 @@ class VideoGenerator:
             "timestamp": datetime.now().isoformat()
         }
     
-    @retry(wait=wait_random_exponential(min=1, max=60), stop=stop_after_attempt(3))
     async def _generate_description_internal(self,
                                          title: str,
                                          script: str,
@@ -296,7 +606,7 @@ class VideoGenerator:
 你是 {brand_model.name} 的影片描述專家。你需要為 {platform.value} 平台的影片創建引人入勝且優化的描述。
 
 品牌風格:
-{"; ".join(f"{attr.name}: {attr.value:.1f}/1.0" for attr in brand_model.style_attributes) if brand_model.style_attributes else "專業、清晰的風格"}
+{_style_summary(brand_model, "專業、清晰的風格")}
 
 你的描述應該:
 1. 簡明扼要地介紹影片內容
@@ -312,7 +622,7 @@ class VideoGenerator:
 影片標題: {title}
 
 影片腳本摘要:
-{script[:1000]}{'...' if len(script) > 1000 else ''}
+{_script_excerpt(script, 1000)}
 
 要求:
 - 平台: {platform.value}
@@ -324,20 +634,14 @@ class VideoGenerator:
         
         try:
             # 調用 API 生成描述
-            response = await openai.ChatCompletion.acreate(
-                model=self.model,
+            description = await self._chat(
                 messages=[
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": user_prompt}
                 ],
-                temperature=0.7,
-                max_tokens=1000,
-                n=1
+                max_tokens=1000
             )
             
-            # 提取生成的描述
-            description = response.choices[0].message.content.strip()
-            
             return {
                 "success": True,
                 "description": description,
@@ -383,7 +687,7 @@ class VideoGenerator:
 你是一名專業的影片縮略圖設計專家。你需要創建用於生成吸引人的影片縮略圖的文本提示詞，這些提示詞將用於圖像生成 AI。
 
 品牌風格:
-{"; ".join(f"{attr.name}: {attr.value:.1f}/1.0" for attr in brand_model.style_attributes) if brand_model.style_attributes else "專業、吸引人的風格"}
+{_style_summary(brand_model, "專業、吸引人的風格")}
 
 品牌顏色:
 {f"主色: {brand_model.colors.primary}" if brand_model.colors and brand_model.colors.primary else "無指定顏色方案"}
@@ -403,7 +707,7 @@ class VideoGenerator:
 影片標題: {title}
 
 影片內容摘要:
-{script[:500]}{'...' if len(script) > 500 else ''}
+{_script_excerpt(script, 500)}
 
 你的提示詞應該描述:
 1. 主要視覺元素和構圖
@@ -417,20 +721,14 @@ class VideoGenerator:
         
         try:
             # 調用 API 生成縮略圖提示詞
-            response = await openai.ChatCompletion.acreate(
-                model=self.model,
+            thumbnail_prompt = await self._chat(
                 messages=[
                     {"role": "system", "content": system_prompt},
                     {"role": "user", "content": user_prompt}
                 ],
-                temperature=0.7,
-                max_tokens=500,
-                n=1
+                max_tokens=500
             )
             
-            # 提取生成的提示詞
-            thumbnail_prompt = response.choices[0].message.content.strip()
-            
             return {
                 "success": True,
                 "prompt": thumbnail_prompt,
@@ -446,86 +744,87 @@ class VideoGenerator:
                 "prompt": ""
             }
     
-    def _create_script_system_prompt(self, brand_model: BrandModel, platform: Platform, 
-                                   style: Optional[str] = None) -> str:
+    async def generate_video_bundle(self,
+                                    topic: str,
+                                    brand_model: BrandModel,
+                                    platform: Platform = Platform.YOUTUBE,
+                                    **script_options: Any) -> Dict[str, Any]:
         """
-        創建影片腳本系統提示詞。
+        生成完整的影片內容組合：先生成腳本，再並行生成描述和縮略圖提示詞。
         
         Args:
+            topic: 影片主題
             brand_model: 品牌模型
             platform: 目標平台
-            style: 影片風格
+            **script_options: 傳遞給 generate_video_script 的其他參數
             
         Returns:
-            系統提示詞
+            包含腳本、描述和縮略圖提示詞的結果
         """
-        # 品牌說明
-        brand_description = f"你是 {brand_model.name} 的影片腳本撰寫專家。"
-        
-        if brand_model.description:
-            brand_description += f" {brand_model.description}"
-        
-        if brand_model.industry:
-            brand_description += f" 品牌所在行業: {brand_model.industry}。"
+        script = await self.generate_video_script(topic, brand_model, platform, **script_options)
+        if not script["success"]:
+            return {
+                "success": False,
+                "error": script.get("error"),
+                "script": script,
+                "description": None,
+                "thumbnail": None
+            }
         
-        # 品牌風格屬性
-        style_instructions = "品牌風格特徵:\n"
-        if brand_model.style_attributes:
-            for attr in brand_model.style_attributes:
-                style_instructions += f"- {attr.name}: {attr.value:.1f}/1.0"
-                if attr.description:
-                    style_instructions += f" ({attr.description})"
-                style_instructions += "\n"
-        else:
-            style_instructions += "- 未指定特定風格屬性，請保持專業、清晰的風格。\n"
+        # 描述和縮略圖只依賴腳本，可並行生成
+        description, thumbnail = await asyncio.gather(
+            self.generate_video_description(script["title"], script["script"], brand_model, platform),
+            self.generate_video_thumbnail_prompt(script["title"], script["script"], brand_model)
+        )
         
-        # 目標受眾
-        audience_info = ""
-        if brand_model.target_audience:
-            audience_info = f"目標受眾: {', '.join(brand_model.target_audience)}。\n"
+        return {
+            "success": True,
+            "script": script,
+            "description": description,
+            "thumbnail": thumbnail
+        }
+    
+    async def generate_many(self,
+                            topics: List[str],
+                            brand_model: BrandModel,
+                            platform: Platform = Platform.YOUTUBE,
+                            max_concurrency: int = 4,
+                            **script_options: Any) -> List[Any]:
+        """
+        並行為多個主題生成影片內容組合。
         
-        # 風格指南
-        style_guide = ""
-        if style:
-            style_guide = f"""
-影片風格: {style}
-請確保腳本符合這種風格，包括語調、節奏和內容結構。
-            """
+        Args:
+            topics: 影片主題列表
+            brand_model: 品牌模型
+            platform: 目標平台
+            max_concurrency: 同時生成的最大組合數
+            **script_options: 傳遞給 generate_video_script 的其他參數
+            
+        Returns:
+            與 topics 順序相同的結果列表（出錯的項目為異常對象）
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
         
-        # 平台特定指南
-        platform_guide = self._get_platform_video_guidelines(platform)
+        async def _generate(topic: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.generate_video_bundle(topic, brand_model, platform, **script_options)
         
-        # 組合系統提示詞
-        system_prompt = f"""
-{brand_description}
-
-{audience_info}
-
-{style_instructions}
-
-關鍵詞和主題:
-{', '.join(brand_model.keywords) if brand_model.keywords else '未提供特定關鍵詞'}
-
-{style_guide}
-
-{platform_guide}
-
-你的任務是創建一個專業的影片腳本，該腳本:
-1. 與品牌風格和語調一致
-2. 適合指定的平台和影片風格
-3. 結構清晰，包括開場、主體內容和結尾
-4. 節奏適當，能在指定時間內完成
-5. 包含對視覺元素的引導（如需要）
-6. 具有吸引力，能保持觀眾注意力
-
-請提供完整的腳本，包括:
-- 影片標題
-- 影片描述（如適用）
-- 完整的旁白/對白文本
-- 場景描述和視覺引導（如需要）
+        return await asyncio.gather(*(_generate(topic) for topic in topics), return_exceptions=True)
+    
+    def _create_script_system_prompt(self, brand_model: BrandModel, platform: Platform, 
+                                   style: Optional[str] = None) -> str:
         """
+        創建影片腳本系統提示詞（相同品牌內容、平台與風格時重用快取結果）。
         
-        return system_prompt.strip()
+        Args:
+            brand_model: 品牌模型
+            platform: 目標平台
+            style: 影片風格
+            
+        Returns:
+            系統提示詞
+        """
+        return _build_script_system_prompt(_script_brand_key(brand_model), platform, style)
     
     def _create_script_user_prompt(self,
                                  topic: str,
@@ -595,63 +894,6 @@ class VideoGenerator:
         
         return user_prompt
     
-    def _get_platform_video_guidelines(self, platform: Platform) -> str:
-        """
-        獲取平台特定的影片指南。
-        
-        Args:
-            platform: 目標平台
-            
-        Returns:
-            平台影片指南
-        """
-        guidelines = f"{platform.value} 影片指南:\n"
-        
-        if platform == Platform.YOUTUBE:
-            guidelines += """
-- 前 15 秒最為關鍵，應包含吸引人的開場和主題概述
-- 保持節奏適中，每 3-4 分鐘引入新元素以保持觀眾注意力
-- 包含清晰的號召性用語（訂閱、點贊、評論）
-- 標題應引人注目且包含關鍵詞，長度控制在 60 字元以內
-- 在結尾預告下一影片或引導至其他相關內容
-- 考慮添加時間戳，幫助觀眾導航較長的影片
-            """
-        
-        elif platform == Platform.INSTAGRAM:
-            guidelines += """
-- Instagram Feed 影片應保持在 60 秒以內，Reels 可達 90 秒
-- 開場需在前 3 秒吸引注意力
-- 使用動態視覺元素和快節奏內容
-- 設計適合無聲觀看的內容，確保字幕覆蓋關鍵信息
-- 考慮垂直 9:16 的格式，尤其是 Reels
-- 內容應簡潔有力，直接進入主題
-            """
-        
-        elif platform == Platform.FACEBOOK:
-            guidelines += """
-- 開場需在 3-5 秒內吸引注意力，考慮添加引人入勝的問題或陳述
-- 理想長度為 1-3 分鐘，內容豐富但簡明
-- 設計適合無聲觀看的內容，添加清晰的字幕
-- 包含引導分享或評論的號召性用語
-- 考慮觀眾可能在移動設備上觀看的因素
-- 可考慮正方形 1:1 格式以最大化動態消息中的可見性
-            """
-        
-        elif platform == Platform.LINKEDIN:
-            guidelines += """
-- 內容應專業、信息豐富，提供具體價值
-- 理想長度為 1-3 分鐘
-- 使用專業語調，但避免過於正式或充滿行業術語
-- 包含可操作的見解或建議，而非僅僅是宣傳
-- 設計適合辦公環境觀看的內容（考慮無聲觀看）
-- 引用數據、研究或專家觀點以增加可信度
-            """
-        
-        else:
-            guidelines += "- 請遵循一般影片內容最佳實踐，創建簡潔、引人入勝且與平台適配的內容。"
-        
-        return guidelines
-    
     def _extract_script_components(self, script_text: str) -> Tuple[str, str, str]:
         """
         從生成的腳本文本中提取標題、描述和腳本內容。
@@ -667,17 +909,17 @@ class VideoGenerator:
         script = script_text
         
         # 提取標題
-        title_match = re.search(r'#\s*(.*?)(?:\n|$)', script_text)
+        title_match = _TITLE_RE.search(script_text)
         if title_match:
             title = title_match.group(1).strip()
         
         # 提取描述
-        desc_match = re.search(r'##\s*影片描述\s*\n(.*?)(?:\n##|\Z)', script_text, re.DOTALL)
+        desc_match = _DESC_RE.search(script_text)
         if desc_match:
             description = desc_match.group(1).strip()
         
         # 提取腳本內容
-        script_match = re.search(r'##\s*腳本\s*\n(.*?)(?:\Z)', script_text, re.DOTALL)
+        script_match = _SCRIPT_RE.search(script_text)
         if script_match:
             script = script_match.group(1).strip()
         
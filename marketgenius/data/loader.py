@@ -9,26 +9,61 @@ MarketGenius 數據加載模組。
 import os
 import csv
 import json
+import time
+import asyncio
+import hashlib
 import logging
-import requests
-from typing import Any, Dict, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple, Union
 from pathlib import Path
 
+from marketgenius.utils.helpers import LRUCache
+
+if TYPE_CHECKING:
+    import httpx
+    import requests
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+
+def _loads(data: Union[str, bytes]) -> Any:
+    """解析 JSON 文本或字節（優先使用 orjson）。"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 class DataLoader:
     """數據加載類，處理從各種來源加載數據。"""
     
-    def __init__(self, cache_dir: str = "cache"):
+    def __init__(self, cache_dir: str = "cache", memory_cache_size: int = 1024):
         """
         初始化數據加載器。
         
         Args:
             cache_dir: 緩存目錄路徑
+            memory_cache_size: 進程內緩存的最大條目數
         """
         self.cache_dir = Path(cache_dir)
         self._ensure_cache_directory()
-        self.session = requests.Session()
+        
+        # 進程內緩存，位於磁盤緩存之前，條目為 (獲取時間, 內容)
+        self._memory_cache = LRUCache(maxsize=memory_cache_size)
+        self._session: Optional["requests.Session"] = None
+        self._async_client: Optional["httpx.AsyncClient"] = None
+    
+    @property
+    def session(self) -> "requests.Session":
+        """HTTP 會話，首次使用時才導入 requests 並創建。"""
+        if self._session is None:
+            import requests
+            self._session = requests.Session()
+        return self._session
     
     def _ensure_cache_directory(self) -> None:
         """確保緩存目錄存在。"""
@@ -52,17 +87,41 @@ class DataLoader:
             return []
         
         try:
-            with open(file_path, 'r', newline='', encoding='utf-8') as f:
-                if has_header:
-                    reader = csv.DictReader(f)
-                    return list(reader)
-                else:
-                    reader = csv.reader(f)
-                    return [{"column_" + str(i): cell for i, cell in enumerate(row)} for row in reader]
+            return list(self.stream_csv(file_path, has_header))
         except Exception as e:
             logger.error(f"加載 CSV 文件 {file_path} 時出錯: {e}")
             return []
     
+    def stream_csv(self, file_path: Union[str, Path], has_header: bool = True) -> Iterator[Dict[str, str]]:
+        """
+        逐行讀取 CSV 文件，不一次性載入全部數據。
+        
+        Args:
+            file_path: CSV 文件路徑
+            has_header: 是否有標題行
+            
+        Returns:
+            逐行產生的字典迭代器（與 csv.DictReader 相同：缺少的欄位為 None，多餘的單元格以列表存放在 None 鍵下）
+        """
+        with open(file_path, 'r', newline='', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            if has_header:
+                fieldnames = tuple(next(reader, ()))
+                field_count = len(fieldnames)
+                for row in reader:
+                    if not row:
+                        continue
+                    record = dict(zip(fieldnames, row))
+                    if len(row) > field_count:
+                        record[None] = row[field_count:]
+                    elif len(row) < field_count:
+                        for name in fieldnames[len(row):]:
+                            record[name] = None
+                    yield record
+            else:
+                for row in reader:
+                    yield {"column_" + str(i): cell for i, cell in enumerate(row)}
+    
     def load_json_file(self, file_path: Union[str, Path], default: Any = None) -> Any:
         """
         加載 JSON 文件。
@@ -80,8 +139,8 @@ class DataLoader:
             return default
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(file_path, 'rb') as f:
+                return _loads(f.read())
         except Exception as e:
             logger.error(f"加載 JSON 文件 {file_path} 時出錯: {e}")
             return default
@@ -102,35 +161,109 @@ class DataLoader:
         Returns:
             響應文本或 None（如果請求失敗）
         """
+        return self._fetch(url, params, headers, cache, cache_ttl, binary=False)
+    
+    def _fetch(self, url: str, params: Optional[Dict], headers: Optional[Dict], 
+               cache: bool, cache_ttl: int, binary: bool) -> Optional[Union[str, bytes]]:
+        """
+        從 URL 獲取數據（文本或原始字節），可選緩存。
+        
+        Args:
+            [與 fetch_url 相同的參數]
+            binary: 是否返回原始字節（略過文本解碼）
+            
+        Returns:
+            響應內容或 None（如果請求失敗）
+        """
         cache_key = f"{url}_{str(params)}"
-        cache_path = self.cache_dir / f"{hash(cache_key)}.cache"
+        cache_path = self._cache_path(cache_key)
         
-        # 檢查緩存
-        if cache and cache_path.exists():
-            cache_stat = cache_path.stat()
-            cache_age = os.time() - cache_stat.st_mtime
+        # 檢查緩存（先內存，後磁盤）
+        if cache:
+            content = self._memory_get((cache_key, binary), cache_ttl)
+            if content is not None:
+                return content
             
-            if cache_age < cache_ttl:
-                try:
-                    with open(cache_path, 'r', encoding='utf-8') as f:
-                        logger.debug(f"從緩存加載 URL 數據: {url}")
-                        return f.read()
-                except Exception as e:
-                    logger.warning(f"讀取緩存時出錯: {e}")
+            cached = self._read_cache(cache_path, cache_ttl, binary)
+            if cached is not None:
+                content, cached_at = cached
+                self._memory_cache[(cache_key, binary)] = (cached_at, content)
+                logger.debug(f"從緩存加載 URL 數據: {url}")
+                return content
         
         # 請求 URL
         try:
             response = self.session.get(url, params=params, headers=headers, timeout=30)
             response.raise_for_status()
-            content = response.text
+            content = response.content if binary else response.text
+            
+            # 保存到緩存
+            if cache:
+                self._write_cache(cache_path, content)
+                self._memory_cache[(cache_key, binary)] = (time.time(), content)
+            
+            logger.debug(f"已獲取 URL 數據: {url}")
+            return content
+        except Exception as e:
+            logger.error(f"獲取 URL {url} 時出錯: {e}")
+            return None
+    
+    async def afetch_url(self, url: str, params: Optional[Dict] = None, 
+                         headers: Optional[Dict] = None, cache: bool = True, 
+                         cache_ttl: int = 3600) -> Optional[str]:
+        """
+        非同步從 URL 獲取數據，可選緩存（與 fetch_url 共用緩存）。
+        
+        Args:
+            url: 要請求的 URL
+            params: 請求參數
+            headers: 請求標頭
+            cache: 是否緩存結果
+            cache_ttl: 緩存有效時間（秒）
+            
+        Returns:
+            響應文本或 None（如果請求失敗）
+        """
+        return await self._afetch(url, params, headers, cache, cache_ttl, binary=False)
+    
+    async def _afetch(self, url: str, params: Optional[Dict], headers: Optional[Dict], 
+                      cache: bool, cache_ttl: int, binary: bool) -> Optional[Union[str, bytes]]:
+        """
+        非同步從 URL 獲取數據（文本或原始字節），可選緩存。
+        
+        Args:
+            [與 fetch_url 相同的參數]
+            binary: 是否返回原始字節（略過文本解碼）
+            
+        Returns:
+            響應內容或 None（如果請求失敗）
+        """
+        cache_key = f"{url}_{str(params)}"
+        cache_path = self._cache_path(cache_key)
+        
+        # 檢查緩存（先內存，後磁盤）
+        if cache:
+            content = self._memory_get((cache_key, binary), cache_ttl)
+            if content is not None:
+                return content
+            
+            cached = await asyncio.to_thread(self._read_cache, cache_path, cache_ttl, binary)
+            if cached is not None:
+                content, cached_at = cached
+                self._memory_cache[(cache_key, binary)] = (cached_at, content)
+                logger.debug(f"從緩存加載 URL 數據: {url}")
+                return content
+        
+        # 請求 URL
+        try:
+            response = await self._get_async_client().get(url, params=params, headers=headers)
+            response.raise_for_status()
+            content = response.content if binary else response.text
             
             # 保存到緩存
             if cache:
-                try:
-                    with open(cache_path, 'w', encoding='utf-8') as f:
-                        f.write(content)
-                except Exception as e:
-                    logger.warning(f"寫入緩存時出錯: {e}")
+                await asyncio.to_thread(self._write_cache, cache_path, content)
+                self._memory_cache[(cache_key, binary)] = (time.time(), content)
             
             logger.debug(f"已獲取 URL 數據: {url}")
             return content
@@ -138,6 +271,123 @@ class DataLoader:
             logger.error(f"獲取 URL {url} 時出錯: {e}")
             return None
     
+    async def afetch_many(self, urls: List[str], **kwargs: Any) -> List[Optional[str]]:
+        """
+        並行獲取多個 URL 的數據。
+        
+        Args:
+            urls: URL 列表
+            **kwargs: 傳遞給 afetch_url 的其他參數
+            
+        Returns:
+            與 urls 順序相同的響應文本列表（失敗項為 None）
+        """
+        return await asyncio.gather(*(self.afetch_url(url, **kwargs) for url in urls))
+    
+    async def aclose(self) -> None:
+        """關閉非同步 HTTP 客戶端。"""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
+    
+    def _get_async_client(self) -> "httpx.AsyncClient":
+        """獲取（必要時創建）非同步 HTTP 客戶端。"""
+        if self._async_client is None:
+            import httpx
+            self._async_client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=64),
+                timeout=httpx.Timeout(30.0)
+            )
+        return self._async_client
+    
+    def _memory_get(self, key: Tuple, cache_ttl: int) -> Any:
+        """
+        從進程內緩存讀取未過期的條目。
+        
+        Args:
+            key: 緩存鍵
+            cache_ttl: 緩存有效時間（秒）
+            
+        Returns:
+            緩存內容或 None（如果不存在或已過期）
+        """
+        entry = self._memory_cache.get(key)
+        if entry is not None and time.time() - entry[0] < cache_ttl:
+            return entry[1]
+        return None
+    
+    def _remember_json(self, cache_key: str, data: Any) -> None:
+        """
+        將解析後的 JSON 存入進程內緩存，沿用原始響應的獲取時間。
+        
+        Args:
+            cache_key: 緩存鍵
+            data: 解析後的 JSON 數據
+        """
+        raw_entry = self._memory_cache.get((cache_key, True))
+        fetched_at = raw_entry[0] if raw_entry is not None else time.time()
+        self._memory_cache[(cache_key, "json")] = (fetched_at, data)
+    
+    def _read_cache(self, cache_path: Path, cache_ttl: int, 
+                    binary: bool = False) -> Optional[Tuple[Union[str, bytes], float]]:
+        """
+        讀取未過期的緩存文件。
+        
+        Args:
+            cache_path: 緩存文件路徑
+            cache_ttl: 緩存有效時間（秒）
+            binary: 是否以原始字節讀取
+            
+        Returns:
+            (緩存內容, 文件修改時間) 或 None（如果不存在、已過期或讀取失敗）
+        """
+        try:
+            cached_at = cache_path.stat().st_mtime
+        except OSError:
+            return None
+        
+        if time.time() - cached_at >= cache_ttl:
+            return None
+        
+        try:
+            with open(cache_path, 'rb') as f:
+                data = f.read()
+            return (data if binary else data.decode('utf-8')), cached_at
+        except Exception as e:
+            logger.warning(f"讀取緩存時出錯: {e}")
+            return None
+    
+    def _write_cache(self, cache_path: Path, content: Union[str, bytes]) -> None:
+        """
+        寫入緩存文件。
+        
+        Args:
+            cache_path: 緩存文件路徑
+            content: 緩存內容（文本以 UTF-8 編碼保存）
+        """
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        
+        try:
+            cache_path.parent.mkdir(exist_ok=True)
+            with open(cache_path, 'wb') as f:
+                f.write(content)
+        except Exception as e:
+            logger.warning(f"寫入緩存時出錯: {e}")
+    
+    def _cache_path(self, cache_key: str) -> Path:
+        """
+        獲取緩存鍵對應的緩存文件路徑（跨進程穩定，按雜湊前兩位分目錄存放）。
+        
+        Args:
+            cache_key: 緩存鍵
+            
+        Returns:
+            緩存文件路徑
+        """
+        digest = hashlib.blake2b(cache_key.encode('utf-8'), digest_size=16).hexdigest()
+        return self.cache_dir / digest[:2] / f"{digest[2:]}.cache"
+    
     def fetch_json_api(self, url: str, params: Optional[Dict] = None, 
                       headers: Optional[Dict] = None, cache: bool = True, 
                       cache_ttl: int = 3600) -> Optional[Dict]:
@@ -152,14 +402,58 @@ class DataLoader:
             cache_ttl: 緩存有效時間（秒）
             
         Returns:
-            JSON 數據或 None（如果請求失敗）
+            JSON 數據或 None（如果請求失敗）；命中內存緩存時返回共享對象，請勿修改
         """
-        response_text = self.fetch_url(url, params, headers, cache, cache_ttl)
-        if response_text is None:
+        cache_key = f"{url}_{str(params)}"
+        if cache:
+            data = self._memory_get((cache_key, "json"), cache_ttl)
+            if data is not None:
+                return data
+        
+        response_data = self._fetch(url, params, headers, cache, cache_ttl, binary=True)
+        if response_data is None:
             return None
         
         try:
-            return json.loads(response_text)
+            data = _loads(response_data)
+            if cache:
+                self._remember_json(cache_key, data)
+            return data
+        except Exception as e:
+            logger.error(f"解析 API JSON 響應時出錯: {e}")
+            return None
+    
+    async def afetch_json_api(self, url: str, params: Optional[Dict] = None, 
+                              headers: Optional[Dict] = None, cache: bool = True, 
+                              cache_ttl: int = 3600) -> Optional[Dict]:
+        """
+        非同步從 JSON API 獲取數據。
+        
+        Args:
+            url: API URL
+            params: 請求參數
+            headers: 請求標頭
+            cache: 是否緩存結果
+            cache_ttl: 緩存有效時間（秒）
+            
+        Returns:
+            JSON 數據或 None（如果請求失敗）；命中內存緩存時返回共享對象，請勿修改
+        """
+        cache_key = f"{url}_{str(params)}"
+        if cache:
+            data = self._memory_get((cache_key, "json"), cache_ttl)
+            if data is not None:
+                return data
+        
+        response_data = await self._afetch(url, params, headers, cache, cache_ttl, binary=True)
+        if response_data is None:
+            return None
+        
+        try:
+            data = _loads(response_data)
+            if cache:
+                self._remember_json(cache_key, data)
+            return data
         except Exception as e:
             logger.error(f"解析 API JSON 響應時出錯: {e}")
             return None
@@ -209,6 +503,24 @@ class DataLoader:
             logger.error(f"加載二進制文件 {file_path} 時出錯: {e}")
             return None
     
+    @staticmethod
+    def _read_text_fast(file_path: str) -> str:
+        """
+        以單次二進制讀取加載文本文件。
+        
+        Args:
+            file_path: 文本文件路徑
+            
+        Returns:
+            文件內容，讀取失敗或不是有效 UTF-8 時返回空字符串
+        """
+        try:
+            with open(file_path, 'rb') as f:
+                return f.read().decode('utf-8')
+        except (OSError, UnicodeDecodeError) as e:
+            logger.error(f"加載文本文件 {file_path} 時出錯: {e}")
+            return ""
+    
     def load_brand_samples(self, brand_id: str, sample_dir: Union[str, Path] = "samples") -> List[str]:
         """
         加載品牌樣本內容。
@@ -225,11 +537,13 @@ class DataLoader:
             logger.warning(f"品牌樣本目錄不存在: {sample_path}")
             return []
         
+        with os.scandir(sample_path) as entries:
+            paths = [entry.path for entry in entries if entry.name.endswith(".txt") and entry.is_file()]
+        
         samples = []
-        for file_path in sample_path.glob("*.txt"):
-            content = self.load_text_file(file_path)
-            if content:
-                samples.append(content)
+        if paths:
+            with ThreadPoolExecutor(max_workers=min(16, len(paths))) as executor:
+                samples = [content for content in executor.map(self._read_text_fast, paths) if content]
         
         logger.debug(f"已加載 {len(samples)} 個品牌樣本，品牌 ID: {brand_id}")
         return samples
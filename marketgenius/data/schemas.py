@@ -9,7 +9,14 @@ MarketGenius 數據模式定義。
 import datetime
 from enum import Enum
 from typing import Dict, List, Optional, Union, Any
-from pydantic import BaseModel, Field, validator, HttpUrl
+from pydantic import BaseModel, Field, model_validator, HttpUrl
+
+try:
+    import cython
+    # 以 Cython 編譯時為 True（見 setup.py 的 MARKETGENIUS_CYTHONIZE）
+    compiled: bool = cython.compiled
+except ImportError:  # pragma: no cover - optional dependency
+    compiled = False
 
 
 class Platform(str, Enum):
@@ -52,11 +59,11 @@ class BrandStyleAttribute(BaseModel):
 
 class BrandColors(BaseModel):
     """品牌顏色方案。"""
-    primary: str = Field(..., regex=r'^#[0-9A-Fa-f]{6}$')
-    secondary: Optional[str] = Field(None, regex=r'^#[0-9A-Fa-f]{6}$')
+    primary: str = Field(..., pattern=r'^#[0-9A-Fa-f]{6}$')
+    secondary: Optional[str] = Field(None, pattern=r'^#[0-9A-Fa-f]{6}$')
     accent: Optional[List[str]] = None
-    background: Optional[str] = Field(None, regex=r'^#[0-9A-Fa-f]{6}$')
-    text: Optional[str] = Field(None, regex=r'^#[0-9A-Fa-f]{6}$')
+    background: Optional[str] = Field(None, pattern=r'^#[0-9A-Fa-f]{6}$')
+    text: Optional[str] = Field(None, pattern=r'^#[0-9A-Fa-f]{6}$')
 
 
 class BrandModel(BaseModel):
@@ -72,12 +79,8 @@ class BrandModel(BaseModel):
     fonts: Optional[Dict[str, str]] = None
     logo_url: Optional[str] = None
     created_at: datetime.datetime = Field(default_factory=datetime.datetime.now)
+    # 修改品牌模型時請明確設置 updated_at
     updated_at: datetime.datetime = Field(default_factory=datetime.datetime.now)
-    
-    @validator('updated_at', always=True)
-    def set_updated_at(cls, v, values):
-        """更新時間自動設置為當前時間。"""
-        return datetime.datetime.now()
 
 
 class ContentRequest(BaseModel):
@@ -135,21 +138,21 @@ class ContentItem(BaseModel):
     video_content: Optional[VideoContent] = None
     raw_request: Optional[Dict[str, Any]] = None
     
-    @validator('content_type', 'text_content', 'image_content', 'video_content')
-    def validate_content_consistency(cls, v, values, **kwargs):
+    @model_validator(mode='after')
+    def validate_content_consistency(self) -> "ContentItem":
         """驗證內容類型與內容數據一致性。"""
-        content_type = values.get('content_type')
+        content_type = self.content_type
         
-        if content_type == ContentType.TEXT and 'text_content' not in values:
+        if content_type == ContentType.TEXT and self.text_content is None:
             raise ValueError("文本內容類型必須提供 text_content")
         
-        if content_type == ContentType.IMAGE and 'image_content' not in values:
+        if content_type == ContentType.IMAGE and self.image_content is None:
             raise ValueError("圖像內容類型必須提供 image_content")
         
-        if content_type == ContentType.VIDEO and 'video_content' not in values:
+        if content_type == ContentType.VIDEO and self.video_content is None:
             raise ValueError("視頻內容類型必須提供 video_content")
         
-        return v
+        return self
 
 
 class MetricsData(BaseModel):
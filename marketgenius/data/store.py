@@ -7,14 +7,168 @@ MarketGenius 數據存儲模組。
 """
 
 import os
+import re
+import enum
 import json
+import uuid
+import datetime
+import dataclasses
+import mmap
+import fnmatch
 import pickle
+import struct
 import logging
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# 超過此大小的文件以記憶體映射讀取，避免整份複製到 Python 字節對象
+_MMAP_THRESHOLD = 64 * 1024
+
+# 帶帶外緩衝區的 Pickle 文件格式：
+# 魔數 + 緩衝區數量 n + (n + 1) 個長度 + Pickle 流 + n 個原始緩衝區
+_PICKLE_OOB_MAGIC = b"MGPKL5\x00\x00"
+
+
+def _json_default(obj: Any) -> Any:
+    """標準庫 JSON 的後備序列化，與 orjson 的原生支援保持一致。"""
+    if isinstance(obj, (datetime.datetime, datetime.date, datetime.time)):
+        return obj.isoformat()
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if isinstance(obj, enum.Enum):
+        return obj.value
+    if isinstance(obj, uuid.UUID):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _dumps(data: Any, indent: Optional[int]) -> bytes:
+    """將數據序列化為 UTF-8 JSON 字節（優先使用 orjson）。"""
+    if orjson is not None and indent in (None, 2):
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_DATACLASS
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, option=option)
+    # orjson 只支援 2 格縮進，其他縮進退回標準庫
+    return json.dumps(data, ensure_ascii=False, indent=indent, default=_json_default).encode('utf-8')
+
+
+def _loads(data: Union[bytes, memoryview]) -> Any:
+    """解析 JSON 字節（優先使用 orjson）。"""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = str(data, 'utf-8')
+    return json.loads(data)
+
+
+def _pickle_chunks(data: Any) -> List[Union[bytes, memoryview]]:
+    """
+    以協議 5 序列化數據，大型緩衝區（如 numpy 陣列）以帶外方式輸出。
+    
+    Args:
+        data: 要序列化的數據
+        
+    Returns:
+        依序寫入文件的內容片段
+    """
+    buffers = []
+    stream = pickle.dumps(data, protocol=5, buffer_callback=buffers.append)
+    if not buffers:
+        # 沒有帶外緩衝區時仍是標準 Pickle 文件
+        return [stream]
+    
+    raws = [buffer.raw() for buffer in buffers]
+    lengths = [len(stream)] + [raw.nbytes for raw in raws]
+    header = _PICKLE_OOB_MAGIC + struct.pack(f"<I{len(lengths)}Q", len(raws), *lengths)
+    return [header, stream, *raws]
+
+
+def _unpickle(data: bytearray) -> Any:
+    """
+    解析 Pickle 文件內容，支援帶外緩衝區格式與標準 Pickle 流。
+    
+    Args:
+        data: 文件內容（可寫，以便還原的陣列保持可寫）
+        
+    Returns:
+        反序列化的數據
+        
+    Raises:
+        ValueError: 帶外緩衝區格式的文件頭或長度不一致
+    """
+    if not data.startswith(_PICKLE_OOB_MAGIC):
+        return pickle.loads(data)
+    
+    offset = len(_PICKLE_OOB_MAGIC)
+    (count,) = struct.unpack_from("<I", data, offset)
+    offset += 4
+    if offset + 8 * (count + 1) > len(data):
+        raise ValueError("Pickle 文件頭已損壞或被截斷")
+    lengths = struct.unpack_from(f"<{count + 1}Q", data, offset)
+    offset += 8 * (count + 1)
+    if offset + sum(lengths) != len(data):
+        raise ValueError("Pickle 文件長度與文件頭不符，可能已損壞或被截斷")
+    
+    view = memoryview(data)
+    stream = view[offset:offset + lengths[0]]
+    offset += lengths[0]
+    buffers = []
+    for length in lengths[1:]:
+        buffers.append(view[offset:offset + length])
+        offset += length
+    return pickle.loads(stream, buffers=buffers)
+
+
+@lru_cache(maxsize=64)
+def _compile_pattern(pattern: str) -> "re.Pattern[str]":
+    """將文件名匹配模式編譯為正則表達式。"""
+    return re.compile(fnmatch.translate(pattern))
+
+
+@contextmanager
+def _read_buffer(full_path: Path) -> Iterator[Union[bytes, memoryview]]:
+    """
+    讀取文件內容；大文件以唯讀記憶體映射提供，僅在區塊內有效。
+    
+    Args:
+        full_path: 文件完整路徑
+        
+    Yields:
+        文件內容（bytes 或 memoryview）
+    """
+    with open(full_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+            yield f.read()
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            yield view
+
+
+class BatchWriteError(OSError):
+    """批次寫入時有文件未能寫入或同步。"""
+    
+    def __init__(self, failed_paths: List[Path]):
+        """
+        初始化批次寫入錯誤。
+        
+        Args:
+            failed_paths: 寫入或同步失敗的文件路徑
+        """
+        super().__init__(f"{len(failed_paths)} 個文件批次寫入失敗: {', '.join(str(p) for p in failed_paths)}")
+        self.failed_paths = failed_paths
+
+
 class DataStore:
     """數據存儲類，處理所有數據的保存和加載。"""
     
@@ -26,6 +180,8 @@ class DataStore:
             data_dir: 數據儲存的目錄路徑
         """
         self.data_dir = Path(data_dir)
+        # 每個線程各自的批次寫入佇列，見 batch()
+        self._local = threading.local()
         self._ensure_directories()
     
     def _ensure_directories(self) -> None:
@@ -43,7 +199,115 @@ class DataStore:
             
         logger.debug(f"確保數據目錄存在: {', '.join(str(d) for d in directories)}")
     
-    def save_json(self, data: Any, file_path: Union[str, Path], indent: int = 2) -> bool:
+    @contextmanager
+    def batch(self, fsync: bool = True) -> Iterator["DataStore"]:
+        """
+        批次保存：區塊內的 save_* 呼叫先暫存，離開區塊時一次寫入。
+        
+        所有文件寫完後才統一 fsync，第一次 fsync 之後的同步大多已無需再刷新，
+        比逐個文件寫入並同步快得多。區塊內 save_* 的返回值只表示已暫存；
+        區塊因異常退出時，暫存的內容全部丟棄，不會寫入。
+        
+        Args:
+            fsync: 離開區塊時是否對寫入的文件執行 fsync
+            
+        Yields:
+            數據存儲實例本身
+            
+        Raises:
+            BatchWriteError: 有文件未能寫入或同步（其餘文件仍已寫入）
+        """
+        if getattr(self._local, "pending", None) is not None:
+            # 已在批次中，併入外層批次
+            yield self
+            return
+        
+        self._local.pending = []
+        try:
+            yield self
+        except BaseException:
+            self._local.pending = None
+            logger.warning("批次區塊發生異常，已丟棄暫存的寫入")
+            raise
+        
+        pending, self._local.pending = self._local.pending, None
+        failed_paths = self._flush_batch(pending, fsync)
+        if failed_paths:
+            raise BatchWriteError(failed_paths)
+    
+    def _flush_batch(self, pending: List[tuple], fsync: bool) -> List[Path]:
+        """
+        寫入批次暫存的文件，最後統一 fsync。
+        
+        Args:
+            pending: (文件路徑, 內容) 列表
+            fsync: 是否對寫入的文件執行 fsync
+            
+        Returns:
+            寫入或同步失敗的文件路徑列表
+        """
+        failed_paths = []
+        fds = []
+        try:
+            for full_path, data in pending:
+                try:
+                    fd = os.open(full_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                except OSError as e:
+                    logger.error(f"批次寫入 {full_path} 時出錯: {e}")
+                    failed_paths.append(full_path)
+                    continue
+                try:
+                    view = memoryview(data)
+                    while view:
+                        view = view[os.write(fd, view):]
+                except OSError as e:
+                    logger.error(f"批次寫入 {full_path} 時出錯: {e}")
+                    failed_paths.append(full_path)
+                    os.close(fd)
+                    continue
+                fds.append((full_path, fd))
+            
+            if fsync:
+                for full_path, fd in fds:
+                    try:
+                        os.fsync(fd)
+                    except OSError as e:
+                        logger.error(f"同步文件 {full_path} 時出錯: {e}")
+                        failed_paths.append(full_path)
+        finally:
+            for _, fd in fds:
+                os.close(fd)
+        
+        logger.debug(f"已批次寫入 {len(pending) - len(failed_paths)} 個文件")
+        return failed_paths
+    
+    def _write_bytes(self, full_path: Path, data: Union[bytes, Sequence[Any]],
+                     do_fsync: bool = False) -> None:
+        """
+        寫入文件內容；在 batch() 區塊內則暫存至離開區塊時寫入。
+        
+        Args:
+            full_path: 文件完整路徑
+            data: 要寫入的內容，或依序寫入的多個緩衝區
+            do_fsync: 是否在寫入後立即 fsync（批次中由 batch() 統一處理）
+        """
+        chunks = [data] if isinstance(data, bytes) else data
+        
+        pending = getattr(self._local, "pending", None)
+        if pending is not None:
+            # 合併為快照，避免離開區塊前原數據被修改
+            pending.append((full_path, b"".join(chunks)))
+            return
+        
+        with open(full_path, 'wb') as f:
+            for chunk in chunks:
+                f.write(chunk)
+            if do_fsync:
+                f.flush()
+                os.fsync(f.fileno())
+    
+    def save_json(self, data: Any, file_path: Union[str, Path], indent: int = 2,
+                  do_fsync: bool = False) -> bool:
         """
         將數據保存為JSON文件。
         
@@ -51,14 +315,14 @@ class DataStore:
             data: 要保存的數據
             file_path: 相對於數據目錄的文件路徑
             indent: JSON縮進級別
+            do_fsync: 是否在寫入後立即同步至磁碟
             
         Returns:
-            操作是否成功
+            操作是否成功；在 batch() 區塊內僅表示已暫存，寫入失敗於離開區塊時拋出
         """
         full_path = self.data_dir / file_path
         try:
-            with open(full_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=indent)
+            self._write_bytes(full_path, _dumps(data, indent), do_fsync)
             logger.debug(f"已保存JSON數據至 {full_path}")
             return True
         except Exception as e:
@@ -77,34 +341,35 @@ class DataStore:
             加載的數據或默認值
         """
         full_path = self.data_dir / file_path
-        if not os.path.exists(full_path):
-            logger.warning(f"JSON文件不存在: {full_path}，返回默認值")
-            return default
-        
         try:
-            with open(full_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            with _read_buffer(full_path) as buffer:
+                data = _loads(buffer)
             logger.debug(f"已加載JSON數據從 {full_path}")
             return data
+        except FileNotFoundError:
+            logger.warning(f"JSON文件不存在: {full_path}，返回默認值")
+            return default
         except Exception as e:
             logger.error(f"加載JSON數據從 {full_path} 時出錯: {e}")
             return default
     
-    def save_pickle(self, data: Any, file_path: Union[str, Path]) -> bool:
+    def save_pickle(self, data: Any, file_path: Union[str, Path], do_fsync: bool = False) -> bool:
         """
         將數據保存為Pickle文件（適用於複雜對象）。
         
+        使用協議 5，numpy 陣列等大型緩衝區直接寫入文件，不複製進 Pickle 流。
+        
         Args:
             data: 要保存的數據
             file_path: 相對於數據目錄的文件路徑
+            do_fsync: 是否在寫入後立即同步至磁碟
             
         Returns:
-            操作是否成功
+            操作是否成功；在 batch() 區塊內僅表示已暫存，寫入失敗於離開區塊時拋出
         """
         full_path = self.data_dir / file_path
         try:
-            with open(full_path, 'wb') as f:
-                pickle.dump(data, f)
+            self._write_bytes(full_path, _pickle_chunks(data), do_fsync)
             logger.debug(f"已保存Pickle數據至 {full_path}")
             return True
         except Exception as e:
@@ -123,34 +388,35 @@ class DataStore:
             加載的數據或默認值
         """
         full_path = self.data_dir / file_path
-        if not os.path.exists(full_path):
-            logger.warning(f"Pickle文件不存在: {full_path}，返回默認值")
-            return default
-        
         try:
             with open(full_path, 'rb') as f:
-                data = pickle.load(f)
+                buffer = bytearray(os.fstat(f.fileno()).st_size)
+                f.readinto(buffer)
+            data = _unpickle(buffer)
             logger.debug(f"已加載Pickle數據從 {full_path}")
             return data
+        except FileNotFoundError:
+            logger.warning(f"Pickle文件不存在: {full_path}，返回默認值")
+            return default
         except Exception as e:
             logger.error(f"加載Pickle數據從 {full_path} 時出錯: {e}")
             return default
     
-    def save_text(self, text: str, file_path: Union[str, Path]) -> bool:
+    def save_text(self, text: str, file_path: Union[str, Path], do_fsync: bool = False) -> bool:
         """
         保存文本文件。
         
         Args:
             text: 要保存的文本
             file_path: 相對於數據目錄的文件路徑
+            do_fsync: 是否在寫入後立即同步至磁碟
             
         Returns:
-            操作是否成功
+            操作是否成功；在 batch() 區塊內僅表示已暫存，寫入失敗於離開區塊時拋出
         """
         full_path = self.data_dir / file_path
         try:
-            with open(full_path, 'w', encoding='utf-8') as f:
-                f.write(text)
+            self._write_bytes(full_path, text.encode('utf-8'), do_fsync)
             logger.debug(f"已保存文本數據至 {full_path}")
             return True
         except Exception as e:
@@ -169,15 +435,17 @@ class DataStore:
             加載的文本或默認值
         """
         full_path = self.data_dir / file_path
-        if not os.path.exists(full_path):
-            logger.warning(f"文本文件不存在: {full_path}，返回默認值")
-            return default
-        
         try:
-            with open(full_path, 'r', encoding='utf-8') as f:
-                text = f.read()
+            with _read_buffer(full_path) as buffer:
+                text = str(buffer, 'utf-8')
+            # 與文本模式讀取一致，統一換行符
+            if '\r' in text:
+                text = text.replace('\r\n', '\n').replace('\r', '\n')
             logger.debug(f"已加載文本數據從 {full_path}")
             return text
+        except FileNotFoundError:
+            logger.warning(f"文本文件不存在: {full_path}，返回默認值")
+            return default
         except Exception as e:
             logger.error(f"加載文本數據從 {full_path} 時出錯: {e}")
             return default
@@ -198,7 +466,13 @@ class DataStore:
             logger.warning(f"目錄不存在: {full_dir}")
             return []
         
-        return list(full_dir.glob(pattern))
+        # 含路徑或遞迴的模式仍交給 glob，單層匹配直接掃描目錄
+        if "/" in pattern or os.sep in pattern or "**" in pattern:
+            return list(full_dir.glob(pattern))
+        
+        match = _compile_pattern(pattern).match
+        with os.scandir(full_dir) as entries:
+            return [Path(entry.path) for entry in entries if match(entry.name)]
     
     def delete_file(self, file_path: Union[str, Path]) -> bool:
         """
@@ -211,14 +485,13 @@ class DataStore:
             操作是否成功
         """
         full_path = self.data_dir / file_path
-        if not os.path.exists(full_path):
-            logger.warning(f"要刪除的文件不存在: {full_path}")
-            return False
-        
         try:
             os.remove(full_path)
             logger.debug(f"已刪除文件: {full_path}")
             return True
+        except FileNotFoundError:
+            logger.warning(f"要刪除的文件不存在: {full_path}")
+            return False
         except Exception as e:
             logger.error(f"刪除文件 {full_path} 時出錯: {e}")
             return False
@@ -8,9 +8,6 @@ Main application entry point.
 
 import os
 import argparse
-from marketgenius.ui.app import run_app
-from marketgenius.utils.logger import setup_logging
-from marketgenius.utils.config import load_config
 
 
 def parse_args():
@@ -26,6 +23,10 @@ def main():
     """Main entry point for the application."""
     args = parse_args()
     
+    # Import after argument parsing so --help does not load the UI stack
+    from marketgenius.utils.logger import setup_logging
+    from marketgenius.utils.config import load_config
+    
     # Setup logging
     log_level = "DEBUG" if args.debug else "INFO"
     setup_logging(log_level)
@@ -34,6 +35,7 @@ def main():
     config = load_config(args.config)
     
     # Run the application
+    from marketgenius.ui.app import run_app
     run_app(config, port=args.port, debug=args.debug)
 
 
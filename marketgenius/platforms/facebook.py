@@ -14,6 +14,9 @@ from marketgenius.data.schemas import ContentType, ContentItem, TextContent, Ima
 
 logger = logging.getLogger(__name__)
 
+_HASHTAG_RE = re.compile(r'#(\w+)')
+_MENTION_RE = re.compile(r'@([a-zA-Z0-9._]+)')
+
 
 class FacebookAdapter:
     """Facebook 平台內容適配器。"""
@@ -24,11 +27,18 @@ class FacebookAdapter:
     MAX_TITLE_LENGTH = 100  # 字元數
     MAX_HASHTAGS = 5  # 最佳實踐
     MAX_DESCRIPTION_LENGTH = 5000  # 字元數
-    ALLOWED_IMAGE_FORMATS = [".jpg", ".jpeg", ".png", ".gif"]
+    ALLOWED_IMAGE_FORMATS = (".jpg", ".jpeg", ".png", ".gif")
     
     def __init__(self):
         """初始化 Facebook 適配器。"""
         logger.debug("初始化 Facebook 平台適配器")
+        
+        # 內容類型到適配方法的對應表
+        self._handlers = {
+            ContentType.TEXT: self.adapt_text_content,
+            ContentType.IMAGE: self.adapt_image_content,
+            ContentType.VIDEO: self.adapt_video_content,
+        }
     
     def adapt_content(self, content_item: ContentItem) -> Dict[str, Any]:
         """
@@ -41,19 +51,16 @@ class FacebookAdapter:
             適配後的內容
         """
         # 檢查內容類型並調用相應的適配方法
-        if content_item.content_type == ContentType.TEXT:
-            return self.adapt_text_content(content_item)
-        elif content_item.content_type == ContentType.IMAGE:
-            return self.adapt_image_content(content_item)
-        elif content_item.content_type == ContentType.VIDEO:
-            return self.adapt_video_content(content_item)
-        else:
-            logger.warning(f"不支持的內容類型: {content_item.content_type}")
-            return {
-                "success": False,
-                "error": f"不支持的內容類型: {content_item.content_type}",
-                "content": content_item.dict()
-            }
+        handler = self._handlers.get(content_item.content_type)
+        if handler is not None:
+            return handler(content_item)
+        
+        logger.warning(f"不支持的內容類型: {content_item.content_type}")
+        return {
+            "success": False,
+            "error": f"不支持的內容類型: {content_item.content_type}",
+            "content": content_item.model_dump()
+        }
     
     def adapt_text_content(self, content_item: ContentItem) -> Dict[str, Any]:
         """
@@ -70,14 +77,17 @@ class FacebookAdapter:
             return {
                 "success": False,
                 "error": "缺少文本內容",
-                "content": content_item.dict()
+                "content": content_item.model_dump()
             }
         
         # 取得原始文本
         original_text = content_item.text_content.text
         
-        # 適配文本長度
-        adapted_text = self._adapt_text_length(original_text)
+        # 適配文本長度（絕大多數貼文未超出限制，直接沿用原文）
+        if len(original_text) <= self.MAX_POST_LENGTH:
+            adapted_text = original_text
+        else:
+            adapted_text = self._adapt_text_length(original_text)
         
         # 適配主題標籤
         adapted_text, hashtags = self._adapt_hashtags(adapted_text, content_item.text_content.hashtags)
@@ -85,10 +95,9 @@ class FacebookAdapter:
         # 檢查提及（mentions）格式
         adapted_text = self._adapt_mentions(adapted_text)
         
-        # 更新內容
-        adapted_content = content_item.copy(deep=True)
-        adapted_content.text_content.text = adapted_text
-        adapted_content.text_content.hashtags = hashtags
+        # 更新內容（model_dump() 已建立新的巢狀字典，直接修改無需深拷貝）
+        adapted_content = content_item.model_dump()
+        adapted_content["text_content"].update(text=adapted_text, hashtags=hashtags)
         
         # 添加 Facebook 特定元數據
         metadata = {
@@ -110,7 +119,7 @@ class FacebookAdapter:
         
         return {
             "success": True,
-            "content": adapted_content.dict(),
+            "content": adapted_content,
             "metadata": metadata
         }
     
@@ -129,7 +138,7 @@ class FacebookAdapter:
             return {
                 "success": False,
                 "error": "缺少圖像內容",
-                "content": content_item.dict()
+                "content": content_item.model_dump()
             }
         
         # 適配圖像說明
@@ -143,8 +152,8 @@ class FacebookAdapter:
             image_format_valid, format_message = self._check_image_format(content_item.image_content.image_url)
         
         # 更新內容
-        adapted_content = content_item.copy(deep=True)
-        adapted_content.image_content.caption = adapted_caption
+        adapted_content = content_item.model_dump()
+        adapted_content["image_content"]["caption"] = adapted_caption
         
         # 添加元數據
         metadata = {
@@ -169,7 +178,7 @@ class FacebookAdapter:
         
         return {
             "success": True,
-            "content": adapted_content.dict(),
+            "content": adapted_content,
             "metadata": metadata
         }
     
@@ -188,21 +197,26 @@ class FacebookAdapter:
             return {
                 "success": False,
                 "error": "缺少影片內容",
-                "content": content_item.dict()
+                "content": content_item.model_dump()
             }
         
         # 適配標題長度
         original_title = content_item.video_content.title
-        adapted_title = self._truncate_text(original_title, self.MAX_TITLE_LENGTH)
+        if len(original_title) <= self.MAX_TITLE_LENGTH:
+            adapted_title = original_title
+        else:
+            adapted_title = self._truncate_text(original_title, self.MAX_TITLE_LENGTH)
         
         # 適配描述
         description = content_item.video_content.description or ""
-        adapted_description = self._truncate_text(description, self.MAX_DESCRIPTION_LENGTH)
+        if len(description) <= self.MAX_DESCRIPTION_LENGTH:
+            adapted_description = description
+        else:
+            adapted_description = self._truncate_text(description, self.MAX_DESCRIPTION_LENGTH)
         
         # 更新內容
-        adapted_content = content_item.copy(deep=True)
-        adapted_content.video_content.title = adapted_title
-        adapted_content.video_content.description = adapted_description
+        adapted_content = content_item.model_dump()
+        adapted_content["video_content"].update(title=adapted_title, description=adapted_description)
         
         # 檢查影片長度最佳實踐
         duration_optimal = True
@@ -242,7 +256,7 @@ class FacebookAdapter:
         
         return {
             "success": True,
-            "content": adapted_content.dict(),
+            "content": adapted_content,
             "metadata": metadata
         }
     
@@ -274,16 +288,23 @@ class FacebookAdapter:
         Returns:
             (適配後的文本, 主題標籤列表)
         """
-        # 提取文本中的所有主題標籤
-        hashtag_pattern = r'#(\w+)'
-        text_hashtags = re.findall(hashtag_pattern, text)
+        # 單次掃描提取主題標籤，只記錄位置，需要重組文本時才切片
+        # 文本中沒有 '#' 時不可能匹配，跳過正則掃描
+        matches = list(_HASHTAG_RE.finditer(text)) if '#' in text else []
+        text_hashtags = [match.group(1) for match in matches]
+        
+        # 常見情況：數量未超出且無需合併，直接返回原文
+        if len(text_hashtags) <= self.MAX_HASHTAGS and not existing_hashtags:
+            return text, text_hashtags
         
         # 合併所有主題標籤
-        all_hashtags = []
-        if text_hashtags:
-            all_hashtags.extend(text_hashtags)
+        all_hashtags = list(text_hashtags)
         if existing_hashtags:
-            all_hashtags.extend([tag for tag in existing_hashtags if tag not in all_hashtags])
+            seen = set(all_hashtags)
+            for tag in existing_hashtags:
+                if tag not in seen:
+                    seen.add(tag)
+                    all_hashtags.append(tag)
         
         # 如果超出最佳數量，只保留前幾個
         if len(all_hashtags) > self.MAX_HASHTAGS:
@@ -292,13 +313,17 @@ class FacebookAdapter:
         
         # 如果需要從文本中移除多餘的主題標籤
         if len(text_hashtags) > self.MAX_HASHTAGS:
-            # 移除所有主題標籤
-            text_without_hashtags = re.sub(hashtag_pattern, '', text)
-            # 重新添加前幾個
-            final_text = text_without_hashtags.strip()
-            for tag in all_hashtags:
-                final_text += f" #{tag}"
-            return final_text, all_hashtags
+            # 移除所有主題標籤，重新添加前幾個
+            spans = []
+            pos = 0
+            for match in matches:
+                spans.append(text[pos:match.start()])
+                pos = match.end()
+            spans.append(text[pos:])
+            text_without_hashtags = ''.join(spans)
+            parts = [text_without_hashtags.strip()]
+            parts.extend(f"#{tag}" for tag in all_hashtags)
+            return " ".join(parts), all_hashtags
         
         return text, all_hashtags
     
@@ -314,8 +339,7 @@ class FacebookAdapter:
         """
         # Facebook 使用 @username 格式
         # 確保所有提及都使用正確格式
-        mention_pattern = r'@([a-zA-Z0-9._]+)'
-        mentions = re.findall(mention_pattern, text)
+        mentions = _MENTION_RE.findall(text) if '@' in text else []
         
         # 現在 Facebook 的提及格式已經是 @username，所以不需要額外處理
         # 但這裡保留此方法以便未來需要時擴展
@@ -337,7 +361,7 @@ class FacebookAdapter:
         
         # 檢查文件擴展名
         lower_url = image_url.lower()
-        valid_format = any(lower_url.endswith(fmt) for fmt in self.ALLOWED_IMAGE_FORMATS)
+        valid_format = lower_url.endswith(self.ALLOWED_IMAGE_FORMATS)
         
         if not valid_format:
             return False, f"圖像格式可能不受支持，Facebook 支持: {', '.join(self.ALLOWED_IMAGE_FORMATS)}"
@@ -14,6 +14,8 @@ from marketgenius.data.schemas import ContentType, ContentItem, TextContent, Ima
 
 logger = logging.getLogger(__name__)
 
+_HASHTAG_RE = re.compile(r'#(\w+)')
+
 
 class InstagramAdapter:
     """Instagram 平台內容適配器。"""
@@ -23,11 +25,18 @@ class InstagramAdapter:
     IDEAL_CAPTION_LENGTH = 150  # 單詞數上限，最佳實踐
     MAX_HASHTAGS = 30  # 技術上限
     OPTIMAL_HASHTAGS = 11  # 最佳實踐數量
-    ALLOWED_IMAGE_FORMATS = [".jpg", ".jpeg", ".png"]
+    ALLOWED_IMAGE_FORMATS = (".jpg", ".jpeg", ".png")
     MAX_VIDEO_LENGTH_SECONDS = 90  # Reels 影片
     MAX_FEED_VIDEO_SECONDS = 60  # Feed 影片
     ALLOWED_ASPECT_RATIOS = ["1:1", "4:5", "16:9"]  # 方形、垂直、橫向
     
+    # (比例值, 名稱, 允許誤差, 有效時的消息)，順序與 ALLOWED_ASPECT_RATIOS 一致
+    _RATIO_TABLE = (
+        (1.0, "1:1", 0.05, "方形比例 (1:1) 適合 Instagram"),
+        (0.8, "4:5", 0.05, "縱向比例 (4:5) 適合 Instagram"),
+        (16 / 9, "16:9", 0.1, "橫向比例 (16:9) 適合 Instagram"),
+    )
+    
     def __init__(self):
         """初始化 Instagram 適配器。"""
         logger.debug("初始化 Instagram 平台適配器")
@@ -55,7 +64,7 @@ class InstagramAdapter:
             return {
                 "success": False,
                 "error": f"不支持的內容類型: {content_item.content_type}",
-                "content": content_item.dict()
+                "content": content_item.model_dump()
             }
     
     def adapt_to_caption(self, content_item: ContentItem) -> Dict[str, Any]:
@@ -68,12 +77,15 @@ class InstagramAdapter:
         Returns:
             轉換為圖像說明的內容
         """
+        # 序列化一次，錯誤返回與適配結果共用
+        content_dict = content_item.model_dump()
+        
         if not content_item.text_content:
             logger.error("內容項目缺少文本內容")
             return {
                 "success": False,
                 "error": "缺少文本內容",
-                "content": content_item.dict()
+                "content": content_dict
             }
         
         # 取得原始文本
@@ -88,19 +100,19 @@ class InstagramAdapter:
         # 檢查提及（mentions）格式
         adapted_caption = self._adapt_mentions(adapted_caption)
         
-        # 創建新的圖像內容項目
-        adapted_content = content_item.copy(deep=True)
-        adapted_content.content_type = ContentType.IMAGE
+        # 創建新的圖像內容（直接修改 model_dump() 的結果，無需深拷貝模型）
+        adapted_content = content_dict
+        adapted_content["content_type"] = ContentType.IMAGE
         
         # 建立圖像內容
-        if not adapted_content.image_content:
-            adapted_content.image_content = ImageContent(
+        if not adapted_content["image_content"]:
+            adapted_content["image_content"] = ImageContent(
                 prompt="根據圖像說明生成圖像",
                 caption=adapted_caption,
-                alt_text=f"由 {adapted_content.brand_id} 創建的圖像"
-            )
+                alt_text=f"由 {content_item.brand_id} 創建的圖像"
+            ).model_dump()
         else:
-            adapted_content.image_content.caption = adapted_caption
+            adapted_content["image_content"]["caption"] = adapted_caption
         
         # 添加元數據
         metadata = {
@@ -129,7 +141,7 @@ class InstagramAdapter:
         
         return {
             "success": True,
-            "content": adapted_content.dict(),
+            "content": adapted_content,
             "metadata": metadata
         }
     
@@ -143,12 +155,15 @@ class InstagramAdapter:
         Returns:
             適配後的圖像內容
         """
+        # 序列化一次，錯誤返回與適配結果共用
+        content_dict = content_item.model_dump()
+        
         if not content_item.image_content:
             logger.error("內容項目缺少圖像內容")
             return {
                 "success": False,
                 "error": "缺少圖像內容",
-                "content": content_item.dict()
+                "content": content_dict
             }
         
         # 適配圖像說明
@@ -165,8 +180,8 @@ class InstagramAdapter:
             image_format_valid, format_message = self._check_image_format(content_item.image_content.image_url)
         
         # 更新內容
-        adapted_content = content_item.copy(deep=True)
-        adapted_content.image_content.caption = adapted_caption
+        adapted_content = content_dict
+        adapted_content["image_content"]["caption"] = adapted_caption
         
         # 添加元數據
         metadata = {
@@ -197,7 +212,7 @@ class InstagramAdapter:
         
         return {
             "success": True,
-            "content": adapted_content.dict(),
+            "content": adapted_content,
             "metadata": metadata
         }
     
@@ -211,12 +226,15 @@ class InstagramAdapter:
         Returns:
             適配後的影片內容
         """
+        # 序列化一次，錯誤返回與適配結果共用
+        content_dict = content_item.model_dump()
+        
         if not content_item.video_content:
             logger.error("內容項目缺少影片內容")
             return {
                 "success": False,
                 "error": "缺少影片內容",
-                "content": content_item.dict()
+                "content": content_dict
             }
         
         # 取得描述並適配
@@ -227,8 +245,8 @@ class InstagramAdapter:
         adapted_description, hashtags = self._adapt_hashtags(adapted_description, None)
         
         # 更新內容
-        adapted_content = content_item.copy(deep=True)
-        adapted_content.video_content.description = adapted_description
+        adapted_content = content_dict
+        adapted_content["video_content"]["description"] = adapted_description
         
         # 檢查影片長度
         duration_valid = True
@@ -267,7 +285,7 @@ class InstagramAdapter:
         
         return {
             "success": True,
-            "content": adapted_content.dict(),
+            "content": adapted_content,
             "metadata": metadata
         }
     
@@ -299,9 +317,9 @@ class InstagramAdapter:
         Returns:
             (適配後的文本, 主題標籤列表)
         """
-        # 提取文本中的所有主題標籤
-        hashtag_pattern = r'#(\w+)'
-        text_hashtags = re.findall(hashtag_pattern, text)
+        # 單次掃描提取主題標籤，保留匹配位置供重組文本使用
+        matches = list(_HASHTAG_RE.finditer(text))
+        text_hashtags = [match.group(1) for match in matches]
         
         # 合併所有主題標籤
         all_hashtags = []
@@ -318,9 +336,14 @@ class InstagramAdapter:
         # 對於 Instagram，通常建議將所有主題標籤放在說明末尾
         # 如果文本中有分散的主題標籤，重新組織它們
         if text_hashtags and len(text_hashtags) > 3:
-            # 移除文本中的所有主題標籤
-            text_without_hashtags = re.sub(hashtag_pattern, '', text)
-            text_without_hashtags = text_without_hashtags.strip()
+            # 移除文本中的所有主題標籤（沿用掃描結果，不再重新匹配）
+            parts = []
+            last_end = 0
+            for match in matches:
+                parts.append(text[last_end:match.start()])
+                last_end = match.end()
+            parts.append(text[last_end:])
+            text_without_hashtags = ''.join(parts).strip()
             
             # 將主題標籤集中到末尾
             hashtag_text = " ".join([f"#{tag}" for tag in all_hashtags])
@@ -345,14 +368,8 @@ class InstagramAdapter:
         Returns:
             適配後的文本
         """
-        # Instagram 使用 @username 格式
-        # 確保所有提及都使用正確格式
-        mention_pattern = r'@([a-zA-Z0-9._]+)'
-        mentions = re.findall(mention_pattern, text)
-        
-        # 現在 Instagram 的提及格式已經是 @username，所以不需要額外處理
-        # 但這裡保留此方法以便未來需要時擴展
-        
+        # Instagram 使用 @username 格式，與生成內容的格式一致，目前不需要額外處理
+        # TODO: 需要規範化提及格式時在此擴展
         return text
     
     def _check_image_format(self, image_url: str) -> Tuple[bool, str]:
@@ -370,7 +387,7 @@ class InstagramAdapter:
         
         # 檢查文件擴展名
         lower_url = image_url.lower()
-        valid_format = any(lower_url.endswith(fmt) for fmt in self.ALLOWED_IMAGE_FORMATS)
+        valid_format = lower_url.endswith(self.ALLOWED_IMAGE_FORMATS)
         
         if not valid_format:
             return False, f"圖像格式可能不受支持，Instagram 支持: {', '.join(self.ALLOWED_IMAGE_FORMATS)}"
@@ -391,27 +408,15 @@ class InstagramAdapter:
         # 計算比例
         ratio = width / height
         
-        # 檢查是否接近標準比例
-        square_ratio = 1.0  # 1:1
-        portrait_ratio = 0.8  # 4:5
-        landscape_ratio = 16/9  # 16:9
-        
-        # 找到最接近的標準比例
-        ratios = [square_ratio, portrait_ratio, landscape_ratio]
-        ratio_names = ["1:1", "4:5", "16:9"]
-        differences = [abs(ratio - r) for r in ratios]
-        closest_index = differences.index(min(differences))
-        closest_ratio = ratio_names[closest_index]
+        # 單次掃描找到最接近的標準比例
+        target, closest_ratio, tolerance, message = min(
+            self._RATIO_TABLE, key=lambda entry: abs(ratio - entry[0])
+        )
         
         # 檢查是否在允許的範圍內
-        if closest_index == 0 and abs(ratio - square_ratio) < 0.05:
-            return True, "方形比例 (1:1) 適合 Instagram", closest_ratio
-        elif closest_index == 1 and abs(ratio - portrait_ratio) < 0.05:
-            return True, "縱向比例 (4:5) 適合 Instagram", closest_ratio
-        elif closest_index == 2 and abs(ratio - landscape_ratio) < 0.1:
-            return True, "橫向比例 (16:9) 適合 Instagram", closest_ratio
-        else:
-            return False, f"比例 {width}:{height} 不是 Instagram 推薦的比例，最接近 {closest_ratio}", closest_ratio
+        if abs(ratio - target) < tolerance:
+            return True, message, closest_ratio
+        return False, f"比例 {width}:{height} 不是 Instagram 推薦的比例，最接近 {closest_ratio}", closest_ratio
     
     def _truncate_text(self, text: str, max_length: int) -> str:
         """
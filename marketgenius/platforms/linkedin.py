@@ -28,7 +28,7 @@ class LinkedInAdapter:
     MAX_DESCRIPTION_LENGTH = 2000  # 字元數
     OPTIMAL_HASHTAGS = 5  # 最佳實踐數量（3-5 個）
     MAX_HASHTAGS = 10  # 技術上沒有限制，但超過 10 個會影響可讀性
-    ALLOWED_IMAGE_FORMATS = [".jpg", ".jpeg", ".png", ".gif"]
+    ALLOWED_IMAGE_FORMATS = (".jpg", ".jpeg", ".png", ".gif")
     MAX_VIDEO_LENGTH_SECONDS = 600  # 10 分鐘
     IDEAL_VIDEO_LENGTH_SECONDS = 180  # 3 分鐘（最佳實踐）
     
@@ -58,7 +58,7 @@ class LinkedInAdapter:
             return {
                 "success": False,
                 "error": f"不支持的內容類型: {content_item.content_type}",
-                "content": content_item.dict()
+                "content": content_item.model_dump()
             }
     
     def adapt_text_content(self, content_item: ContentItem) -> Dict[str, Any]:
@@ -76,7 +76,7 @@ class LinkedInAdapter:
             return {
                 "success": False,
                 "error": "缺少文本內容",
-                "content": content_item.dict()
+                "content": content_item.model_dump()
             }
         
         # 取得原始文本
@@ -99,9 +99,9 @@ class LinkedInAdapter:
         adapted_text = self._adapt_mentions(adapted_text)
         
         # 更新內容
-        adapted_content = content_item.copy(deep=True)
-        adapted_content.text_content.text = adapted_text
-        adapted_content.text_content.hashtags = hashtags
+        adapted_content = content_item.model_copy(update={
+            "text_content": content_item.text_content.model_copy(update={"text": adapted_text, "hashtags": hashtags})
+        })
         
         # 添加 LinkedIn 特定元數據
         metadata = {
@@ -134,7 +134,7 @@ class LinkedInAdapter:
         
         return {
             "success": True,
-            "content": adapted_content.dict(),
+            "content": adapted_content.model_dump(),
             "metadata": metadata
         }
     
@@ -153,7 +153,7 @@ class LinkedInAdapter:
             return {
                 "success": False,
                 "error": "缺少圖像內容",
-                "content": content_item.dict()
+                "content": content_item.model_dump()
             }
         
         # 適配圖像說明
@@ -177,8 +177,9 @@ class LinkedInAdapter:
             image_format_valid, format_message = self._check_image_format(content_item.image_content.image_url)
         
         # 更新內容
-        adapted_content = content_item.copy(deep=True)
-        adapted_content.image_content.caption = adapted_caption
+        adapted_content = content_item.model_copy(update={
+            "image_content": content_item.image_content.model_copy(update={"caption": adapted_caption})
+        })
         
         # 添加元數據
         metadata = {
@@ -212,7 +213,7 @@ class LinkedInAdapter:
         
         return {
             "success": True,
-            "content": adapted_content.dict(),
+            "content": adapted_content.model_dump(),
             "metadata": metadata
         }
     
@@ -231,7 +232,7 @@ class LinkedInAdapter:
             return {
                 "success": False,
                 "error": "缺少影片內容",
-                "content": content_item.dict()
+                "content": content_item.model_dump()
             }
         
         # 適配標題長度
@@ -246,9 +247,11 @@ class LinkedInAdapter:
         adapted_description, hashtags = self._adapt_hashtags(adapted_description, None)
         
         # 更新內容
-        adapted_content = content_item.copy(deep=True)
-        adapted_content.video_content.title = adapted_title
-        adapted_content.video_content.description = adapted_description
+        adapted_content = content_item.model_copy(update={
+            "video_content": content_item.video_content.model_copy(
+                update={"title": adapted_title, "description": adapted_description}
+            )
+        })
         
         # 檢查影片長度
         duration_valid = True
@@ -293,7 +296,7 @@ class LinkedInAdapter:
         
         return {
             "success": True,
-            "content": adapted_content.dict(),
+            "content": adapted_content.model_dump(),
             "metadata": metadata
         }
     
@@ -398,7 +401,7 @@ class LinkedInAdapter:
         
         # 檢查文件擴展名
         lower_url = image_url.lower()
-        valid_format = any(lower_url.endswith(fmt) for fmt in self.ALLOWED_IMAGE_FORMATS)
+        valid_format = lower_url.endswith(self.ALLOWED_IMAGE_FORMATS)
         
         if not valid_format:
             return False, f"圖像格式可能不受支持，LinkedIn 支持: {', '.join(self.ALLOWED_IMAGE_FORMATS)}"
@@ -60,7 +60,7 @@ class YouTubeAdapter:
             return {
                 "success": False,
                 "error": f"YouTube 主要支持影片內容，其他類型可能需要轉換: {content_item.content_type}",
-                "content": content_item.dict()
+                "content": content_item.model_dump()
             }
     
     def adapt_video_content(self, content_item: ContentItem) -> Dict[str, Any]:
@@ -78,7 +78,7 @@ class YouTubeAdapter:
             return {
                 "success": False,
                 "error": "缺少影片內容",
-                "content": content_item.dict()
+                "content": content_item.model_dump()
             }
         
         # 適配標題
@@ -93,9 +93,11 @@ class YouTubeAdapter:
         tags = self._extract_tags(adapted_description, original_title)
         
         # 更新內容
-        adapted_content = content_item.copy(deep=True)
-        adapted_content.video_content.title = adapted_title
-        adapted_content.video_content.description = adapted_description
+        adapted_content = content_item.model_copy(update={
+            "video_content": content_item.video_content.model_copy(
+                update={"title": adapted_title, "description": adapted_description}
+            )
+        })
         
         # 檢查影片長度
         duration_recommendation = ""
@@ -160,7 +162,7 @@ class YouTubeAdapter:
         
         return {
             "success": True,
-            "content": adapted_content.dict(),
+            "content": adapted_content.model_dump(),
             "metadata": metadata
         }
     
@@ -179,7 +181,7 @@ class YouTubeAdapter:
             return {
                 "success": False,
                 "error": "缺少文本內容",
-                "content": content_item.dict()
+                "content": content_item.model_dump()
             }
         
         # 取得原始文本
@@ -191,22 +193,24 @@ class YouTubeAdapter:
         # 提取標籤
         tags = self._extract_tags(adapted_description, "")
         
-        # 創建新的影片內容項目
-        adapted_content = content_item.copy(deep=True)
-        adapted_content.content_type = ContentType.VIDEO
-        
         # 建立影片內容
-        if not adapted_content.video_content:
+        if not content_item.video_content:
             # 從文本創建合適的標題
             title = self._generate_title_from_text(original_text)
             
-            adapted_content.video_content = VideoContent(
+            video_content = VideoContent(
                 title=title,
                 description=adapted_description,
                 script="[需要提供影片腳本]"
             )
         else:
-            adapted_content.video_content.description = adapted_description
+            video_content = content_item.video_content.model_copy(update={"description": adapted_description})
+        
+        # 創建新的影片內容項目
+        adapted_content = content_item.model_copy(update={
+            "content_type": ContentType.VIDEO,
+            "video_content": video_content
+        })
         
         # 添加元數據
         metadata = {
@@ -241,7 +245,7 @@ class YouTubeAdapter:
         
         return {
             "success": True,
-            "content": adapted_content.dict(),
+            "content": adapted_content.model_dump(),
             "metadata": metadata
         }
     
@@ -260,12 +264,11 @@ class YouTubeAdapter:
             return {
                 "success": False,
                 "error": "缺少圖像內容",
-                "content": content_item.dict()
+                "content": content_item.model_dump()
             }
         
         # 創建新的影片內容項目
-        adapted_content = content_item.copy(deep=True)
-        adapted_content.content_type = ContentType.VIDEO
+        adapted_content = content_item.model_copy(update={"content_type": ContentType.VIDEO})
         
         # 取得圖像 URL 或提示詞
         image_url = content_item.image_content.image_url
@@ -275,13 +278,15 @@ class YouTubeAdapter:
         caption = content_item.image_content.caption or ""
         title = self._generate_title_from_text(caption) if caption else "影片標題"
         
-        # 建立影片內容
+        # 建立影片內容（現有影片內容先複製，避免修改原項目）
         if not adapted_content.video_content:
             adapted_content.video_content = VideoContent(
                 title=title,
                 description="[需要提供影片描述]",
                 script="[需要提供影片腳本]"
             )
+        else:
+            adapted_content.video_content = adapted_content.video_content.model_copy()
         
         # 設置縮略圖信息
         if image_url:
@@ -315,7 +320,7 @@ class YouTubeAdapter:
         
         return {
             "success": True,
-            "content": adapted_content.dict(),
+            "content": adapted_content.model_dump(),
             "metadata": metadata
         }
     
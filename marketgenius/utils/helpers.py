@@ -0,0 +1,45 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+General helper utilities for the MarketGenius application.
+"""
+
+import threading
+from collections import OrderedDict
+
+
+class LRUCache(OrderedDict):
+    """Thread-safe dictionary that evicts its least recently used entries beyond `maxsize`."""
+
+    def __init__(self, maxsize=128):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries to keep
+        """
+        self._lock = threading.RLock()
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __getitem__(self, key):
+        with self._lock:
+            value = super().__getitem__(key)
+            self.move_to_end(key)
+            return value
+
+    def __setitem__(self, key, value):
+        with self._lock:
+            if key in self:
+                self.move_to_end(key)
+            super().__setitem__(key, value)
+            while len(self) > self.maxsize:
+                self.popitem(last=False)
+
+    def get(self, key, default=None):
+        """Return the value for key (marking it recently used) or default."""
+        with self._lock:
+            if key in self:
+                return self[key]
+            return default
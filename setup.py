@@ -0,0 +1,52 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+MarketGenius 安裝腳本。
+
+設置環境變數 MARKETGENIUS_CYTHONIZE=1 時，會以 Cython 編譯熱點模組；
+未安裝 Cython 或未啟用時，照常安裝純 Python 版本。
+"""
+
+import os
+import warnings
+from setuptools import setup, find_packages
+
+# 以 Cython 編譯的熱點模組（原始 .py 仍會一併安裝作為後備）
+CYTHON_MODULES = [
+    "marketgenius/data/schemas.py",
+]
+
+
+def _ext_modules():
+    """在啟用且可用時返回 Cython 擴展模組。"""
+    if os.environ.get("MARKETGENIUS_CYTHONIZE") != "1":
+        return []
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        warnings.warn("未安裝 Cython，將安裝純 Python 版本")
+        return []
+    return cythonize(CYTHON_MODULES, language_level=3)
+
+
+def _read_requirements(path):
+    """讀取依賴文件，略過空行、註解與 -r 引用。"""
+    with open(path, encoding="utf-8") as f:
+        return [
+            line.strip() for line in f
+            if line.strip() and not line.startswith(("#", "-"))
+        ]
+
+
+setup(
+    name="marketgenius",
+    version="0.1.0",
+    description="中小企業的智慧行銷助理",
+    packages=find_packages(exclude=["examples", "examples.*", "tests", "tests.*"]),
+    python_requires=">=3.9",
+    install_requires=_read_requirements("requirements.txt"),
+    extras_require={"dev": _read_requirements("requirements-dev.txt")},
+    ext_modules=_ext_modules(),
+    zip_safe=False,
+)
@@ -0,0 +1,59 @@
+import pytest
+
+nltk = pytest.importorskip("nltk")
+pytest.importorskip("sklearn")
+
+from marketgenius.brand import analyzer  # noqa: E402
+from marketgenius.brand.analyzer import _tokenize_one  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Hello there. How are you?",
+        "Hello there. How are you?  ",
+        "  Hello there.   How are you?\n",
+        "Hello there. How are you? 123 !!",
+    ],
+)
+def test_tokenize_one_drops_empty_sentences(text):
+    assert _tokenize_one(text) == [["Hello", "there"], ["How", "are", "you"]]
+
+
+@pytest.mark.parametrize("text", ["", "   ", "?!", "42."])
+def test_tokenize_one_without_words(text):
+    assert _tokenize_one(text) == []
+
+
+def test_parallel_tokenization_reuses_the_worker_pool(monkeypatch):
+    monkeypatch.setattr(analyzer.os, "cpu_count", lambda: 2)
+    brand_analyzer = analyzer.BrandAnalyzer.__new__(analyzer.BrandAnalyzer)
+    brand_analyzer.use_nltk_tokenizer = False
+    texts = [f"Sample number {i}. Another sentence here!" for i in range(analyzer.PARALLEL_TOKENIZE_THRESHOLD + 1)]
+
+    try:
+        first = brand_analyzer._tokenize_texts(texts)
+        pool = analyzer._pool
+        second = brand_analyzer._tokenize_texts(texts)
+
+        assert pool is not None
+        assert analyzer._pool is pool
+        assert first == second == [_tokenize_one(text) for text in texts]
+    finally:
+        analyzer._close_pool()
+
+
+class _FakeSentenceTokenizer:
+    def tokenize(self, text):
+        return ["Hello there.", "?!", "How are you?", "42."]
+
+
+def test_nltk_path_drops_sentences_without_words(monkeypatch):
+    monkeypatch.setattr(
+        analyzer, "_nltk_tokenizers", lambda: (_FakeSentenceTokenizer(), nltk.tokenize.NLTKWordTokenizer())
+    )
+
+    sentences = _tokenize_one("ignored", use_nltk=True)
+
+    assert sentences == [["Hello", "there", "."], ["How", "are", "you", "?"]]
+    assert len(sentences) == len(_tokenize_one("Hello there. ?! How are you? 42."))
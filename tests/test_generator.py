@@ -0,0 +1,63 @@
+import pytest
+
+pytest.importorskip("autogen")
+pytest.importorskip("openai")
+pytest.importorskip("PIL")
+nltk = pytest.importorskip("nltk")
+
+try:
+    nltk.data.find("corpora/stopwords")
+except LookupError:
+    pytest.skip("NLTK stopwords corpus is not installed", allow_module_level=True)
+
+from marketgenius.content.generator import ContentGenerationPipeline  # noqa: E402
+from marketgenius.utils.helpers import LRUCache  # noqa: E402
+
+
+class _FakeBrandModel:
+    def __init__(self):
+        self.model_version = 0
+        self.voices = {}
+        self.lookups = 0
+
+    def get_brand_voice_parameters(self, brand_name):
+        self.lookups += 1
+        return self.voices.get(brand_name)
+
+
+@pytest.fixture
+def pipeline():
+    # Bypass __init__: only the voice cache plumbing is under test
+    pipeline = ContentGenerationPipeline.__new__(ContentGenerationPipeline)
+    pipeline.brand_model = _FakeBrandModel()
+    pipeline._voice_cache = LRUCache(maxsize=4)
+    return pipeline
+
+
+def test_brand_voice_is_cached(pipeline):
+    pipeline.brand_model.voices["Acme"] = {"dominant_tone": "casual"}
+
+    assert pipeline._get_brand_voice("Acme") == {"dominant_tone": "casual"}
+    assert pipeline._get_brand_voice("Acme") == {"dominant_tone": "casual"}
+    assert pipeline.brand_model.lookups == 1
+
+
+def test_brand_voice_refreshes_after_model_update(pipeline):
+    brand_model = pipeline.brand_model
+    brand_model.voices["Acme"] = {"dominant_tone": "casual"}
+    pipeline._get_brand_voice("Acme")
+
+    brand_model.voices["Acme"] = {"dominant_tone": "formal"}
+    brand_model.model_version += 1
+
+    assert pipeline._get_brand_voice("Acme") == {"dominant_tone": "formal"}
+    assert brand_model.lookups == 2
+
+
+def test_missing_brand_voice_is_not_cached(pipeline):
+    brand_model = pipeline.brand_model
+    assert pipeline._get_brand_voice("Acme") is None
+
+    # A brand created later is found without a version bump
+    brand_model.voices["Acme"] = {"dominant_tone": "casual"}
+    assert pipeline._get_brand_voice("Acme") == {"dominant_tone": "casual"}
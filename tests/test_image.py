@@ -0,0 +1,49 @@
+import pytest
+
+pytest.importorskip("PIL")
+pytest.importorskip("numpy")
+pytest.importorskip("requests")
+pytest.importorskip("httpx")
+pytest.importorskip("tenacity")
+
+from marketgenius.content.image import ImageGenerator  # noqa: E402
+
+
+class _NamespaceCache:
+    """SemanticCache stand-in that treats all prompts in a namespace as similar."""
+
+    def __init__(self):
+        self.entries = {}
+
+    def get(self, prompt, namespace=None):
+        return self.entries.get(namespace)
+
+    def put(self, prompt, value, namespace=None):
+        self.entries[namespace] = value
+
+    def clear(self):
+        self.entries.clear()
+
+
+@pytest.fixture
+def generator():
+    generator = ImageGenerator({"default_size": "64x64", "seed": 0})
+    generator.semantic_cache = _NamespaceCache()
+    return generator
+
+
+def test_semantic_cache_stores_keys_not_images(generator):
+    image = generator.generate_image("a red bicycle")
+
+    assert list(generator.semantic_cache.entries.values()) == [
+        generator._cache_key("a red bicycle", "64x64", generator.default_model)
+    ]
+    assert generator.generate_image("a crimson bicycle") is image
+
+
+def test_semantic_hit_evicted_from_l1_is_a_miss(generator):
+    image = generator.generate_image("a red bicycle")
+    generator.cache.clear()
+    generator._cache_bytes = 0
+
+    assert generator.generate_image("a crimson bicycle") is not image
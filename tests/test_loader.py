@@ -0,0 +1,106 @@
+import csv
+import os
+import time
+
+import pytest
+
+from marketgenius.data.loader import DataLoader
+
+
+class _FakeResponse:
+    def __init__(self, text):
+        self.text = text
+        self.content = text.encode("utf-8")
+
+    def raise_for_status(self):
+        pass
+
+
+class _FakeSession:
+    def __init__(self, text="payload"):
+        self.text = text
+        self.calls = 0
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.calls += 1
+        return _FakeResponse(f"{self.text}-{self.calls}")
+
+
+def _loader(cache_dir, session):
+    loader = DataLoader(cache_dir=str(cache_dir))
+    loader._session = session
+    return loader
+
+
+@pytest.fixture
+def session():
+    return _FakeSession()
+
+
+def test_fresh_disk_cache_is_served_without_refetch(tmp_path, session):
+    assert _loader(tmp_path, session).fetch_url("http://example.com/a") == "payload-1"
+
+    # A new loader has an empty memory cache, so this hit comes from disk.
+    assert _loader(tmp_path, session).fetch_url("http://example.com/a") == "payload-1"
+    assert session.calls == 1
+
+
+def test_expired_disk_cache_is_refetched(tmp_path, session):
+    loader = _loader(tmp_path, session)
+    loader.fetch_url("http://example.com/a", cache_ttl=60)
+
+    cache_path = loader._cache_path("http://example.com/a_None")
+    stale = time.time() - 120
+    os.utime(cache_path, (stale, stale))
+
+    assert _loader(tmp_path, session).fetch_url("http://example.com/a", cache_ttl=60) == "payload-2"
+    assert session.calls == 2
+
+
+def test_expired_memory_cache_is_refetched(tmp_path, session):
+    loader = _loader(tmp_path, session)
+    loader.fetch_url("http://example.com/a", cache=True, cache_ttl=0)
+
+    assert loader.fetch_url("http://example.com/a", cache_ttl=0) == "payload-2"
+    assert session.calls == 2
+
+
+def test_read_cache_treats_missing_file_as_miss(tmp_path, session):
+    loader = _loader(tmp_path, session)
+    assert loader._read_cache(tmp_path / "missing.cache", 3600) is None
+
+
+def test_cache_path_is_stable_and_sharded(tmp_path, session):
+    first = _loader(tmp_path, session)._cache_path("http://example.com/a_None")
+    second = _loader(tmp_path, session)._cache_path("http://example.com/a_None")
+
+    assert first == second
+    assert first.parent.parent == tmp_path
+    assert len(first.parent.name) == 2
+    assert first.suffix == ".cache"
+    assert _loader(tmp_path, session)._cache_path("http://example.com/b_None") != first
+
+
+def test_brand_samples_skip_files_that_are_not_utf8(tmp_path, session):
+    sample_dir = tmp_path / "samples" / "acme"
+    sample_dir.mkdir(parents=True)
+    (sample_dir / "utf8.txt").write_text("品牌文本", encoding="utf-8")
+    (sample_dir / "big5.txt").write_bytes("品牌文本 big5 text".encode("big5"))
+
+    samples = _loader(tmp_path / "cache", session).load_brand_samples("acme", tmp_path / "samples")
+
+    assert samples == ["品牌文本"]
+
+
+def test_load_csv_matches_dict_reader_for_ragged_rows(tmp_path, session):
+    csv_path = tmp_path / "data.csv"
+    csv_path.write_text("a,b,c\n1,2\n\n1,2,3\n1,2,3,4,5\n", encoding="utf-8")
+
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        expected = list(csv.DictReader(f))
+
+    rows = _loader(tmp_path / "cache", session).load_csv(csv_path)
+
+    assert rows == expected
+    assert rows[0] == {"a": "1", "b": "2", "c": None}
+    assert rows[2] == {"a": "1", "b": "2", "c": "3", None: ["4", "5"]}
@@ -0,0 +1,64 @@
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("nltk")
+pytest.importorskip("sklearn")
+
+from marketgenius.brand import modeler  # noqa: E402
+
+
+class _CountingAnalyzer:
+    def __init__(self, **kwargs):
+        self.calls = []
+
+    def analyze_brand_voice(self, content_items):
+        self.calls.append(list(content_items))
+        return {"tone": {"casual": 1.0}, "average_sentence_length": 8}
+
+
+@pytest.fixture
+def model(monkeypatch, tmp_path):
+    monkeypatch.setattr(modeler, "BrandAnalyzer", _CountingAnalyzer)
+    return modeler.BrandLanguageModel({"models_dir": str(tmp_path)})
+
+
+def test_update_skips_already_analyzed_content(model):
+    model.create_brand_model("Acme", ["one", "two"])
+    version = model.model_version
+
+    model.update_brand_model("Acme", ["two"])
+    model.update_brand_model("Acme", ["one", "two"])
+
+    assert len(model.analyzer.calls) == 1
+    assert model.model_version == version
+
+
+def test_update_reanalyzes_new_content(model):
+    model.create_brand_model("Acme", ["one", "two"])
+    version = model.model_version
+
+    updated = model.update_brand_model("Acme", ["two", "three"])
+
+    assert len(model.analyzer.calls) == 2
+    assert "three" in model.analyzer.calls[-1]
+    assert "three" in updated["content_examples"]
+    assert model.model_version == version + 1
+
+    # The newly analyzed item is now recognized as well
+    model.update_brand_model("Acme", ["three"])
+    assert len(model.analyzer.calls) == 2
+
+
+def test_update_with_no_new_content_is_a_no_op(model):
+    model.create_brand_model("Acme", ["one"])
+    model.update_brand_model("Acme", [])
+    assert len(model.analyzer.calls) == 1
+
+
+def test_skip_survives_reload_from_disk(model, tmp_path):
+    model.create_brand_model("Acme", ["one", "two"])
+
+    reloaded = modeler.BrandLanguageModel({"models_dir": str(tmp_path)})
+    reloaded.update_brand_model("Acme", ["one"])
+
+    assert reloaded.analyzer.calls == []
@@ -0,0 +1,84 @@
+import datetime
+
+import pytest
+
+pydantic = pytest.importorskip("pydantic")
+
+from marketgenius.data.schemas import (  # noqa: E402
+    BrandColors,
+    BrandModel,
+    ContentItem,
+    ContentType,
+    ImageContent,
+    Platform,
+    TextContent,
+    VideoContent,
+)
+
+
+def _item(content_type, **kwargs):
+    return ContentItem(
+        id="c1",
+        brand_id="b1",
+        platform=Platform.INSTAGRAM,
+        content_type=content_type,
+        **kwargs,
+    )
+
+
+def test_content_item_accepts_matching_content():
+    item = _item(ContentType.TEXT, text_content=TextContent(text="hello"))
+    assert item.text_content.text == "hello"
+
+
+@pytest.mark.parametrize(
+    "content_type, field, value",
+    [
+        (ContentType.TEXT, "text_content", TextContent(text="hello")),
+        (ContentType.IMAGE, "image_content", ImageContent(prompt="a cat")),
+        (ContentType.VIDEO, "video_content", VideoContent(title="t", script="s")),
+    ],
+)
+def test_content_item_requires_content_for_its_type(content_type, field, value):
+    with pytest.raises(pydantic.ValidationError):
+        _item(content_type)
+    assert getattr(_item(content_type, **{field: value}), field) == value
+
+
+def test_content_item_without_content_for_other_types():
+    assert _item(ContentType.CAROUSEL).text_content is None
+
+
+def test_content_item_validator_runs_on_model_validate():
+    data = {
+        "id": "c1",
+        "brand_id": "b1",
+        "platform": "instagram",
+        "content_type": "text",
+    }
+    with pytest.raises(pydantic.ValidationError):
+        ContentItem.model_validate(data)
+
+
+@pytest.mark.parametrize("value", ["red", "#12345", "#GGGGGG", "123456"])
+def test_brand_colors_rejects_invalid_hex(value):
+    with pytest.raises(pydantic.ValidationError):
+        BrandColors(primary=value)
+
+
+def test_brand_colors_accepts_hex():
+    assert BrandColors(primary="#A1b2C3", secondary="#000000").primary == "#A1b2C3"
+
+
+def test_brand_model_keeps_explicit_updated_at():
+    stamp = datetime.datetime(2020, 1, 2, 3, 4, 5)
+    brand = BrandModel(id="b1", name="Brand", updated_at=stamp)
+    assert brand.updated_at == stamp
+
+    updated = brand.model_copy(update={"name": "Renamed"})
+    assert updated.updated_at == stamp
+
+
+def test_brand_model_defaults_updated_at():
+    brand = BrandModel(id="b1", name="Brand")
+    assert brand.updated_at >= brand.created_at
@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+DataStore 持久化測試。
+"""
+
+import pickle
+import datetime
+import importlib
+import dataclasses
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def store_module(tmp_path_factory):
+    """導入 store 模組；模組級的全局實例會在當前目錄建立 data/，因此先切換目錄。"""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.chdir(tmp_path_factory.mktemp("cwd"))
+        yield importlib.import_module("marketgenius.data.store")
+
+
+@pytest.fixture
+def store(store_module, tmp_path):
+    """指向臨時目錄的數據存儲。"""
+    return store_module.DataStore(str(tmp_path / "data"))
+
+
+class _OutOfBand:
+    """以 PickleBuffer 序列化的對象，協議 5 下會產生帶外緩衝區。"""
+
+    def __init__(self, payload):
+        self.payload = bytearray(payload)
+
+    def __reduce_ex__(self, protocol):
+        if protocol >= 5:
+            return _OutOfBand._rebuild, (pickle.PickleBuffer(self.payload),)
+        return _OutOfBand, (bytes(self.payload),)
+
+    @staticmethod
+    def _rebuild(buffer):
+        obj = _OutOfBand.__new__(_OutOfBand)
+        obj.payload = bytearray(buffer)
+        return obj
+
+
+def test_pickle_round_trip_with_out_of_band_buffers(store, store_module):
+    data = {"name": "brand", "blob": _OutOfBand(b"x" * 100_000)}
+
+    assert store.save_pickle(data, "models/blob.pkl")
+    raw = (store.data_dir / "models/blob.pkl").read_bytes()
+    assert raw.startswith(store_module._PICKLE_OOB_MAGIC)
+
+    loaded = store.load_pickle("models/blob.pkl")
+    assert loaded["name"] == "brand"
+    assert loaded["blob"].payload == data["blob"].payload
+
+
+def test_pickle_round_trip_numpy_array_stays_writable(store):
+    np = pytest.importorskip("numpy")
+    array = np.arange(50_000, dtype=np.float64)
+
+    assert store.save_pickle({"metrics": array}, "models/metrics.pkl")
+    loaded = store.load_pickle("models/metrics.pkl")["metrics"]
+
+    np.testing.assert_array_equal(loaded, array)
+    loaded[0] = -1.0
+
+
+def test_pickle_without_buffers_is_plain_pickle(store):
+    assert store.save_pickle({"a": [1, 2]}, "plain.pkl")
+    raw = (store.data_dir / "plain.pkl").read_bytes()
+    assert pickle.loads(raw) == {"a": [1, 2]}
+
+
+def test_load_legacy_pickle_file(store):
+    (store.data_dir / "legacy.pkl").write_bytes(pickle.dumps({"legacy": True}, protocol=2))
+    assert store.load_pickle("legacy.pkl") == {"legacy": True}
+
+
+@pytest.mark.parametrize("cut", [10, 20, -10])
+def test_load_truncated_out_of_band_pickle_returns_default(store, cut):
+    store.save_pickle(_OutOfBand(b"y" * 10_000), "blob.pkl")
+    path = store.data_dir / "blob.pkl"
+    path.write_bytes(path.read_bytes()[:cut])
+
+    assert store.load_pickle("blob.pkl", default="missing") == "missing"
+
+
+def test_load_missing_pickle_returns_default(store):
+    assert store.load_pickle("nope.pkl", default=0) == 0
+
+
+def test_batch_defers_writes_until_exit(store):
+    with store.batch():
+        assert store.save_text("hello", "content/a.txt")
+        assert not (store.data_dir / "content/a.txt").exists()
+
+    assert store.load_text("content/a.txt") == "hello"
+
+
+def test_batch_raises_for_files_that_could_not_be_written(store, store_module):
+    with pytest.raises(store_module.BatchWriteError) as excinfo:
+        with store.batch():
+            assert store.save_text("hi", "nonexistentdir/x.txt")
+            assert store.save_text("ok", "ok.txt")
+
+    assert [p.name for p in excinfo.value.failed_paths] == ["x.txt"]
+    assert store.load_text("ok.txt") == "ok"
+
+
+def test_batch_discards_pending_writes_when_block_raises(store):
+    with pytest.raises(RuntimeError):
+        with store.batch():
+            store.save_json({"a": 1}, "content/partial.json")
+            raise RuntimeError("boom")
+
+    assert not (store.data_dir / "content/partial.json").exists()
+    # 異常之後不應殘留批次狀態
+    assert store.save_text("after", "after.txt")
+    assert store.load_text("after.txt") == "after"
+
+
+def test_nested_batch_flushes_with_outer_batch(store):
+    with store.batch():
+        with store.batch():
+            store.save_text("inner", "inner.txt")
+        assert not (store.data_dir / "inner.txt").exists()
+
+    assert store.load_text("inner.txt") == "inner"
+
+
+@dataclasses.dataclass
+class _Point:
+    x: int
+    y: int
+
+
+_JSON_PAYLOAD = {
+    "created_at": datetime.datetime(2024, 5, 1, 12, 30, 0, 123),
+    "day": datetime.date(2024, 5, 1),
+    "point": _Point(1, 2),
+}
+_JSON_EXPECTED = {
+    "created_at": "2024-05-01T12:30:00.000123",
+    "day": "2024-05-01",
+    "point": {"x": 1, "y": 2},
+}
+
+
+@pytest.mark.parametrize("indent", [None, 2, 4])
+def test_save_json_serializes_datetimes_for_any_indent(store, indent):
+    assert store.save_json(_JSON_PAYLOAD, "analytics/report.json", indent=indent)
+    assert store.load_json("analytics/report.json") == _JSON_EXPECTED
+
+
+def test_save_json_without_orjson_matches_orjson_output(store_module, monkeypatch):
+    if store_module.orjson is None:
+        pytest.skip("orjson 未安裝")
+    with_orjson = store_module._dumps(_JSON_PAYLOAD, 2)
+
+    monkeypatch.setattr(store_module, "orjson", None)
+    assert store_module._dumps(_JSON_PAYLOAD, 2) == with_orjson
+
+
+def test_save_json_still_rejects_unknown_types(store):
+    assert store.save_json({"obj": object()}, "bad.json", indent=4) is False
@@ -0,0 +1,137 @@
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("openai")
+pytest.importorskip("tenacity")
+pytest.importorskip("httpx")
+pytest.importorskip("pydantic")
+pytest.importorskip("sklearn")
+nltk = pytest.importorskip("nltk")
+
+try:
+    nltk.data.find("corpora/stopwords")
+except LookupError:
+    pytest.skip("NLTK stopwords corpus is not installed", allow_module_level=True)
+
+from marketgenius.content import text as text_module  # noqa: E402
+from marketgenius.content.text import TextGenerator  # noqa: E402
+from marketgenius.data.schemas import BrandModel, ContentType, Platform  # noqa: E402
+
+
+class _NamespaceCache:
+    """SemanticCache stand-in that treats all prompts in a namespace as similar."""
+
+    def __init__(self):
+        self.entries = {}
+        self.threads = set()
+
+    def get(self, prompt, namespace=None):
+        self.threads.add(threading.get_ident())
+        return self.entries.get(namespace)
+
+    def put(self, prompt, value, namespace=None):
+        self.threads.add(threading.get_ident())
+        self.entries[namespace] = value
+
+
+class _Stream:
+    def __init__(self, parts):
+        self.parts = parts
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for part in self.parts:
+            delta = SimpleNamespace(content=part)
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+
+class _FakeClient:
+    def __init__(self):
+        self.calls = 0
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    async def _create(self, **kwargs):
+        self.calls += 1
+        return _Stream(["Hello ", f"world {self.calls}"])
+
+
+@pytest.fixture
+def generator():
+    generator = TextGenerator(api_key="test-key", semantic_cache=_NamespaceCache())
+    generator._client = _FakeClient()
+    return generator
+
+
+def _generate(generator, topic="launch", **kwargs):
+    brand = BrandModel(id="b1", name="Acme")
+    return asyncio.run(
+        generator.generate_text(topic, brand, Platform.INSTAGRAM, ContentType.TEXT, **kwargs)
+    )
+
+
+def test_cache_hit_reuses_result_and_streams_it(generator):
+    first = _generate(generator)
+    tokens = []
+    second = _generate(generator, on_token=tokens.append)
+
+    assert generator._client.calls == 1
+    assert second == first
+    assert tokens == [first["text"]]
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"target_length": 50},
+        {"include_hashtags": True},
+        {"include_emoji": True},
+        {"include_call_to_action": True},
+    ],
+)
+def test_generation_options_are_part_of_cache_namespace(generator, options):
+    _generate(generator)
+    result = _generate(generator, **options)
+
+    assert generator._client.calls == 2
+    assert result["text"] == "Hello world 2"
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{"topic": "product launch"}, {"additional_instructions": "Mention the sale"}],
+)
+def test_prompt_content_is_left_to_the_similarity_threshold(generator, options):
+    first = _generate(generator)
+    assert _generate(generator, **options) == first
+    assert generator._client.calls == 1
+
+
+def test_semantic_cache_runs_off_the_event_loop_thread(generator):
+    _generate(generator)
+    assert generator.semantic_cache.threads
+    assert threading.get_ident() not in generator.semantic_cache.threads
+
+
+class _StrictEncoding:
+    """Mimics tiktoken rejecting special tokens unless explicitly allowed."""
+
+    def encode(self, text, disallowed_special="all"):
+        if disallowed_special == "all" and "<|endoftext|>" in text:
+            raise ValueError("Encountered text corresponding to disallowed special token")
+        return text.split()
+
+    def decode(self, tokens):
+        return " ".join(tokens)
+
+
+def test_special_token_text_does_not_break_token_budget(generator, monkeypatch):
+    monkeypatch.setattr(text_module, "_get_encoding", lambda model: _StrictEncoding())
+
+    result = _generate(generator, reference_content="see <|endoftext|> here")
+
+    assert result["success"] is True
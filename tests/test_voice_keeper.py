@@ -0,0 +1,94 @@
+import pytest
+
+pytest.importorskip("numpy")
+pytest.importorskip("pydantic")
+pytest.importorskip("sklearn")
+nltk = pytest.importorskip("nltk")
+
+try:
+    nltk.data.find("corpora/stopwords")
+except LookupError:
+    pytest.skip("NLTK stopwords corpus is not installed", allow_module_level=True)
+
+from marketgenius.brand.voice_keeper import BrandStyleKeeper  # noqa: E402
+from marketgenius.data.schemas import (  # noqa: E402
+    BrandModel,
+    BrandStyleAttribute,
+    ContentType,
+)
+
+CASUAL_TEXT = (
+    "Acme is awesome, wow, so cool lol! Acme yeah super amazing stuff here "
+    "for everyone to see and enjoy a lot honestly."
+)
+
+
+class _RecordingLanguageModel:
+    def __init__(self):
+        self.calls = []
+
+    def score_text(self, content):
+        return 0.5
+
+    def enhance_text(self, content, **kwargs):
+        self.calls.append(content)
+        return f"Enhanced: {content}"
+
+
+@pytest.fixture
+def keeper():
+    brand = BrandModel(
+        id="b1",
+        name="Acme",
+        keywords=["acme"],
+        style_attributes=[
+            BrandStyleAttribute(name="formality", value=1.0),
+            BrandStyleAttribute(name="conciseness", value=1.0),
+        ],
+    )
+    return BrandStyleKeeper(brand, _RecordingLanguageModel())
+
+
+def test_keyword_covered_content_with_poor_style_is_enhanced(keeper):
+    result = keeper.check_consistency(CASUAL_TEXT, ContentType.TEXT)
+    assert result["details"]["keywords"]["missing_keywords"] == []
+    assert result["consistency_score"] <= 0.85
+
+    assert keeper.enhance_consistency(CASUAL_TEXT, ContentType.TEXT) == f"Enhanced: {CASUAL_TEXT}"
+    assert keeper.language_model.calls == [CASUAL_TEXT]
+
+
+def test_enhancement_does_not_depend_on_the_consistency_cache(keeper):
+    first = keeper.enhance_consistency(CASUAL_TEXT, ContentType.TEXT)
+    second = keeper.enhance_consistency(CASUAL_TEXT, ContentType.TEXT)
+    assert first == second
+    assert len(keeper.language_model.calls) == 2
+
+
+def test_consistent_content_is_not_enhanced(keeper, monkeypatch):
+    monkeypatch.setattr(
+        keeper, "check_consistency", lambda content, content_type: {"consistency_score": 0.9}
+    )
+    assert keeper.enhance_consistency(CASUAL_TEXT, ContentType.TEXT) == CASUAL_TEXT
+    assert keeper.language_model.calls == []
+
+
+@pytest.mark.parametrize("content", ["", "   \n"])
+def test_blank_content_is_returned_unchanged(keeper, content):
+    assert keeper.enhance_consistency(content, ContentType.TEXT) == content
+    assert keeper.language_model.calls == []
+
+
+def test_check_consistency_results_do_not_alias_the_cache(keeper):
+    first = keeper.check_consistency(CASUAL_TEXT, ContentType.TEXT)
+    first["consistency_score"] = 1.0
+    first["suggestions"].append("caller note")
+
+    second = keeper.check_consistency(CASUAL_TEXT, ContentType.TEXT)
+    second["suggestions"].clear()
+
+    third = keeper.check_consistency(CASUAL_TEXT, ContentType.TEXT)
+    assert third is not second
+    assert third["consistency_score"] <= 0.85
+    assert "caller note" not in third["suggestions"]
+    assert third["suggestions"]